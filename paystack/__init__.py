@@ -3,7 +3,8 @@ Paystack Client - A Python wrapper for the Paystack API
 """
 
 from .client import PaystackClient
-from .core import BaseClient
+from .core import BaseClient, PaystackResponse, close_sessions
+from .async_core import AsyncBaseClient
 from .exceptions import (
     PaystackError,
     APIError,
@@ -26,6 +27,9 @@ __description__ = "A modern Python client for Paystack API"
 __all__ = [
     "PaystackClient",
     "BaseClient",
+    "AsyncBaseClient",
+    "PaystackResponse",
+    "close_sessions",
     "PaystackError",
     "APIError",
     "AuthenticationError",
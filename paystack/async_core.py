@@ -0,0 +1,347 @@
+"""
+Asynchronous counterpart of :class:`paystack.core.BaseClient`, built on aiohttp.
+
+aiohttp is an optional dependency; install it with
+``pip install "paystack-api-wrapper[async]"``.
+"""
+
+import asyncio
+import contextlib
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Hashable,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from .core import (
+    _RETRY_METHODS,
+    _RETRY_STATUSES,
+    _UNPROCESSED_STATUSES,
+    BaseClient,
+    PaystackResponse,
+    _as_records,
+    _check_secret_key,
+    _retry_delay,
+)
+from .exceptions import InvalidResponseError, NetworkError, PaystackError
+from .utils.cache import TTLCache
+from .utils.helpers import json_dumps
+from .utils.streaming import ItemCollector, require_ijson
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - depends on the installed extras
+    aiohttp = None
+
+# Empty when aiohttp is absent (httpx backend): ``except ()`` matches nothing.
+_CONNECTION_ERRORS = (aiohttp.ClientConnectionError,) if aiohttp else ()
+_CLIENT_ERRORS = (aiohttp.ClientError,) if aiohttp else ()
+
+
+class _BufferedResponse:
+    """A fully read aiohttp response exposing the parts of the ``requests``
+    response interface that :meth:`BaseClient._handle_response` relies on."""
+
+    __slots__ = ("status_code", "headers", "content")
+
+    def __init__(self, status_code: int, headers, content: bytes):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+
+def _query(params: Optional[Dict]) -> Optional[Dict]:
+    """aiohttp refuses booleans in query strings; send what Paystack expects."""
+    if not params:
+        return params
+    return {
+        k: (str(v).lower() if isinstance(v, bool) else v) for k, v in params.items()
+    }
+
+
+class AsyncBaseClient(BaseClient):
+    """Base client for awaiting Paystack API calls concurrently.
+
+    Endpoint classes are made asynchronous by mixing this class in front of
+    their blocking counterpart, e.g.
+    ``class AsyncCustomersAPI(AsyncBaseClient, CustomersAPI)``. Every endpoint
+    method ends in ``return self.request(...)``, so with this base it returns
+    an awaitable instead of the response tuple, while argument validation
+    still runs (and raises) at call time.
+
+    The underlying ``aiohttp.ClientSession`` is created on first use and is
+    shared by every call made through the instance. Use the client as an
+    async context manager, or call :meth:`close`, to release it.
+
+    Like the blocking client, GET/PUT/DELETE calls are retried on 429 and 5xx
+    responses with backoff, honouring ``Retry-After``; POSTs only on 429, which
+    Paystack returns before acting on the request.
+
+    Pass ``http_backend="httpx"`` (needs the ``http2`` extra) to send requests
+    over HTTP/2 with httpx instead of aiohttp: concurrent calls then share one
+    multiplexed connection rather than holding a socket each, at some cost in
+    raw throughput compared with aiohttp over HTTP/1.1.
+    """
+
+    __slots__ = (
+        "http_backend",
+        "connection_limit",
+        "limit_per_host",
+        "max_retries",
+        "_owns_session",
+        "_headers",
+        "_public_headers",
+    )
+
+    def __init__(
+        self,
+        secret_key: str,
+        base_url: str = "https://api.paystack.co/",
+        session: "aiohttp.ClientSession" = None,
+        timeout: int = 10,
+        connection_limit: int = 100,
+        limit_per_host: int = 64,
+        max_retries: int = 3,
+        http_backend: str = "aiohttp",
+    ):
+        if http_backend not in ("aiohttp", "httpx"):
+            raise ValueError(
+                f"Unknown HTTP backend {http_backend!r}; expected 'aiohttp' or 'httpx'"
+            )
+        if http_backend == "aiohttp" and aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for async clients. "
+                'Install it with: pip install "paystack-api-wrapper[async]"'
+            )
+        self.secret_key = _check_secret_key(secret_key)
+        self.http_backend = http_backend
+        self.base_url = base_url
+        self.timeout = timeout
+        self.connection_limit = connection_limit
+        self.limit_per_host = limit_per_host
+        self.max_retries = max_retries
+        self.session = session
+        self._owns_session = session is None
+        self._cache = TTLCache()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._headers = {
+            "Authorization": f"Bearer {self.secret_key}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "User-Agent": "paystack-client/1.0.0",
+        }
+        self._public_headers = {
+            k: v for k, v in self._headers.items() if k != "Authorization"
+        }
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared session, creating it inside the running loop."""
+        if self.session is None or self.session.closed:
+            if self.http_backend == "httpx":
+                from .httpx_core import AsyncHttpxSession
+
+                self.session = AsyncHttpxSession(
+                    timeout=self.timeout, max_connections=self.connection_limit
+                )
+            else:
+                self.session = aiohttp.ClientSession(
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                    connector=aiohttp.TCPConnector(
+                        limit=self.connection_limit,
+                        limit_per_host=self.limit_per_host,
+                        keepalive_timeout=75,
+                        ttl_dns_cache=300,
+                    ),
+                )
+            self._owns_session = True
+        return self.session
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        private: bool = True,
+        idempotency_key: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        schema: Optional[Tuple[str, ...]] = None,
+    ) -> PaystackResponse:
+        """Send an HTTP request to Paystack API without blocking the event loop.
+
+        Takes the same arguments and raises the same exceptions as
+        :meth:`BaseClient.request`.
+        """
+        method = method.upper()
+        cache_key = None
+        if method == "GET":
+            if cache_ttl:
+                cache_key = self._cache_key(endpoint, params, private)
+                cached = None if cache_key is None else self._cache.get(cache_key)
+                if cached is not None:
+                    return cached if schema is None else _as_records(cached, schema)
+        elif self._cache:
+            self.invalidate(endpoint)
+
+        url = self._build_url(endpoint)
+        headers = self._headers if private else self._public_headers
+        if idempotency_key:
+            headers = {**headers, "Idempotency-Key": idempotency_key}
+
+        data = None if json_data is None else json_dumps(json_data)
+        retry_statuses = (
+            _RETRY_STATUSES if method in _RETRY_METHODS else _UNPROCESSED_STATUSES
+        )
+        attempt = 0
+        while True:
+            with self._network_errors():
+                async with self._get_session().request(
+                    method, url, headers=headers, data=data, params=_query(params)
+                ) as response:
+                    content = await response.read()
+            if attempt >= self.max_retries or response.status not in retry_statuses:
+                break
+            attempt += 1
+            await asyncio.sleep(_retry_delay(attempt, response.headers))
+
+        result = self._handle_response(
+            _BufferedResponse(response.status, response.headers, content)
+        )
+        if cache_key is not None:
+            self._cache.set(cache_key, result, cache_ttl)
+        return result if schema is None else _as_records(result, schema)
+
+    async def request_stream(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        item_path: str = "data.item",
+        private: bool = True,
+    ) -> AsyncIterator[Any]:
+        """Stream the items of a large GET response as they arrive.
+
+        Async counterpart of :meth:`BaseClient.request_stream`; iterate it
+        with ``async for``.
+        """
+        ijson = require_ijson()
+        with self._network_errors():
+            async with self._get_session().get(
+                self._build_url(endpoint),
+                headers=self._headers if private else self._public_headers,
+                params=_query(params),
+            ) as response:
+                if response.status not in (200, 201):
+                    content = await response.read()
+                    self._handle_response(
+                        _BufferedResponse(response.status, response.headers, content)
+                    )
+                collector = ItemCollector(item_path)
+                try:
+                    async for prefix, event, value in ijson.parse_async(
+                        response.content
+                    ):
+                        for item in collector.feed(prefix, event, value):
+                            yield item
+                except ijson.JSONError as e:
+                    raise InvalidResponseError(
+                        f"Invalid JSON response: {e}", status_code=response.status
+                    ) from e
+        self._check_stream_status(collector, response.status)
+
+    @contextlib.contextmanager
+    def _network_errors(self):
+        """Translate transport failures into NetworkError."""
+        try:
+            yield
+        except PaystackError:
+            raise
+        except asyncio.TimeoutError:
+            raise NetworkError(f"Request timed out after {self.timeout} seconds")
+        except _CONNECTION_ERRORS as e:
+            raise NetworkError(f"Connection error: {e}")
+        except _CLIENT_ERRORS as e:
+            raise NetworkError(f"Request failed: {e}")
+
+    async def _fan_out(
+        self,
+        calls: Mapping[Hashable, Callable[[], Any]],
+        max_workers: int = 16,
+        return_exceptions: bool = False,
+    ) -> Dict[Hashable, Any]:
+        """Await independent calls concurrently, at most ``max_workers`` at a time.
+
+        Same contract as :meth:`BaseClient._fan_out`; each call returns an awaitable.
+        """
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def run(call):
+            async with semaphore:
+                return await call()
+
+        results = await asyncio.gather(
+            *(run(call) for call in calls.values()),
+            return_exceptions=return_exceptions,
+        )
+        return dict(zip(calls, results))
+
+    async def _single_flight(self, key: Hashable, call: Callable[[], Any]) -> Any:
+        """Share one in-flight call between concurrent awaiters using the same key.
+
+        Same contract as :meth:`BaseClient._single_flight`; ``call`` returns an
+        awaitable. A waiter being cancelled does not cancel the shared call.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _paginate(
+        self,
+        fetch: Callable[[Any], Any],
+        advance: Callable[[Any, Dict[str, Any]], Any],
+        start: Any = None,
+    ) -> AsyncIterator[Any]:
+        """Yield the rows of every page, fetching the next page in a background task.
+
+        Same contract as :meth:`BaseClient._paginate`; ``fetch`` returns an
+        awaitable. Iterate it with ``async for``.
+        """
+        token = start
+        data, meta = await fetch(token)
+        while True:
+            token = advance(token, meta) if data else None
+            pending = None if token is None else asyncio.create_task(fetch(token))
+            try:
+                for row in data:
+                    yield row
+            except BaseException:
+                if pending is not None:
+                    pending.cancel()
+                raise
+            if pending is None:
+                return
+            data, meta = await pending
+
+    async def close(self) -> None:
+        """Close the underlying session if this client created it."""
+        if self.session is not None and self._owns_session:
+            await self.session.close()
+        self.session = None
+
+    def __enter__(self):
+        raise TypeError(
+            f"{type(self).__name__} is asynchronous; use 'async with' instead of 'with'"
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -1,3 +1,7 @@
+from typing import Optional, Union
+
+from urllib3.util.retry import Retry
+
 from .core import BaseClient
 from .endpoints import *
 
@@ -14,89 +18,73 @@ class PaystackClient(BaseClient):
         )
     """
 
-    def __init__(self, secret_key: str, base_url: str = "https://api.paystack.co/"):
+    def __init__(
+        self,
+        secret_key: str,
+        base_url: str = "https://api.paystack.co/",
+        timeout: int = 10,
+        pool_size: int = 20,
+        max_retries: Union[int, Retry, None] = None,
+        http_backend: Optional[str] = None,
+    ):
         """
         Initialize the Paystack client.
 
         Args:
             secret_key (str): Your Paystack secret key
             base_url (str): API base URL (defaults to production)
+            timeout (int): Request timeout in seconds
+            pool_size (int): Connections kept alive per host
+            max_retries (Union[int, Retry, None]): Retry count or urllib3 ``Retry``
+                policy
+            http_backend (Optional[str]): ``"requests"`` (HTTP/1.1) or ``"httpx"``
+                (HTTP/2, needs the ``http2`` extra). Defaults to the
+                ``PAYSTACK_HTTP_BACKEND`` environment variable, then ``"requests"``.
         """
-        super().__init__(secret_key, base_url=base_url)
-
-        self.transactions = TransactionsAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.customers = CustomersAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.charge = ChargeAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.plans = PlansAPI(secret_key, session=self.session, base_url=self.base_url)
-        self.products = ProductsAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.refunds = RefundsAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.settlements = SettlementsAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.subaccounts = SubaccountsAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.subscriptions = SubscriptionsAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.transfers = TransfersAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.transfers_control = TransfersControlAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.transfer_recipients = TransferRecipientsAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.verification = VerificationAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.disputes = DisputesAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.payment_pages = PaymentPagesAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.payment_requests = PaymentRequestsAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.bulk_charges = BulkChargesAPI(
-            secret_key, session=self.session, base_url=self.base_url
+        super().__init__(
+            secret_key,
+            base_url=base_url,
+            timeout=timeout,
+            pool_size=pool_size,
+            max_retries=max_retries,
+            http_backend=http_backend,
         )
+
+        # Every endpoint API reuses this client's session, so all of them
+        # share one connection pool (and, on httpx, one HTTP/2 connection).
+        shared = dict(session=self.session, base_url=self.base_url)
+
+        self.transactions = TransactionsAPI(secret_key, **shared)
+        self.customers = CustomersAPI(secret_key, **shared)
+        self.charge = ChargeAPI(secret_key, **shared)
+        self.plans = PlansAPI(secret_key, **shared)
+        self.products = ProductsAPI(secret_key, **shared)
+        self.refunds = RefundsAPI(secret_key, **shared)
+        self.settlements = SettlementsAPI(secret_key, **shared)
+        self.subaccounts = SubaccountsAPI(secret_key, **shared)
+        self.subscriptions = SubscriptionsAPI(secret_key, **shared)
+        self.transfers = TransfersAPI(secret_key, **shared)
+        self.transfers_control = TransfersControlAPI(secret_key, **shared)
+        self.transfer_recipients = TransferRecipientsAPI(secret_key, **shared)
+        self.verification = VerificationAPI(secret_key, **shared)
+        self.disputes = DisputesAPI(secret_key, **shared)
+        self.payment_pages = PaymentPagesAPI(secret_key, **shared)
+        self.payment_requests = PaymentRequestsAPI(secret_key, **shared)
+        self.bulk_charges = BulkChargesAPI(secret_key, **shared)
         self.dedicated_virtual_accounts = DedicatedVirtualAccountsAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.direct_debit = DirectDebitAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.apple_pay = ApplePayAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.terminal = TerminalAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.virtual_terminal = VirtualTerminalAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.transaction_splits = TransactionSplitsAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.integration = IntegrationAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
-        self.miscellaneous = MiscellaneousAPI(
-            secret_key, session=self.session, base_url=self.base_url
-        )
+            secret_key, **shared
+        )
+        self.direct_debit = DirectDebitAPI(secret_key, **shared)
+        self.apple_pay = ApplePayAPI(secret_key, **shared)
+        self.terminal = TerminalAPI(secret_key, **shared)
+        self.virtual_terminal = VirtualTerminalAPI(secret_key, **shared)
+        self.transaction_splits = TransactionSplitsAPI(secret_key, **shared)
+        self.integration = IntegrationAPI(secret_key, **shared)
+        self.miscellaneous = MiscellaneousAPI(secret_key, **shared)
+
+        # Not every endpoint constructor takes a timeout, so apply it afterwards.
+        for api in vars(self).values():
+            api.timeout = timeout
 
     def __repr__(self):
         return f"PaystackClient(base_url='{self.base_url}')"
@@ -1,9 +1,31 @@
+import functools
+import inspect
 import os
-import re
+import random
+import threading
+import weakref
 import requests
-from typing import Optional, Dict, Any, Tuple, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    Callable,
+    Hashable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Tuple,
+    Union,
+)
+from requests.adapters import HTTPAdapter
 from requests.exceptions import JSONDecodeError
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
+from .utils.cache import TTLCache
+from .utils.helpers import json_dumps, json_loads, validate_email
+from .utils.streaming import ItemCollector, require_ijson
 from .exceptions import (
     APIError,
     ValidationError,
@@ -14,6 +36,288 @@ from .exceptions import (
     create_error_from_response,
 )
 
+# Only advertise the codings urllib3 can decode here: "br" is included
+# when brotli (the ``speedups`` extra) is installed.
+_ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+# Minimum charge per currency, in the smallest unit. Other currencies use 100.
+_MIN_AMOUNTS = {
+    "NGN": 100,  # ₦1.00 in kobo
+    "USD": 50,  # $0.50 in cents
+    "GHS": 100,  # GH₵1.00 in pesewas
+}
+
+
+class PaystackResponse(NamedTuple):
+    """The ``data`` and ``meta`` of a successful Paystack response.
+
+    A named tuple, so existing ``data, meta = client.request(...)`` unpacking
+    keeps working while instances stay as small as a plain tuple.
+    """
+
+    data: Any
+    meta: Dict[str, Any]
+
+
+def _as_records(result: PaystackResponse, schema: Tuple[str, ...]) -> PaystackResponse:
+    """Project list rows onto ``schema``, one tuple per row.
+
+    Missing fields become ``None``; non-list data is returned unchanged.
+    """
+    data = result.data
+    if not isinstance(data, list):
+        return result
+    return PaystackResponse(
+        [tuple(row.get(field) for field in schema) for row in data], result.meta
+    )
+
+
+def _next_page(page: int, meta: Dict[str, Any]) -> Optional[int]:
+    """Page number following ``page``, or ``None`` once ``pageCount`` is reached."""
+    return page + 1 if page < int(meta.get("pageCount") or 0) else None
+
+
+def _next_cursor(cursor: Optional[str], meta: Dict[str, Any]) -> Optional[str]:
+    """Cursor of the following page, or ``None`` on the last page."""
+    return meta.get("next") or None
+
+
+def _is_blank(value: Any) -> bool:
+    """Whether a required parameter counts as missing."""
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _missing_params_error(missing_params) -> ValidationError:
+    """The ValidationError raised for blank required parameters."""
+    return ValidationError(
+        message=f"Missing required parameters: {', '.join(missing_params)}",
+        field_errors={param: "This field is required" for param in missing_params},
+    )
+
+
+def require(*names: str) -> Callable:
+    """Decorate an endpoint method so the named parameters must not be blank.
+
+    Argument positions and defaults are resolved from the signature once, when
+    the method is defined, so each call only indexes into its arguments.
+    Raises the same ValidationError as ``BaseClient._validate_required_params``.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        parameters = inspect.signature(method).parameters
+        positions = list(parameters)
+        checks = tuple(
+            (name, positions.index(name), parameters[name].default) for name in names
+        )
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            n_args = len(args)
+            for name, position, default in checks:
+                value = (
+                    args[position] if position < n_args else kwargs.get(name, default)
+                )
+                if _is_blank(value):
+                    break
+            else:
+                return method(*args, **kwargs)
+            raise _missing_params_error(
+                [
+                    name
+                    for name, position, default in checks
+                    if _is_blank(
+                        args[position]
+                        if position < n_args
+                        else kwargs.get(name, default)
+                    )
+                ]
+            )
+
+        return wrapper
+
+    return decorator
+
+
+@functools.lru_cache(maxsize=512)
+def _join_url(base_url: str, endpoint: str) -> str:
+    """Join base URL and endpoint; memoized since hot loops hit the same paths."""
+    endpoint = endpoint.lstrip("/")  # Remove leading slash if present
+    return f"{base_url}/{endpoint}"
+
+
+def _check_secret_key(secret_key: str) -> str:
+    """Reject keys that are obviously not Paystack secret keys."""
+    if not secret_key.startswith(("sk_test", "sk_live")):
+        raise AuthenticationError(
+            "Invalid Paystack secret key format. Key should start with 'sk_test_' or 'sk_live_'"
+        )
+    return secret_key
+
+
+# Shared by the urllib3 policy below and the async client's retry loop.
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_RETRY_METHODS = frozenset(["GET", "PUT", "DELETE"])
+# Paystack rejects a rate-limited request before acting on it, so a 429 is
+# safe to replay for any method, POSTs that create charges included.
+_UNPROCESSED_STATUSES = (429,)
+
+
+class _CappedRetry(Retry):
+    """Retry policy that waits at most ``MAX_RETRY_AFTER`` seconds between attempts.
+
+    A long ``Retry-After`` on a 429 would otherwise block the calling thread
+    for as long as Paystack asks; past the cap the final response surfaces as
+    a RateLimitError carrying the full ``retry_after`` instead.
+    """
+
+    MAX_RETRY_AFTER = 5.0
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.MAX_RETRY_AFTER)
+
+    def is_retry(self, method, status_code, has_retry_after=False) -> bool:
+        if status_code in _UNPROCESSED_STATUSES and status_code in (
+            self.status_forcelist or ()
+        ):
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _retry_delay(attempt: int, headers) -> float:
+    """Seconds to wait before retry number ``attempt`` (starting at 1).
+
+    Mirrors the urllib3 policy of requests sessions: a numeric ``Retry-After``
+    is honoured up to the same cap, otherwise jittered exponential backoff.
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), _CappedRetry.MAX_RETRY_AFTER)
+        except ValueError:
+            pass
+    return 0.5 * 2 ** (attempt - 1) + random.uniform(0, 0.25)
+
+
+def _build_retry(max_retries: Union[int, Retry, None]) -> Retry:
+    """Build the retry policy mounted on sessions created by the client.
+
+    Idempotent methods are retried on 429 and 5xx responses with jittered
+    exponential backoff, honouring ``Retry-After``. POSTs that create charges
+    or transfers are only retried when the request never reached Paystack:
+    the connection could not be established, or it was rate limited (429).
+    Retries replay the already-encoded body, so payloads are not rebuilt.
+    """
+    if isinstance(max_retries, Retry):
+        return max_retries
+    return _CappedRetry(
+        total=5 if max_retries is None else max_retries,
+        connect=3,
+        read=3,
+        status=3,
+        backoff_factor=0.5,
+        backoff_jitter=0.25,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=_RETRY_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+# Sessions shared by every client built with the same key and settings, so
+# short-lived clients (e.g. one per web request) reuse warm TCP/TLS connections.
+# Keyed rather than a single process-wide session: the Authorization header
+# lives on the session, so clients for different keys must not share one.
+_SESSION_CACHE: Dict[Tuple[Any, ...], requests.Session] = {}
+_SESSION_LOCK = threading.Lock()
+
+
+def _shared_session(
+    secret_key: str,
+    base_url: Optional[str],
+    pool_size: int,
+    max_retries: Union[int, Retry, None],
+    http_backend: str = "requests",
+) -> requests.Session:
+    """Return the cached session for these settings, creating it on first use."""
+    key = (secret_key, base_url, pool_size, max_retries, http_backend)
+    session = _SESSION_CACHE.get(key)
+    if session is None:
+        with _SESSION_LOCK:
+            session = _SESSION_CACHE.get(key)
+            if session is None:
+                session = _build_session(pool_size, max_retries, http_backend)
+                _SESSION_CACHE[key] = session
+    return session
+
+
+def close_sessions() -> None:
+    """Close every shared session and drop it from the cache.
+
+    Shared sessions outlive the clients that use them, so closing a client
+    leaves its pool open for the others. Call this at process shutdown, or
+    in tests, to release all pooled connections; clients created afterwards
+    start fresh sessions.
+    """
+    with _SESSION_LOCK:
+        sessions = list(_SESSION_CACHE.values())
+        _SESSION_CACHE.clear()
+    for session in sessions:
+        session.close()
+
+
+# One response cache per session: clients that share connections (the
+# sub-APIs of a PaystackClient, or clients built with the same key) also
+# share cached GETs and see each other's invalidations.
+_RESPONSE_CACHES: "weakref.WeakKeyDictionary[Any, TTLCache]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _cache_for(session) -> TTLCache:
+    """Return the response cache bound to ``session``."""
+    with _SESSION_LOCK:
+        cache = _RESPONSE_CACHES.get(session)
+        if cache is None:
+            cache = _RESPONSE_CACHES[session] = TTLCache()
+    return cache
+
+
+def _build_session(
+    pool_size: int,
+    max_retries: Union[int, Retry, None],
+    http_backend: str = "requests",
+):
+    """Create a session whose connection pool is sized for concurrent use."""
+    if http_backend == "httpx":
+        from .httpx_core import HttpxSession
+
+        if isinstance(max_retries, Retry):
+            retries = max_retries.connect or max_retries.total or 0
+            status_retries = max_retries.status or max_retries.total or 0
+        else:
+            retries = status_retries = 3 if max_retries is None else max_retries
+        return HttpxSession(
+            pool_size=pool_size, retries=retries, status_retries=status_retries
+        )
+    if http_backend != "requests":
+        raise ValueError(
+            f"Unknown HTTP backend {http_backend!r}; expected 'requests' or 'httpx'"
+        )
+    session = requests.Session()
+    # pool_connections counts per-host pools, not sockets; every session talks
+    # to a single API host, so one pool of pool_size connections is enough.
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_size,
+        max_retries=_build_retry(max_retries),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 class BaseClient:
     """Base client for interacting with the Paystack API.
@@ -22,25 +326,66 @@ class BaseClient:
     and error handling for all Paystack API endpoints.
     """
 
+    # Endpoint classes declare empty __slots__, so clients carry no
+    # per-instance __dict__. PaystackClient keeps one for its sub-APIs.
+    __slots__ = (
+        "secret_key",
+        "base_url",
+        "timeout",
+        "session",
+        "_cache",
+        "_inflight",
+        "_inflight_lock",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         secret_key: str,
         base_url: str = "https://api.paystack.co/",
         session: requests.Session = None,
         timeout: int = 10,
+        pool_size: int = 20,
+        max_retries: Union[int, Retry, None] = None,
+        http_backend: Optional[str] = None,
     ):
-        self.secret_key = secret_key
-        if not self.secret_key.startswith(("sk_test", "sk_live")):
-            raise AuthenticationError(
-                "Invalid Paystack secret key format. Key should start with 'sk_test_' or 'sk_live_'"
-            )
+        """
+        Args:
+            secret_key (str): Your Paystack secret key.
+            base_url (str): Base URL of the Paystack API.
+            session (requests.Session): A pre-configured session to use as-is.
+                By default a session is shared between all clients created
+                with the same key, base URL and pool settings.
+            timeout (int): Request timeout in seconds.
+            pool_size (int): Connections kept alive per host when the client
+                creates its own session.
+            max_retries (Union[int, Retry, None]): Retry count or a urllib3
+                ``Retry`` policy for idempotent requests; ``0`` disables retries.
+            http_backend (Optional[str]): ``"requests"`` (HTTP/1.1) or ``"httpx"``
+                (HTTP/2, needs the ``http2`` extra) for the session the client
+                creates. Defaults to the ``PAYSTACK_HTTP_BACKEND`` environment
+                variable, then ``"requests"``.
+        """
+        self.secret_key = _check_secret_key(secret_key)
         self.base_url = base_url
         self.timeout = timeout
-        self.session = session or requests.Session()
+        self.session = session or _shared_session(
+            self.secret_key,
+            base_url,
+            pool_size,
+            max_retries,
+            http_backend or os.environ.get("PAYSTACK_HTTP_BACKEND", "requests"),
+        )
+        self._cache = _cache_for(self.session)
+        self._inflight: Dict[Hashable, Future] = {}
+        self._inflight_lock = threading.Lock()
         self.session.headers.update(
             {
                 "Authorization": f"Bearer {self.secret_key}",
                 "Content-Type": "application/json",
+                "Accept": "application/json",
+                "Accept-Encoding": _ACCEPT_ENCODING,
+                "Connection": "keep-alive",
                 "User-Agent": "paystack-client/1.0.0",
             }
         )
@@ -53,7 +398,9 @@ class BaseClient:
         params: Optional[Dict] = None,
         private: bool = True,
         idempotency_key: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        cache_ttl: Optional[float] = None,
+        schema: Optional[Tuple[str, ...]] = None,
+    ) -> "PaystackResponse":
         """Send an HTTP request to Paystack API with proper headers and error handling.
 
         Args:
@@ -63,65 +410,61 @@ class BaseClient:
             params (Optional[Dict]): Query parameters for the request.
             private (bool): Whether to send Authorization header.
             idempotency_key (Optional[str]): Idempotency key for POST requests.
+            cache_ttl (Optional[float]): For GET requests, serve a response cached
+                within the last ``cache_ttl`` seconds instead of calling the API.
+                Cached data is shared between callers and must not be mutated.
+            schema (Optional[Tuple[str, ...]]): When the response data is a list
+                of objects, return each one as a tuple of these fields, in order,
+                instead of a dict. Much lighter to keep around for large pages.
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: The response data and metadata; unpacks like a
+            ``(data, meta)`` tuple.
 
         Raises:
             PaystackError: Various subclasses depending on the error type.
         """
-        url = self._build_url(endpoint)
-        headers = self.session.headers.copy()
+        method = method.upper()
+        cache_key = None
+        if method == "GET":
+            if cache_ttl:
+                cache_key = self._cache_key(endpoint, params, private)
+                cached = None if cache_key is None else self._cache.get(cache_key)
+                if cached is not None:
+                    return cached if schema is None else _as_records(cached, schema)
+        elif self._cache:
+            self.invalidate(endpoint)
 
-        if not private and "Authorization" in headers:
-            headers.pop("Authorization")
+        url = self._build_url(endpoint)
+        # Session headers are merged in by requests; only per-call overrides are
+        # passed, and a None value removes the header from this request.
+        headers = None
+        if idempotency_key or not private:
+            headers = {}
+            if idempotency_key:
+                headers["Idempotency-Key"] = idempotency_key
+            if not private:
+                headers["Authorization"] = None
+
+        response = self._send(
+            method,
+            url,
+            headers=headers,
+            data=None if json_data is None else json_dumps(json_data),
+            params=params,
+        )
+        result = self._handle_response(response)
 
-        if idempotency_key:
-            headers["Idempotency-Key"] = idempotency_key
+        if cache_key is not None:
+            self._cache.set(cache_key, result, cache_ttl)
+        return result if schema is None else _as_records(result, schema)
 
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Issue the HTTP call, translating transport failures into NetworkError."""
         try:
-            response = self.session.request(
-                method=method.upper(),
-                url=url,
-                headers=headers,
-                json=json_data,
-                params=params,
-                timeout=self.timeout,
+            return self.session.request(
+                method=method, url=url, timeout=self.timeout, **kwargs
             )
-
-            request_id = response.headers.get(
-                "x-amzn-requestid"
-            ) or response.headers.get("cf-ray")
-
-            try:
-                resp_json = response.json()
-            except (ValueError, JSONDecodeError) as e:
-                raise InvalidResponseError(
-                    f"Invalid JSON response: {e}",
-                    status_code=response.status_code,
-                    request_id=request_id,
-                ) from e
-
-            # Handle HTTP status codes
-            if response.status_code in [200, 201]:
-                return self._handle_success_response(
-                    resp_json, response.status_code, request_id
-                )
-            else:
-                # Use the factory function to create appropriate exception
-                # For RateLimitError, pass the original response object to access headers
-                if response.status_code == 429:
-                    raise create_error_from_response(
-                        response=response,  # Pass the original response object
-                        status_code=response.status_code,
-                        request_id=request_id,
-                    )
-                else:
-                    raise create_error_from_response(
-                        response=resp_json,
-                        status_code=response.status_code,
-                        request_id=request_id,
-                    )
         except requests.exceptions.ConnectTimeout:
             raise NetworkError("Connection timed out - check your internet connection")
         except requests.exceptions.ReadTimeout:
@@ -131,9 +474,134 @@ class BaseClient:
         except requests.exceptions.RequestException as e:
             raise NetworkError(f"Request failed: {e}")
 
+    def request_stream(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        item_path: str = "data.item",
+        private: bool = True,
+    ) -> Iterator[Any]:
+        """Stream the items of a large GET response as they are parsed.
+
+        The body is parsed incrementally with ijson (the optional ``stream``
+        extra), so items are yielded before the whole response has arrived and
+        the raw body is never held in memory at once.
+
+        Args:
+            endpoint (str): API endpoint path, e.g. "customer".
+            params (Optional[Dict]): Query parameters for the request.
+            item_path (str): ijson prefix of the items to yield; the default
+                yields each element of the top-level ``data`` array.
+            private (bool): Whether to send Authorization header.
+
+        Yields:
+            Any: Each item found at ``item_path``.
+
+        Raises:
+            PaystackError: Various subclasses depending on the error type.
+        """
+        ijson = require_ijson()
+        response = self._send(
+            "GET",
+            self._build_url(endpoint),
+            headers=None if private else {"Authorization": None},
+            params=params,
+            stream=True,
+        )
+        with response:
+            if response.status_code not in (200, 201):
+                self._handle_response(response)
+            response.raw.decode_content = True
+            collector = ItemCollector(item_path)
+            try:
+                for prefix, event, value in ijson.parse(response.raw):
+                    yield from collector.feed(prefix, event, value)
+            except ijson.JSONError as e:
+                raise InvalidResponseError(
+                    f"Invalid JSON response: {e}",
+                    status_code=response.status_code,
+                ) from e
+        self._check_stream_status(collector, response.status_code)
+
+    @staticmethod
+    def _check_stream_status(collector: "ItemCollector", status_code: int) -> None:
+        """Raise for a streamed body that Paystack marked as failed."""
+        if collector.status is None:
+            raise InvalidResponseError(
+                "Invalid Paystack response structure: missing 'status' or 'message'",
+                status_code=status_code,
+            )
+        if collector.status is False:
+            raise APIError(
+                message=f"API request failed: {collector.message}",
+                status_code=status_code,
+            )
+
+    @staticmethod
+    def _cache_key(
+        endpoint: str, params: Optional[Dict], private: bool
+    ) -> Optional[Tuple[Any, ...]]:
+        """Key for a cacheable GET, or ``None`` when the call must not be cached."""
+        try:
+            query = tuple(sorted(params.items())) if params else ()
+            key = (endpoint.lstrip("/"), query, private)
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def invalidate(self, endpoint: Optional[str] = None) -> None:
+        """Drop cached GET responses.
+
+        Args:
+            endpoint (Optional[str]): Any endpoint of the resource to invalidate,
+                e.g. "customer/CUS_xyz" drops every cached "customer" read. All
+                cached responses are dropped when omitted.
+
+        Mutating requests (POST/PUT/DELETE) call this automatically for the
+        resource they touch.
+        """
+        if endpoint is None:
+            self._cache.invalidate()
+        else:
+            self._cache.invalidate(endpoint.lstrip("/").split("/", 1)[0])
+
+    def _handle_response(self, response) -> "PaystackResponse":
+        """
+        Parse a completed HTTP response and map it to data or an exception.
+
+        Shared by the blocking and asynchronous clients; ``response`` only needs
+        ``status_code``, ``headers`` and the raw body as ``content``.
+        """
+        request_id = response.headers.get("x-amzn-requestid") or response.headers.get(
+            "cf-ray"
+        )
+
+        try:
+            resp_json = json_loads(response.content)
+        except (ValueError, JSONDecodeError) as e:
+            raise InvalidResponseError(
+                f"Invalid JSON response: {e}",
+                status_code=response.status_code,
+                request_id=request_id,
+            ) from e
+
+        # Handle HTTP status codes
+        if response.status_code in [200, 201]:
+            return self._handle_success_response(
+                resp_json, response.status_code, request_id
+            )
+        # Reuse the parsed body; headers are only needed for Retry-After on 429
+        raise create_error_from_response(
+            response=resp_json,
+            status_code=response.status_code,
+            request_id=request_id,
+            headers=response.headers,
+        )
+
     def _handle_success_response(
         self, resp_json: Dict, status_code: int, request_id: Optional[str]
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> "PaystackResponse":
         """
         Handle successful HTTP responses (200, 201).
 
@@ -194,12 +662,102 @@ class BaseClient:
         # Extract response components
         meta = resp_json.get("meta", {})
 
-        return data, meta
+        return PaystackResponse(data, meta)
+
+    def _fan_out(
+        self,
+        calls: Mapping[Hashable, Callable[[], Any]],
+        max_workers: int = 16,
+        return_exceptions: bool = False,
+    ) -> Dict[Hashable, Any]:
+        """
+        Run independent zero-argument calls concurrently over the shared session.
+
+        Args:
+            calls: Mapping of result key to the call producing that result.
+            max_workers: Maximum number of calls in flight at once.
+            return_exceptions: Map failing calls to their exception instead of
+                raising, so callers can see which of several writes succeeded.
+
+        Returns:
+            Dict mapping each key to its call's result, in input order. Unless
+            ``return_exceptions`` is set, the first failing call's exception is
+            re-raised once all calls have finished.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {key: executor.submit(call) for key, call in calls.items()}
+        if return_exceptions:
+            return {
+                key: future.exception() or future.result()
+                for key, future in futures.items()
+            }
+        return {key: future.result() for key, future in futures.items()}
+
+    def _single_flight(self, key: Hashable, call: Callable[[], Any]) -> Any:
+        """
+        Share one in-flight call between concurrent callers using the same key.
+
+        The first caller runs ``call``; callers arriving while it is in flight
+        wait for and receive the same result (or exception) instead of issuing
+        their own request.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = call()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _paginate(
+        self,
+        fetch: Callable[[Any], Any],
+        advance: Callable[[Any, Dict[str, Any]], Any],
+        start: Any = None,
+    ) -> Iterator[Any]:
+        """
+        Yield the rows of every page, fetching the next page in the background.
+
+        The request for page N+1 is issued before the rows of page N are
+        yielded, so network time overlaps with the caller's processing.
+
+        Args:
+            fetch: Call returning the response for a page token.
+            advance: Maps the current token and its ``meta`` to the next token,
+                or ``None`` when there are no more pages.
+            start: Token of the first page.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            token = start
+            data, meta = fetch(token)
+            while True:
+                token = advance(token, meta) if data else None
+                pending = None if token is None else executor.submit(fetch, token)
+                try:
+                    yield from data
+                except GeneratorExit:
+                    if pending is not None:
+                        pending.cancel()
+                    raise
+                if pending is None:
+                    return
+                data, meta = pending.result()
 
     def _build_url(self, endpoint: str) -> str:
         """Build full URL from endpoint."""
-        endpoint = endpoint.lstrip("/")  # Remove leading slash if present
-        return f"{self.base_url}/{endpoint}"
+        return _join_url(self.base_url, endpoint)
 
     def _validate_required_params(self, *args, **kwargs):
         """
@@ -207,25 +765,34 @@ class BaseClient:
 
         Raises ValidationError for missing required parameters.
         """
-        missing_params = []
-
         # Ensure no positional arguments are passed
         if args:
             raise TypeError("Positional arguments are not allowed for this method.")
 
-        for param_name, param_value in kwargs.items():
-            if param_value is None or (
-                isinstance(param_value, str) and not param_value.strip()
-            ):
-                missing_params.append(param_name)
+        # Fast path: nothing is missing, so don't build the error bookkeeping
+        for param_value in kwargs.values():
+            if _is_blank(param_value):
+                break
+        else:
+            return
+
+        raise _missing_params_error(
+            [
+                param_name
+                for param_name, param_value in kwargs.items()
+                if _is_blank(param_value)
+            ]
+        )
 
-        if missing_params:
-            raise ValidationError(
-                message=f"Missing required parameters: {', '.join(missing_params)}",
-                field_errors={
-                    param: "This field is required" for param in missing_params
-                },
-            )
+    @staticmethod
+    def _require(name: str, value: Any) -> None:
+        """
+        Validate a single required parameter without building a kwargs dict.
+
+        Raises the same ValidationError as ``_validate_required_params``.
+        """
+        if _is_blank(value):
+            raise _missing_params_error((name,))
 
     def _validate_amount(self, amount: Union[int, str], currency: str = "NGN"):
         """
@@ -238,22 +805,20 @@ class BaseClient:
         Raises:
             ValidationError: If amount is invalid
         """
-        try:
+        if type(amount) is int:
+            amount_int = amount
+        elif type(amount) is str and amount.isdecimal():
             amount_int = int(amount)
-        except (ValueError, TypeError):
-            raise ValidationError(
-                message="Amount must be a valid integer or string representation of an integer",
-                field_errors={"amount": "Must be a valid integer value"},
-            )
-
-        # Minimum amounts by currency (in smallest unit)
-        min_amounts = {
-            "NGN": 100,  # ₦1.00 in kobo
-            "USD": 50,  # $0.50 in cents
-            "GHS": 100,  # GH₵1.00 in pesewas
-        }
+        else:
+            try:
+                amount_int = int(amount)
+            except (ValueError, TypeError):
+                raise ValidationError(
+                    message="Amount must be a valid integer or string representation of an integer",
+                    field_errors={"amount": "Must be a valid integer value"},
+                )
 
-        min_amount = min_amounts.get(currency, 100)
+        min_amount = _MIN_AMOUNTS.get(currency, 100)
         if amount_int < min_amount:
             raise ValidationError(
                 message=f"Amount too small for {currency}",
@@ -262,29 +827,25 @@ class BaseClient:
                 },
             )
 
-    def _validate_email(self, email: str):
-        """
-        Email validation for Paystack requirements
+    # Same checks and errors as utils.helpers.validate_email, kept as a method
+    # for the endpoint classes.
+    _validate_email = staticmethod(validate_email)
 
-        Args:
-            email (str): The email address to validate.
+    def close(self) -> None:
+        """Release this client; its connection pool stays open.
 
-        Raises:
-                ValidationError: If email format is invalid
+        The pool is shared with every other client built with the same key
+        and settings, so closing one client must not drop connections the
+        others (or the next short-lived client) will reuse. Call
+        :func:`paystack.close_sessions` to close the shared pools, and close
+        an injected ``session`` yourself.
         """
-        if not email or not isinstance(email, str) or len(email) > 254:
-            raise ValidationError(
-                message="Email is required",
-                field_errors={"email": "Email address is required"},
-            )
 
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+    def __enter__(self):
+        return self
 
-        if not re.match(pattern, email):
-            raise ValidationError(
-                message="Invalid email format",
-                field_errors={"email": "Please provide a valid email address"},
-            )
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
     def __repr__(self):
         masked_key = (
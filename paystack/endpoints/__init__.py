@@ -1,25 +1,28 @@
-from .transactions import TransactionsAPI
-from .customers import CustomersAPI
-from .charge import ChargeAPI
-from .plans import PlansAPI
-from .products import ProductsAPI
+from .transactions import TransactionsAPI, AsyncTransactionsAPI
+from .customers import CustomersAPI, AsyncCustomersAPI
+from .charge import ChargeAPI, AsyncChargeAPI
+from .plans import PlansAPI, AsyncPlansAPI
+from .products import ProductsAPI, AsyncProductsAPI
 from .refunds import RefundsAPI
-from .settlements import SettlementsAPI
+from .settlements import SettlementsAPI, AsyncSettlementsAPI
 from .subaccounts import SubaccountsAPI
-from .subscriptions import SubscriptionsAPI
+from .subscriptions import SubscriptionsAPI, AsyncSubscriptionsAPI
 from .transfers import TransfersAPI
 from .transfers_control import TransfersControlAPI
-from .transfers_recipients import TransferRecipientsAPI
-from .verification import VerificationAPI
-from .disputes import DisputesAPI
+from .transfers_recipients import TransferRecipientsAPI, AsyncTransferRecipientsAPI
+from .verification import VerificationAPI, AsyncVerificationAPI
+from .disputes import DisputesAPI, AsyncDisputesAPI
 from .payment_pages import PaymentPagesAPI
 from .payment_requests import PaymentRequestsAPI
 from .bulk_charges import BulkChargesAPI
-from .dedicated_virtual_accounts import DedicatedVirtualAccountsAPI
-from .direct_debit import DirectDebitAPI
-from .apple_pay import ApplePayAPI
-from .terminal import TerminalAPI
+from .dedicated_virtual_accounts import (
+    DedicatedVirtualAccountsAPI,
+    AsyncDedicatedVirtualAccountsAPI,
+)
+from .direct_debit import DirectDebitAPI, AsyncDirectDebitAPI
+from .apple_pay import ApplePayAPI, AsyncApplePayAPI
+from .terminal import TerminalAPI, AsyncTerminalAPI
 from .virtual_terminal import VirtualTerminalAPI
-from .transaction_splits import TransactionSplitsAPI
+from .transaction_splits import TransactionSplitsAPI, AsyncTransactionSplitsAPI
 from .integration import IntegrationAPI
 from .miscellaneous import MiscellaneousAPI
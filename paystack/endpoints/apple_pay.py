@@ -3,9 +3,32 @@ The Apple Pay API allows you register your application's top-level domain or sub
 """
 
 import requests
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Iterator, Tuple
 
-from ..core import BaseClient
+from ..core import BaseClient, PaystackResponse
+from ..async_core import AsyncBaseClient
+
+# Query parameter names, in the order _list_params takes their values.
+_LIST_PARAM_NAMES = ("use_cursor", "next", "previous")
+
+
+def _list_params(
+    use_cursor: Optional[bool],
+    next_cursor: Optional[str],
+    previous_cursor: Optional[str],
+) -> Optional[Dict[str, Any]]:
+    """Query parameters shared by the domain list endpoints.
+
+    Only ``None`` is treated as "not given", so an explicit empty cursor is
+    still sent. Returns ``None`` when there is nothing to send.
+    """
+    values = (use_cursor, next_cursor, previous_cursor)
+    params = {
+        name: value
+        for name, value in zip(_LIST_PARAM_NAMES, values)
+        if value is not None
+    }
+    return params or None
 
 
 class ApplePayAPI(BaseClient):
@@ -13,14 +36,14 @@ class ApplePayAPI(BaseClient):
     The Apple Pay API allows you register your application's top-level domain or subdomain.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, secret_key: str, session: requests.Session = None, base_url: str = None
     ):
         super().__init__(secret_key, session=session, base_url=base_url)
 
-    def register_domain(
-        self, domain_name: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def register_domain(self, domain_name: str) -> PaystackResponse:
         """
         Register a top-level domain or subdomain for your Apple Pay integration.
 
@@ -28,7 +51,7 @@ class ApplePayAPI(BaseClient):
             domain_name: Domain name to be registered
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {"domainName": domain_name}
         return self.request("POST", "apple-pay/domain", json_data=payload)
@@ -38,7 +61,9 @@ class ApplePayAPI(BaseClient):
         use_cursor: Optional[bool] = None,
         next_cursor: Optional[str] = None,
         previous_cursor: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        cache_ttl: Optional[float] = None,
+        schema: Optional[Tuple[str, ...]] = None,
+    ) -> PaystackResponse:
         """
         Lists all registered domains on your integration. Returns an empty array if no domains have been added.
 
@@ -46,23 +71,48 @@ class ApplePayAPI(BaseClient):
             use_cursor: Flag to enable cursor pagination on the endpoint
             next_cursor: A cursor that indicates your place in the list. It can be used to fetch the next page of the list
             previous_cursor: A cursor that indicates your place in the list. It should be used to fetch the previous page of the list after an intial next request
+            cache_ttl: Seconds to reuse a cached response for identical calls (disabled
+                by default)
+            schema: Return each domain as a tuple of these fields instead of a dict
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        params = {}
-        if use_cursor is not None:
-            params["use_cursor"] = use_cursor
-        if next_cursor:
-            params["next"] = next_cursor
-        if previous_cursor:
-            params["previous"] = previous_cursor
-
-        return self.request("GET", "apple-pay/domain", params=params)
-
-    def unregister_domain(
-        self, domain_name: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        params = _list_params(use_cursor, next_cursor, previous_cursor)
+        return self.request(
+            "GET",
+            "apple-pay/domain",
+            params=params,
+            cache_ttl=cache_ttl,
+            schema=schema,
+        )
+
+    def stream_domains(
+        self,
+        use_cursor: Optional[bool] = None,
+        next_cursor: Optional[str] = None,
+        previous_cursor: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Yield registered domain names one at a time as the response is parsed.
+
+        Requires the optional ``stream`` extra (ijson). Pagination metadata is not
+        returned; use ``list_domains`` when you need it.
+
+        Args:
+            use_cursor: Flag to enable cursor pagination on the endpoint
+            next_cursor: A cursor that indicates your place in the list. It can be used to fetch the next page of the list
+            previous_cursor: A cursor that indicates your place in the list. It should be used to fetch the previous page of the list after an intial next request
+
+        Returns:
+            Iterator[str]: The registered domain names.
+        """
+        params = _list_params(use_cursor, next_cursor, previous_cursor)
+        return self.request_stream(
+            "apple-pay/domain", params=params, item_path="data.domainNames.item"
+        )
+
+    def unregister_domain(self, domain_name: str) -> PaystackResponse:
         """
         Unregister a top-level domain or subdomain previously used for your Apple Pay integration.
 
@@ -70,7 +120,13 @@ class ApplePayAPI(BaseClient):
             domain_name: Domain name to be registered
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {"domainName": domain_name}
         return self.request("DELETE", "apple-pay/domain", json_data=payload)
+
+
+class AsyncApplePayAPI(AsyncBaseClient, ApplePayAPI):
+    """Asynchronous Apple Pay API client; every method returns an awaitable."""
+
+    __slots__ = ()
@@ -3,9 +3,9 @@ The Bulk Charges API allows you create and manage multiple recurring payments fr
 """
 
 import requests
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any
 
-from ..core import BaseClient
+from ..core import BaseClient, PaystackResponse
 
 
 class BulkChargesAPI(BaseClient):
@@ -13,14 +13,14 @@ class BulkChargesAPI(BaseClient):
     The Bulk Charges API allows you create and manage multiple recurring payments from your customers.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, secret_key: str, session: requests.Session = None, base_url: str = None
     ):
         super().__init__(secret_key, session=session, base_url=base_url)
 
-    def initiate_bulk_charge(
-        self, charges: List[Dict[str, Any]]
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def initiate_bulk_charge(self, charges: List[Dict[str, Any]]) -> PaystackResponse:
         """
         Send an array of objects with authorization codes and amount, using the supported currency format, so we can process transactions as a batch.
 
@@ -28,9 +28,9 @@ class BulkChargesAPI(BaseClient):
             charges: A list of charge object. Each object consists of an authorization, amount and reference
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        self._validate_required_params(charges=charges)
+        self._require("charges", charges)
         return self.request("POST", "bulkcharge", json_data=charges)
 
     def list_bulk_charge_batches(
@@ -39,7 +39,7 @@ class BulkChargesAPI(BaseClient):
         page: Optional[int] = None,
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         This lists all bulk charge batches created by the integration. Statuses can be active, paused, or complete
 
@@ -50,12 +50,12 @@ class BulkChargesAPI(BaseClient):
             to_date: A timestamp at which to stop listing batches e.g. 2016-09-24T00:00:05.000Z, 2016-09-21
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         params = {}
-        if per_page:
+        if per_page is not None:
             params["perPage"] = per_page
-        if page:
+        if page is not None:
             params["page"] = page
         if from_date:
             params["from"] = from_date
@@ -64,9 +64,7 @@ class BulkChargesAPI(BaseClient):
 
         return self.request("GET", "bulkcharge", params=params)
 
-    def fetch_bulk_charge_batch(
-        self, id_or_code: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def fetch_bulk_charge_batch(self, id_or_code: str) -> PaystackResponse:
         """
         This endpoint retrieves a specific batch code. It also returns useful information on its progress by way of the total_charges and pending_charges attributes.
 
@@ -74,9 +72,9 @@ class BulkChargesAPI(BaseClient):
             id_or_code: An ID or code for the charge whose batches you want to retrieve.
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        self._validate_required_params(id_or_code=id_or_code)
+        self._require("id_or_code", id_or_code)
         return self.request("GET", f"bulkcharge/{id_or_code}")
 
     def fetch_charges_in_batch(
@@ -87,7 +85,7 @@ class BulkChargesAPI(BaseClient):
         page: Optional[int] = None,
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         This endpoint retrieves the charges associated with a specified batch code. Pagination parameters are available. You can also filter by status. Charge statuses can be pending, success or failed.
 
@@ -100,15 +98,15 @@ class BulkChargesAPI(BaseClient):
             to_date: A timestamp at which to stop listing charges e.g. 2016-09-24T00:00:05.000Z, 2016-09-21
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        self._validate_required_params(id_or_code=id_or_code)
+        self._require("id_or_code", id_or_code)
         params = {}
         if status:
             params["status"] = status
-        if per_page:
+        if per_page is not None:
             params["perPage"] = per_page
-        if page:
+        if page is not None:
             params["page"] = page
         if from_date:
             params["from"] = from_date
@@ -117,9 +115,7 @@ class BulkChargesAPI(BaseClient):
 
         return self.request("GET", f"bulkcharge/{id_or_code}/charges", params=params)
 
-    def pause_bulk_charge_batch(
-        self, batch_code: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def pause_bulk_charge_batch(self, batch_code: str) -> PaystackResponse:
         """
         Use this endpoint to pause processing a batch
 
@@ -127,14 +123,12 @@ class BulkChargesAPI(BaseClient):
             batch_code: The batch code for the bulk charge you want to pause
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        self._validate_required_params(batch_code=batch_code)
+        self._require("batch_code", batch_code)
         return self.request("GET", f"bulkcharge/pause/{batch_code}")
 
-    def resume_bulk_charge_batch(
-        self, batch_code: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def resume_bulk_charge_batch(self, batch_code: str) -> PaystackResponse:
         """
         Use this endpoint to resume processing a batch
 
@@ -142,7 +136,7 @@ class BulkChargesAPI(BaseClient):
             batch_code: The batch code for the bulk charge you want to resume
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        self._validate_required_params(batch_code=batch_code)
+        self._require("batch_code", batch_code)
         return self.request("GET", f"bulkcharge/resume/{batch_code}")
@@ -1,17 +1,24 @@
 # charge.py
 import requests
-from typing import Optional, Dict, Any, Union, Tuple
-from ..core import BaseClient
+from functools import partial
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Iterable, Union
+from ..core import BaseClient, PaystackResponse
+from ..async_core import AsyncBaseClient
 from ..exceptions import ValidationError
-from ..utils.validators import (
-    _validate_amount_and_email,
-    _validate_charge_authorization,
-)
+from ..utils.helpers import json_dumps
+
+_BEARER_VALUES = frozenset(("account", "subaccount"))
+_BEARER_ERRORS = MappingProxyType({"bearer": "Must be 'account' or 'subaccount'"})
+
+_CHARGE_PATH = "charge/{}".format
 
 
 class ChargeAPI(BaseClient):
     """Charge API client for processing payments with specific payment channels."""
 
+    __slots__ = ()
+
     def __init__(
         self, secret_key: str, session: requests.Session = None, base_url: str = None
     ):
@@ -36,7 +43,7 @@ class ChargeAPI(BaseClient):
         reference: Optional[str] = None,
         device_id: Optional[str] = None,
         birthday: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """Initiate a payment by integrating the payment channel of your choice.
 
         Args:
@@ -59,7 +66,7 @@ class ChargeAPI(BaseClient):
             birthday (Optional[str]): Customer's birthday in YYYY-MM-DD format
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Raises:
             ValidationError: If email or amount is invalid, or if conflicting payment methods are provided
@@ -67,55 +74,41 @@ class ChargeAPI(BaseClient):
         self._validate_email(email)
         self._validate_amount(amount)
 
-        payload = {"email": email, "amount": str(amount)}
-
-        # Add optional fields
-        if split_code:
-            payload["split_code"] = split_code
-        if subaccount:
-            payload["subaccount"] = subaccount
-        if transaction_charge is not None:
-            payload["transaction_charge"] = transaction_charge
-        if bearer:
-            if bearer not in ["account", "subaccount"]:
-                raise ValidationError(
-                    "bearer must be either 'account' or 'subaccount'",
-                    field_errors={"bearer": "Must be 'account' or 'subaccount'"},
-                )
-            payload["bearer"] = bearer
-        if bank:
-            payload["bank"] = bank
-        if bank_transfer:
-            payload["bank_transfer"] = bank_transfer
-        if ussd:
-            payload["ussd"] = ussd
-        if mobile_money:
-            payload["mobile_money"] = mobile_money
-        if qr:
-            payload["qr"] = qr
-        if authorization_code:
-            payload["authorization_code"] = authorization_code
-        if pin:
-            payload["pin"] = pin
-        if metadata:
-            # Convert metadata dict to JSON string as per API requirements
-            import json
-
-            payload["metadata"] = (
-                json.dumps(metadata) if isinstance(metadata, dict) else metadata
+        if bearer is not None and bearer not in _BEARER_VALUES:
+            raise ValidationError(
+                "bearer must be either 'account' or 'subaccount'",
+                field_errors=_BEARER_ERRORS,
             )
-        if reference:
-            payload["reference"] = reference
-        if device_id:
-            payload["device_id"] = device_id
-        if birthday:
-            payload["birthday"] = birthday
+        if isinstance(metadata, dict):
+            # The charge endpoint expects metadata as a JSON string
+            metadata = json_dumps(metadata).decode("utf-8")
+
+        optional_fields = (
+            ("split_code", split_code),
+            ("subaccount", subaccount),
+            ("transaction_charge", transaction_charge),
+            ("bearer", bearer),
+            ("bank", bank),
+            ("bank_transfer", bank_transfer),
+            ("ussd", ussd),
+            ("mobile_money", mobile_money),
+            ("qr", qr),
+            ("authorization_code", authorization_code),
+            ("pin", pin),
+            ("metadata", metadata),
+            ("reference", reference),
+            ("device_id", device_id),
+            ("birthday", birthday),
+        )
+        payload = {
+            "email": email,
+            "amount": str(amount),
+            **{k: v for k, v in optional_fields if v is not None},
+        }
 
         return self.request("POST", "charge", json_data=payload)
 
-    def submit_pin(
-        self, pin: str, reference: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def submit_pin(self, pin: str, reference: str) -> PaystackResponse:
         """Submit PIN to continue a charge.
 
         Args:
@@ -123,7 +116,7 @@ class ChargeAPI(BaseClient):
             reference (str): Reference for transaction that requested pin
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Raises:
             APIError: If pin or reference is not provided
@@ -134,9 +127,7 @@ class ChargeAPI(BaseClient):
 
         return self.request("POST", "charge/submit_pin", json_data=payload)
 
-    def submit_otp(
-        self, otp: str, reference: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def submit_otp(self, otp: str, reference: str) -> PaystackResponse:
         """Submit OTP to complete a charge.
 
         Args:
@@ -144,7 +135,7 @@ class ChargeAPI(BaseClient):
             reference (str): Reference for ongoing transaction
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Raises:
             APIError: If otp or reference is not provided
@@ -155,9 +146,7 @@ class ChargeAPI(BaseClient):
 
         return self.request("POST", "charge/submit_otp", json_data=payload)
 
-    def submit_phone(
-        self, phone: str, reference: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def submit_phone(self, phone: str, reference: str) -> PaystackResponse:
         """Submit phone number when requested.
 
         Args:
@@ -165,7 +154,7 @@ class ChargeAPI(BaseClient):
             reference (str): Reference for ongoing transaction
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Raises:
             APIError: If phone or reference is not provided
@@ -176,9 +165,7 @@ class ChargeAPI(BaseClient):
 
         return self.request("POST", "charge/submit_phone", json_data=payload)
 
-    def submit_birthday(
-        self, birthday: str, reference: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def submit_birthday(self, birthday: str, reference: str) -> PaystackResponse:
         """Submit birthday when requested.
 
         Args:
@@ -186,7 +173,7 @@ class ChargeAPI(BaseClient):
             reference (str): Reference for ongoing transaction
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Raises:
             APIError: If birthday or reference is not provided
@@ -199,7 +186,7 @@ class ChargeAPI(BaseClient):
 
     def submit_address(
         self, address: str, reference: str, city: str, state: str, zip_code: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """Submit address to continue a charge.
 
         Args:
@@ -210,7 +197,7 @@ class ChargeAPI(BaseClient):
             zipcode (str): Zipcode submitted by user
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Raises:
             APIError: If any required parameter is not provided
@@ -234,22 +221,59 @@ class ChargeAPI(BaseClient):
         return self.request("POST", "charge/submit_address", json_data=payload)
 
     def check_pending_charge(
-        self, reference: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        self, reference: str, cache_ttl: Optional[float] = None
+    ) -> PaystackResponse:
         """Check the status of a pending charge.
 
         When you get 'pending' as a charge status or if there was an exception when calling
         any of the /charge endpoints, wait 10 seconds or more, then make a check to see if
         its status has changed. Don't call too early as you may get a lot more pending than you should.
+        Concurrent checks of the same reference share one HTTP request.
 
         Args:
             reference (str): The reference to check
+            cache_ttl (Optional[float]): Seconds to reuse a cached response for
+                identical calls (disabled by default)
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Raises:
             APIError: If reference is not provided
         """
-        self._validate_required_params(reference=reference)
-        return self.request("GET", f"charge/{reference}")
+        self._require("reference", reference)
+        # Concurrent pollers of the same reference share a single request
+        return self._single_flight(
+            ("charge", reference),
+            partial(self.request, "GET", _CHARGE_PATH(reference), cache_ttl=cache_ttl),
+        )
+
+    def check_many(
+        self, references: Iterable[str], max_workers: int = 16
+    ) -> Dict[str, PaystackResponse]:
+        """Check the status of several pending charges concurrently.
+
+        Calls run in parallel over the client's pooled session, so keep
+        ``max_workers`` at or below the client's ``pool_size``.
+
+        Args:
+            references (Iterable[str]): The references to check
+            max_workers (int): Maximum number of requests in flight at once
+
+        Returns:
+            Dict[str, PaystackResponse]: Each reference mapped to its response data and
+                metadata.
+        """
+        return self._fan_out(
+            {
+                ref: partial(self.check_pending_charge, reference=ref)
+                for ref in references
+            },
+            max_workers=max_workers,
+        )
+
+
+class AsyncChargeAPI(AsyncBaseClient, ChargeAPI):
+    """Asynchronous Charge API client; every method returns an awaitable."""
+
+    __slots__ = ()
@@ -1,16 +1,68 @@
 """The Customers API to create and manage customers."""
 
 import requests
-from typing import Optional, Dict, Any, Tuple
+from functools import partial
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Iterable, Iterator, Mapping, Tuple, Union
 
-from ..core import BaseClient
-from ..exceptions import ValidationError
+from ..core import BaseClient, PaystackResponse, _next_page
+from ..async_core import AsyncBaseClient
+from ..exceptions import PaystackError, ValidationError
 from ..utils.helpers import validate_email
 
+# Path templates for endpoints that take a single path parameter
+_CUSTOMER_PATH = "customer/{}".format
+_IDENTIFICATION_PATH = "customer/{}/identification".format
+_VERIFY_AUTHORIZATION_PATH = "customer/authorization/verify/{}".format
+_DIRECT_DEBIT_PATH = "customer/{}/initialize-direct-debit".format
+_ACTIVATION_CHARGE_PATH = "customer/{}/directdebit-activation-charge".format
+_MANDATE_AUTHORIZATIONS_PATH = "customer/{}/directdebit-mandate-authorizations".format
+
+_RISK_ACTIONS = frozenset(("default", "allow", "deny"))
+_RISK_ACTION_ERRORS = MappingProxyType(
+    {"risk_action": "Must be 'default', 'allow', or 'deny'"}
+)
+_ACCOUNT_KEYS = frozenset(("number", "bank_code"))
+_ADDRESS_KEYS = frozenset(("street", "city", "state"))
+
+
+def _require_keys(
+    name: str, value: Optional[Mapping[str, Any]], required: frozenset, listed: str
+) -> None:
+    """Raise a ValidationError naming the keys of ``required`` missing from
+    ``value``."""
+    missing = required - value.keys() if isinstance(value, Mapping) else required
+    if missing:
+        raise ValidationError(
+            f"{name} must contain {listed}",
+            field_errors={name: f"Missing {', '.join(sorted(missing))}"},
+        )
+
+
+# Query parameter names, in the order _list_params takes their values.
+_LIST_CUSTOMERS_PARAMS = ("perPage", "page", "from", "to")
+
+
+def _list_params(
+    per_page: Optional[int],
+    page: Optional[int],
+    from_date: Optional[str],
+    to_date: Optional[str],
+) -> Dict[str, Any]:
+    """Query parameters shared by the customer list endpoints."""
+    values = (per_page, page, from_date, to_date)
+    return {
+        name: value
+        for name, value in zip(_LIST_CUSTOMERS_PARAMS, values)
+        if value is not None
+    }
+
 
 class CustomersAPI(BaseClient):
     """Customer API client for creating and managing customers."""
 
+    __slots__ = ()
+
     def __init__(
         self, secret_key: str, session: requests.Session = None, base_url: str = None
     ):
@@ -24,7 +76,7 @@ class CustomersAPI(BaseClient):
         phone: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
         validate_required_fields: bool = False,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """Create a customer on your integration.
 
         Args:
@@ -38,7 +90,7 @@ class CustomersAPI(BaseClient):
                 business categories: Betting, Financial services, General Service)
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Raises:
             APIError: If required parameters are missing or invalid
@@ -49,17 +101,16 @@ class CustomersAPI(BaseClient):
                 first_name=first_name, last_name=last_name, phone=phone
             )
 
-        payload = {"email": email}
-
-        # Add optinoal fields if provided
-        if first_name:
-            payload["first_name"] = first_name
-        if last_name:
-            payload["last_name"] = last_name
-        if phone:
-            payload["phone"] = phone
-        if metadata:
-            payload["metadata"] = metadata
+        optional_fields = (
+            ("first_name", first_name),
+            ("last_name", last_name),
+            ("phone", phone),
+            ("metadata", metadata),
+        )
+        payload = {
+            "email": email,
+            **{k: v for k, v in optional_fields if v is not None},
+        }
 
         return self.request("POST", "customer", json_data=payload)
 
@@ -69,7 +120,8 @@ class CustomersAPI(BaseClient):
         page: Optional[int] = None,
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        schema: Optional[Tuple[str, ...]] = None,
+    ) -> PaystackResponse:
         """List customers available on your integration.
 
         Args:
@@ -77,34 +129,111 @@ class CustomersAPI(BaseClient):
             page (Optional[int]): Page number to retrieve (default: 1)
             from_date (Optional[str]): Start date filter (e.g. '2016-09-24T00:00:05.000Z')
             to_date (Optional[str]): End date filter (e.g. '2016-09-24T00:00:05.000Z')
+            schema (Optional[Tuple[str, ...]]): Return each customer as a tuple of
+                these fields, e.g. ("id", "email", "customer_code")
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        params = {}
+        params = _list_params(per_page, page, from_date, to_date)
+        return self.request("GET", "customer", params=params, schema=schema)
 
-        if per_page is not None:
-            params["perPage"] = per_page
-        if page is not None:
-            params["page"] = page
-        if from_date:
-            params["from"] = from_date
-        if to_date:
-            params["to"] = to_date
+    def stream_customers(
+        self,
+        per_page: Optional[int] = None,
+        page: Optional[int] = None,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the customers on a page one at a time as the response is parsed.
 
-        return self.request("GET", "customer", params=params)
+        Useful for large pages: customers are available before the whole body has
+        been received and the raw body is never buffered. Requires the optional
+        ``stream`` extra (ijson). Pagination metadata is not returned; use
+        ``list_customers`` when you need it.
 
-    def fetch(self, email_or_code: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        Args:
+            per_page (Optional[int]): Number of records per page (default: 50)
+            page (Optional[int]): Page number to retrieve (default: 1)
+            from_date (Optional[str]): Start date filter (e.g. '2016-09-24T00:00:05.000Z')
+            to_date (Optional[str]): End date filter (e.g. '2016-09-24T00:00:05.000Z')
+
+        Returns:
+            Iterator[Dict[str, Any]]: The customers on the requested page.
+        """
+        params = _list_params(per_page, page, from_date, to_date)
+        return self.request_stream("customer", params=params)
+
+    def iter_customers(
+        self,
+        per_page: int = 50,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield every customer across all pages.
+
+        The next page is requested while the current one is being consumed, so
+        a full scan costs little more than the time spent processing it. On the
+        async client, iterate with ``async for``.
+
+        Args:
+            per_page (int): Number of records fetched per request (default: 50)
+            from_date (Optional[str]): Start date filter (e.g. '2016-09-24T00:00:05.000Z')
+            to_date (Optional[str]): End date filter (e.g. '2016-09-24T00:00:05.000Z')
+
+        Returns:
+            Iterator[Dict[str, Any]]: Each customer on the integration.
+        """
+        return self._paginate(
+            lambda page: self.list_customers(per_page, page, from_date, to_date),
+            _next_page,
+            start=1,
+        )
+
+    def fetch(
+        self, email_or_code: str, cache_ttl: Optional[float] = None
+    ) -> PaystackResponse:
         """Get details of a customer on your integration.
 
         Args:
             email_or_code (str): Customer's email address or customer_code
+            cache_ttl (Optional[float]): Seconds to reuse a cached response for
+                identical calls (disabled by default)
+
+        Returns:
+            PaystackResponse: A named tuple containing the response data and metadata.
+        """
+        self._require("email_or_code", email_or_code)
+        return self.request("GET", _CUSTOMER_PATH(email_or_code), cache_ttl=cache_ttl)
+
+    def fetch_many(
+        self,
+        codes: Iterable[str],
+        max_workers: int = 16,
+        cache_ttl: Optional[float] = None,
+    ) -> Dict[str, PaystackResponse]:
+        """Fetch several customers concurrently.
+
+        Calls run in parallel over the client's pooled session, so keep
+        ``max_workers`` at or below the client's ``pool_size``.
+
+        Args:
+            codes (Iterable[str]): Customer email addresses or customer codes
+            max_workers (int): Maximum number of requests in flight at once
+            cache_ttl (Optional[float]): Seconds to reuse a cached response for each
+                customer (disabled by default)
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            Dict[str, PaystackResponse]: Each code mapped to its response data and
+                metadata.
         """
-        self._validate_required_params(email_or_code=email_or_code)
-        return self.request("GET", f"customer/{email_or_code}")
+        return self._fan_out(
+            {
+                code: partial(self.fetch, email_or_code=code, cache_ttl=cache_ttl)
+                for code in codes
+            },
+            max_workers=max_workers,
+        )
 
     def update(
         self,
@@ -113,36 +242,33 @@ class CustomersAPI(BaseClient):
         last_name: Optional[str] = None,
         phone: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-        """Update a customer's details on your integration"""
+    ) -> PaystackResponse:
         """Update a customer's details on your integration.
-        
+
         Args:
             code (str): Customer's code
             first_name (Optional[str]): Customer's first name
             last_name (Optional[str]): Customer's last name
             phone (Optional[str]): Customer's phone number
             metadata (Optional[Dict]): Additional key/value pairs to store
-            
+
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        self._validate_required_params(code=code)
-
-        payload = {}
-        if first_name is not None:
-            payload["first_name"] = first_name
-        if last_name is not None:
-            payload["last_name"] = last_name
-        if phone is not None:
-            payload["phone"] = phone
-        if metadata is not None:
-            payload["metadata"] = metadata
+        self._require("code", code)
+
+        fields = (
+            ("first_name", first_name),
+            ("last_name", last_name),
+            ("phone", phone),
+            ("metadata", metadata),
+        )
+        payload = {k: v for k, v in fields if v is not None}
 
         if not payload:
             raise ValidationError("At least one field must be provided for update")
 
-        return self.request("PUT", f"customer/{code}", json_data=payload)
+        return self.request("PUT", _CUSTOMER_PATH(code), json_data=payload)
 
     def validate_identity(
         self,
@@ -151,8 +277,13 @@ class CustomersAPI(BaseClient):
         identification_type: str,
         first_name: str,
         last_name: str,
-        **kwargs,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        *,
+        bvn: Optional[str] = None,
+        bank_code: Optional[str] = None,
+        account_number: Optional[str] = None,
+        middle_name: Optional[str] = None,
+        value: Optional[str] = None,
+    ) -> PaystackResponse:
         """Validate a customer's identity.
 
         Args:
@@ -161,10 +292,18 @@ class CustomersAPI(BaseClient):
             identification_type (str): Type of identification (e.g. 'bank_account')
             first_name (str): Customer's first name
             last_name (str): Customer's last name
-            **kwargs: Additional fields like bvn, bank_code, account_number, etc.
+            bvn (str, optional): Customer's Bank Verification Number
+            bank_code (str, optional): Bank code of the customer's account
+            account_number (str, optional): Customer's bank account number
+            middle_name (str, optional): Customer's middle name
+            value (str, optional): Customer's identification number
+
+        Raises:
+            ValidationError: If neither ``bvn`` nor both ``bank_code`` and
+                ``account_number`` are given.
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         self._validate_required_params(
             customer_code=customer_code,
@@ -173,22 +312,31 @@ class CustomersAPI(BaseClient):
             first_name=first_name,
             last_name=last_name,
         )
+        if bvn is None and (bank_code is None or account_number is None):
+            raise ValidationError(
+                "Either bvn or both bank_code and account_number must be provided"
+            )
 
+        optional_fields = (
+            ("bvn", bvn),
+            ("bank_code", bank_code),
+            ("account_number", account_number),
+            ("middle_name", middle_name),
+            ("value", value),
+        )
         payload = {
             "country": country,
             "type": identification_type,
             "first_name": first_name,
             "last_name": last_name,
-            **kwargs,
+            **{k: v for k, v in optional_fields if v is not None},
         }
 
         return self.request(
-            "POST", f"customer/{customer_code}/identification", json_data=payload
+            "POST", _IDENTIFICATION_PATH(customer_code), json_data=payload
         )
 
-    def set_risk_action(
-        self, customer: str, risk_action: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def set_risk_action(self, customer: str, risk_action: str) -> PaystackResponse:
         """Whitelist or blacklist a customer on your integration.
 
         Args:
@@ -196,14 +344,14 @@ class CustomersAPI(BaseClient):
             risk_action (str): Risk action - 'default', 'allow' (whitelist), or 'deny' (blacklist)
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         self._validate_required_params(customer=customer, risk_action=risk_action)
 
-        if risk_action not in ["default", "allow", "deny"]:
+        if risk_action not in _RISK_ACTIONS:
             raise ValidationError(
                 "risk_action must be one of: 'default', 'allow', 'deny'",
-                field_errors={"risk_action": "Must be 'default', 'allow', or 'deny'"},
+                field_errors=_RISK_ACTION_ERRORS,
             )
         payload = {"customer": customer, "risk_action": risk_action}
 
@@ -216,7 +364,7 @@ class CustomersAPI(BaseClient):
         callback_url: Optional[str] = None,
         account: Optional[Dict] = None,
         address: Optional[Dict] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """Initiate a request to create a reusable authorization code for recurring transactions.
 
         Args:
@@ -227,40 +375,40 @@ class CustomersAPI(BaseClient):
             address (Optional[Dict]): Customer's address information
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         validate_email(email)
 
-        payload = {"email": email, "channel": channel}
-
-        if callback_url:
-            payload["callback_url"] = callback_url
-        if account:
-            payload["account"] = account
-        if address:
-            payload["address"] = address
+        optional_fields = (
+            ("callback_url", callback_url),
+            ("account", account),
+            ("address", address),
+        )
+        payload = {
+            "email": email,
+            "channel": channel,
+            **{k: v for k, v in optional_fields if v is not None},
+        }
 
         return self.request(
             "POST", "customer/authorization/initialize", json_data=payload
         )
 
-    def verify_authorization(
-        self, reference: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def verify_authorization(self, reference: str) -> PaystackResponse:
         """Check the status of an authorization request.
 
         Args:
             reference (str): The reference returned in the initialization response
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        self._validate_required_params(reference=reference)
-        return self.request("GET", f"customer/authorization/verify/{reference}")
+        self._require("reference", reference)
+        return self.request("GET", _VERIFY_AUTHORIZATION_PATH(reference))
 
     def initialize_direct_debit(
         self, customer_id: str, account: Dict[str, str], address: Dict[str, str]
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """Initialize the process of linking an account to a customer for Direct Debit transactions.
 
         Args:
@@ -269,35 +417,22 @@ class CustomersAPI(BaseClient):
             address (Dict): Customer's address (street, city, state)
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        self._validate_required_params(customer_id=customer_id)
+        self._require("customer_id", customer_id)
 
-        if not account or "number" not in account or "bank_code" not in account:
-            raise ValidationError(
-                "account must contain 'number' and 'bank_code'",
-                field_errors={"account": "Must contain 'number' and 'bank_code'"},
-            )
-        if (
-            not address
-            or "street" not in address
-            or "city" not in address
-            or "state" not in address
-        ):
-            raise ValidationError(
-                "address must contain 'street', 'city', and 'state'",
-                field_errors={"address": "Must contain 'street', 'city', and 'state'"},
-            )
+        _require_keys("account", account, _ACCOUNT_KEYS, "'number' and 'bank_code'")
+        _require_keys(
+            "address", address, _ADDRESS_KEYS, "'street', 'city', and 'state'"
+        )
 
         payload = {"account": account, "address": address}
 
-        return self.request(
-            "POST", f"customer/{customer_id}/initialize-direct-debit", json_data=payload
-        )
+        return self.request("POST", _DIRECT_DEBIT_PATH(customer_id), json_data=payload)
 
     def direct_debit_activation_charge(
         self, customer_id: str, authorization_id: int
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """Trigger an activation charge on an inactive mandate on behalf of your customer.
 
         Args:
@@ -305,7 +440,7 @@ class CustomersAPI(BaseClient):
             authorization_id (int): The authorization ID from the initiation response
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         self._validate_required_params(
             customer_id=customer_id, authorization_id=authorization_id
@@ -316,40 +451,81 @@ class CustomersAPI(BaseClient):
         # Note: This should be PUT method as per API docs
         return self.request(
             "PUT",
-            f"customer/{customer_id}/directdebit-activation-charge",
+            _ACTIVATION_CHARGE_PATH(customer_id),
             json_data=payload,
         )
 
+    def direct_debit_activation_charge_many(
+        self, mandates: Iterable[Tuple[str, int]], max_workers: int = 16
+    ) -> Dict[Tuple[str, int], Union[PaystackResponse, PaystackError]]:
+        """Trigger activation charges on several inactive mandates concurrently.
+
+        Calls run in parallel over the client's pooled session, so keep
+        ``max_workers`` at or below the client's ``pool_size``. Activation
+        charges are not idempotent, so one failure does not hide the others:
+        a mandate whose request raised maps to that exception instead.
+
+        Args:
+            mandates (Iterable[Tuple[str, int]]): ``(customer_id, authorization_id)``
+                pairs
+            max_workers (int): Maximum number of requests in flight at once
+
+        Returns:
+            Dict[Tuple[str, int], Union[PaystackResponse, PaystackError]]: Each pair
+                mapped to its response data and metadata, or to the exception its
+                request raised.
+        """
+        return self._fan_out(
+            {
+                (customer_id, authorization_id): partial(
+                    self.direct_debit_activation_charge,
+                    customer_id=customer_id,
+                    authorization_id=authorization_id,
+                )
+                for customer_id, authorization_id in mandates
+            },
+            max_workers=max_workers,
+            return_exceptions=True,
+        )
+
     def fetch_mandate_authorizations(
-        self, customer_id: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        self, customer_id: str, cache_ttl: Optional[float] = None
+    ) -> PaystackResponse:
         """Get the list of direct debit mandates associated with a customer.
 
         Args:
             customer_id (str): The ID of the customer
+            cache_ttl (Optional[float]): Seconds to reuse a cached response for
+                identical calls (disabled by default)
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        self._validate_required_params(customer_id=customer_id)
+        self._require("customer_id", customer_id)
         return self.request(
-            "GET", f"customer/{customer_id}/directdebit-mandate-authorizations"
+            "GET",
+            _MANDATE_AUTHORIZATIONS_PATH(customer_id),
+            cache_ttl=cache_ttl,
         )
 
-    def deactivate_authorization(
-        self, authorization_code: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def deactivate_authorization(self, authorization_code: str) -> PaystackResponse:
         """Deactivate an authorization for any payment channel.
 
         Args:
             authorization_code (str): Authorization code to be deactivated
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        self._validate_required_params(authorization_code=authorization_code)
+        self._require("authorization_code", authorization_code)
 
         payload = {"authorization_code": authorization_code}
         return self.request(
             "POST", "customer/authorization/deactivate", json_data=payload
         )
+
+
+class AsyncCustomersAPI(AsyncBaseClient, CustomersAPI):
+    """Asynchronous Customers API client; every method returns an awaitable."""
+
+    __slots__ = ()
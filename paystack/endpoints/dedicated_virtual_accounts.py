@@ -3,9 +3,17 @@ The Dedicated Virtual Account API enables Nigerian and Ghanaian merchants to man
 """
 
 import requests
-from typing import Optional, Dict, Any, Tuple
+from functools import partial
+from typing import Optional, Dict, Iterable
 
-from ..core import BaseClient
+from ..core import BaseClient, PaystackResponse
+from ..async_core import AsyncBaseClient
+
+_ACCOUNT_PATH = "dedicated_account/{}".format
+
+# Query parameter names, in the order the methods below take their values.
+_LIST_ACCOUNTS_PARAMS = ("active", "currency", "provider_slug", "bank_id", "customer")
+_REQUERY_PARAMS = ("account_number", "provider_slug", "date")
 
 
 class DedicatedVirtualAccountsAPI(BaseClient):
@@ -13,6 +21,8 @@ class DedicatedVirtualAccountsAPI(BaseClient):
     The Dedicated Virtual Account API enables Nigerian and Ghanaian merchants to manage unique payment accounts of their customers.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, secret_key: str, session: requests.Session = None, base_url: str = None
     ):
@@ -27,7 +37,7 @@ class DedicatedVirtualAccountsAPI(BaseClient):
         first_name: Optional[str] = None,
         last_name: Optional[str] = None,
         phone: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Create a dedicated virtual account for an existing customer
 
@@ -41,21 +51,20 @@ class DedicatedVirtualAccountsAPI(BaseClient):
             phone: Customer's phone number
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
-        """
-        payload = {"customer": customer}
-        if preferred_bank:
-            payload["preferred_bank"] = preferred_bank
-        if subaccount:
-            payload["subaccount"] = subaccount
-        if split_code:
-            payload["split_code"] = split_code
-        if first_name:
-            payload["first_name"] = first_name
-        if last_name:
-            payload["last_name"] = last_name
-        if phone:
-            payload["phone"] = phone
+            PaystackResponse: A named tuple containing the response data and metadata.
+        """
+        optional_fields = (
+            ("preferred_bank", preferred_bank),
+            ("subaccount", subaccount),
+            ("split_code", split_code),
+            ("first_name", first_name),
+            ("last_name", last_name),
+            ("phone", phone),
+        )
+        payload = {
+            "customer": customer,
+            **{k: v for k, v in optional_fields if v is not None},
+        }
 
         return self.request("POST", "dedicated_account", json_data=payload)
 
@@ -72,7 +81,7 @@ class DedicatedVirtualAccountsAPI(BaseClient):
         bank_code: Optional[str] = None,
         subaccount: Optional[str] = None,
         split_code: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         With this endpoint, you can create a customer, validate the customer, and assign a DVA to the customer.
 
@@ -90,8 +99,15 @@ class DedicatedVirtualAccountsAPI(BaseClient):
             split_code: Split code consisting of the lists of accounts you want to split the transaction with
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
+        optional_fields = (
+            ("account_number", account_number),
+            ("bvn", bvn),
+            ("bank_code", bank_code),
+            ("subaccount", subaccount),
+            ("split_code", split_code),
+        )
         payload = {
             "email": email,
             "first_name": first_name,
@@ -99,17 +115,8 @@ class DedicatedVirtualAccountsAPI(BaseClient):
             "phone": phone,
             "preferred_bank": preferred_bank,
             "country": country,
+            **{k: v for k, v in optional_fields if v is not None},
         }
-        if account_number:
-            payload["account_number"] = account_number
-        if bvn:
-            payload["bvn"] = bvn
-        if bank_code:
-            payload["bank_code"] = bank_code
-        if subaccount:
-            payload["subaccount"] = subaccount
-        if split_code:
-            payload["split_code"] = split_code
 
         return self.request("POST", "dedicated_account/assign", json_data=payload)
 
@@ -120,7 +127,7 @@ class DedicatedVirtualAccountsAPI(BaseClient):
         provider_slug: Optional[str] = None,
         bank_id: Optional[str] = None,
         customer: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         List dedicated virtual accounts available on your integration.
 
@@ -132,39 +139,72 @@ class DedicatedVirtualAccountsAPI(BaseClient):
             customer: The customer's ID
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
-        """
-        params = {}
-        if active is not None:
-            params["active"] = active
-        if currency:
-            params["currency"] = currency
-        if provider_slug:
-            params["provider_slug"] = provider_slug
-        if bank_id:
-            params["bank_id"] = bank_id
-        if customer:
-            params["customer"] = customer
+            PaystackResponse: A named tuple containing the response data and metadata.
+        """
+        values = (active, currency, provider_slug, bank_id, customer)
+        params = {
+            name: value
+            for name, value in zip(_LIST_ACCOUNTS_PARAMS, values)
+            if value is not None
+        }
 
         return self.request("GET", "dedicated_account", params=params)
 
     def fetch_dedicated_virtual_account(
-        self, dedicated_account_id: int
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        self, dedicated_account_id: int, cache_ttl: Optional[float] = None
+    ) -> PaystackResponse:
         """
         Get details of a dedicated virtual account on your integration.
 
         Args:
             dedicated_account_id: ID of dedicated virtual account
+            cache_ttl: Seconds to reuse a cached response for identical calls (disabled
+                by default)
+
+        Returns:
+            PaystackResponse: A named tuple containing the response data and metadata.
+        """
+        return self.request(
+            "GET", _ACCOUNT_PATH(dedicated_account_id), cache_ttl=cache_ttl
+        )
+
+    def fetch_many(
+        self,
+        dedicated_account_ids: Iterable[int],
+        max_workers: int = 16,
+        cache_ttl: Optional[float] = None,
+    ) -> Dict[int, PaystackResponse]:
+        """
+        Get details of several dedicated virtual accounts concurrently.
+
+        Calls run in parallel over the client's pooled session, so keep
+        ``max_workers`` at or below the client's ``pool_size``.
+
+        Args:
+            dedicated_account_ids: IDs of dedicated virtual accounts
+            max_workers: Maximum number of requests in flight at once
+            cache_ttl: Seconds to reuse a cached response for each account (disabled by
+                default)
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            Dict[int, PaystackResponse]: Each ID mapped to its response data and
+                metadata.
         """
-        return self.request("GET", f"dedicated_account/{dedicated_account_id}")
+        return self._fan_out(
+            {
+                account_id: partial(
+                    self.fetch_dedicated_virtual_account,
+                    dedicated_account_id=account_id,
+                    cache_ttl=cache_ttl,
+                )
+                for account_id in dedicated_account_ids
+            },
+            max_workers=max_workers,
+        )
 
     def requery_dedicated_account(
         self, account_number: str, provider_slug: str, date: Optional[str] = None
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Requery Dedicated Virtual Account for new transactions
 
@@ -174,20 +214,20 @@ class DedicatedVirtualAccountsAPI(BaseClient):
             date: The day the transfer was made in YYYY-MM-DD format
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
+        values = (account_number, provider_slug, date)
         params = {
-            "account_number": account_number,
-            "provider_slug": provider_slug,
+            name: value
+            for name, value in zip(_REQUERY_PARAMS, values)
+            if value is not None
         }
-        if date:
-            params["date"] = date
 
         return self.request("GET", "dedicated_account/requery", params=params)
 
     def deactivate_dedicated_account(
         self, dedicated_account_id: int
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Deactivate a dedicated virtual account on your integration.
 
@@ -195,9 +235,9 @@ class DedicatedVirtualAccountsAPI(BaseClient):
             dedicated_account_id: ID of dedicated virtual account
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        return self.request("DELETE", f"dedicated_account/{dedicated_account_id}")
+        return self.request("DELETE", _ACCOUNT_PATH(dedicated_account_id))
 
     def split_dedicated_account_transaction(
         self,
@@ -205,7 +245,7 @@ class DedicatedVirtualAccountsAPI(BaseClient):
         subaccount: Optional[str] = None,
         split_code: Optional[str] = None,
         preferred_bank: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Split a dedicated virtual account transaction with one or more accounts
 
@@ -216,21 +256,23 @@ class DedicatedVirtualAccountsAPI(BaseClient):
             preferred_bank: The bank slug for preferred bank. To get a list of available banks, use the List Providers endpoint
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        payload = {"customer": customer}
-        if subaccount:
-            payload["subaccount"] = subaccount
-        if split_code:
-            payload["split_code"] = split_code
-        if preferred_bank:
-            payload["preferred_bank"] = preferred_bank
+        optional_fields = (
+            ("subaccount", subaccount),
+            ("split_code", split_code),
+            ("preferred_bank", preferred_bank),
+        )
+        payload = {
+            "customer": customer,
+            **{k: v for k, v in optional_fields if v is not None},
+        }
 
         return self.request("POST", "dedicated_account/split", json_data=payload)
 
     def remove_split_from_dedicated_account(
         self, account_number: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         If you've previously set up split payment for transactions on a dedicated virtual account, you can remove it with this endpoint
 
@@ -238,16 +280,23 @@ class DedicatedVirtualAccountsAPI(BaseClient):
             account_number: Dedicated virtual account number
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {"account_number": account_number}
         return self.request("DELETE", "dedicated_account/split", json_data=payload)
 
-    def fetch_bank_providers(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def fetch_bank_providers(self) -> PaystackResponse:
         """
         Get available bank providers for a dedicated virtual account
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         return self.request("GET", "dedicated_account/available_providers")
+
+
+class AsyncDedicatedVirtualAccountsAPI(AsyncBaseClient, DedicatedVirtualAccountsAPI):
+    """Asynchronous Dedicated Virtual Accounts API client; every method returns an
+    awaitable."""
+
+    __slots__ = ()
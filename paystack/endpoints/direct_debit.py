@@ -3,9 +3,15 @@ The Direct Debit API allows you manage the authorization on your customer's bank
 """
 
 import requests
-from typing import Optional, List, Dict, Any, Tuple
+from functools import partial
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Union
 
-from ..core import BaseClient
+from ..core import BaseClient, PaystackResponse, _next_cursor
+from ..async_core import AsyncBaseClient
+from ..exceptions import PaystackError, ValidationError
+
+# Query parameter names, in the order list_mandate_authorizations takes their values.
+_LIST_MANDATES_PARAMS = ("cursor", "status", "perPage")
 
 
 class DirectDebitAPI(BaseClient):
@@ -13,14 +19,14 @@ class DirectDebitAPI(BaseClient):
     The Direct Debit API allows you manage the authorization on your customer's bank accounts.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, secret_key: str, session: requests.Session = None, base_url: str = None
     ):
         super().__init__(secret_key, session=session, base_url=base_url)
 
-    def trigger_activation_charge(
-        self, customer_ids: List[int]
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def trigger_activation_charge(self, customer_ids: List[int]) -> PaystackResponse:
         """
         Trigger an activation charge on pending mandates on behalf of your customers.
 
@@ -28,17 +34,58 @@ class DirectDebitAPI(BaseClient):
             customer_ids: An array of customer IDs with pending mandate authorizations.
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {"customer_ids": customer_ids}
         return self.request("PUT", "directdebit/activation-charge", json_data=payload)
 
+    def trigger_activation_charge_many(
+        self,
+        customer_ids: Sequence[int],
+        chunk_size: int = 100,
+        max_workers: int = 16,
+    ) -> Dict[int, Union[PaystackResponse, PaystackError]]:
+        """
+        Trigger activation charges for a large number of customers in concurrent
+        batches.
+
+        ``customer_ids`` is split into batches of ``chunk_size`` and each batch
+        is sent as its own request. Requests run in parallel over the client's
+        pooled session, so keep ``max_workers`` at or below the client's
+        ``pool_size``. Rate-limited batches are retried after ``Retry-After``.
+
+        Activation charges are not idempotent, so a failed batch does not hide
+        the others: every batch is sent, and a batch whose request raised maps
+        to that exception instead of a response. Batch ``i`` holds
+        ``customer_ids[i * chunk_size:(i + 1) * chunk_size]``.
+
+        Args:
+            customer_ids: Customer IDs with pending mandate authorizations.
+            chunk_size: Maximum number of customer IDs sent per request.
+            max_workers: Maximum number of requests in flight at once.
+
+        Returns:
+            Dict[int, Union[PaystackResponse, PaystackError]]: Each batch index
+                mapped to its response data and metadata, or to the exception its
+                request raised.
+        """
+        if chunk_size < 1:
+            raise ValidationError("chunk_size must be at least 1")
+        calls = {
+            index: partial(
+                self.trigger_activation_charge,
+                list(customer_ids[start : start + chunk_size]),
+            )
+            for index, start in enumerate(range(0, len(customer_ids), chunk_size))
+        }
+        return self._fan_out(calls, max_workers=max_workers, return_exceptions=True)
+
     def list_mandate_authorizations(
         self,
         cursor: Optional[str] = None,
         status: Optional[str] = None,
         per_page: Optional[int] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Get the list of direct debit mandates on your integration.
 
@@ -48,14 +95,40 @@ class DirectDebitAPI(BaseClient):
             per_page: The number of authorizations to fetch per request
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        params = {}
-        if cursor:
-            params["cursor"] = cursor
-        if status:
-            params["status"] = status
-        if per_page:
-            params["perPage"] = per_page
+        values = (cursor, status, per_page)
+        params = {
+            name: value
+            for name, value in zip(_LIST_MANDATES_PARAMS, values)
+            if value is not None
+        }
 
         return self.request("GET", "directdebit/mandate-authorizations", params=params)
+
+    def iter_mandate_authorizations(
+        self, status: Optional[str] = None, per_page: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every direct debit mandate, following the ``next`` cursor in ``meta``.
+
+        The next page is requested while the current one is being consumed. On
+        the async client, iterate with ``async for``.
+
+        Args:
+            status: Filter by the authorization status. Accepted values are: pending, active, revoked
+            per_page: The number of authorizations to fetch per request
+
+        Returns:
+            Iterator[Dict[str, Any]]: Each mandate authorization on the integration.
+        """
+        return self._paginate(
+            lambda cursor: self.list_mandate_authorizations(cursor, status, per_page),
+            _next_cursor,
+        )
+
+
+class AsyncDirectDebitAPI(AsyncBaseClient, DirectDebitAPI):
+    """Asynchronous Direct Debit API client; every method returns an awaitable."""
+
+    __slots__ = ()
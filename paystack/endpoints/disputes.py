@@ -2,10 +2,33 @@
 The Disputes API allows you manage transaction disputes.
 """
 
-import requests
-from typing import Optional, Dict, Any, Tuple, Union
-
-from ..core import BaseClient
+from functools import partial
+from typing import Optional, Dict, Any, Iterable, Iterator, Union
+
+from ..core import BaseClient, PaystackResponse, require
+from ..async_core import AsyncBaseClient
+
+# Path templates for endpoints that take a single path parameter
+_DISPUTE_PATH = "dispute/{}".format
+_TRANSACTION_DISPUTES_PATH = "dispute/transaction/{}".format
+_EVIDENCE_PATH = "dispute/{}/evidence".format
+_UPLOAD_URL_PATH = "dispute/{}/upload_url".format
+_RESOLVE_PATH = "dispute/{}/resolve".format
+
+
+def _dispute_params(from_date, to_date, per_page, page, transaction_id, status):
+    """Query string shared by the dispute list, stream and export endpoints."""
+    optional_fields = (
+        ("perPage", per_page),
+        ("page", page),
+        ("transaction", transaction_id),
+        ("status", status),
+    )
+    return {
+        "from": from_date,
+        "to": to_date,
+        **{k: v for k, v in optional_fields if v is not None},
+    }
 
 
 class DisputesAPI(BaseClient):
@@ -13,11 +36,9 @@ class DisputesAPI(BaseClient):
     The Disputes API allows you manage transaction disputes.
     """
 
-    def __init__(
-        self, secret_key: str, session: requests.Session = None, base_url: str = None
-    ):
-        super().__init__(secret_key, session=session, base_url=base_url)
+    __slots__ = ()
 
+    @require("from_date", "to_date")
     def list_disputes(
         self,
         from_date: str,
@@ -26,7 +47,7 @@ class DisputesAPI(BaseClient):
         page: Optional[int] = None,
         transaction_id: Optional[str] = None,
         status: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         List disputes filed against you.
 
@@ -39,29 +60,49 @@ class DisputesAPI(BaseClient):
             status: Dispute Status. Acceptable values: { awaiting-merchant-feedback | awaiting-bank-feedback | pending | resolved }
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        self._validate_required_params(from_date=from_date, to_date=to_date)
-        payload = {
-            "from": from_date,
-            "to": to_date,
-        }
-        if per_page:
-            payload["perPage"] = per_page
-        if page:
-            payload["page"] = page
-        if from_date:
-            payload["from"] = from_date
-        if to_date:
-            payload["to"] = to_date
-        if transaction_id:
-            payload["transaction"] = transaction_id
-        if status:
-            payload["status"] = status
-
-        return self.request("GET", "dispute", params=payload)
-
-    def fetch_dispute(self, dispute_id: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        params = _dispute_params(
+            from_date, to_date, per_page, page, transaction_id, status
+        )
+
+        return self.request("GET", "dispute", params=params)
+
+    @require("from_date", "to_date")
+    def stream_disputes(
+        self,
+        from_date: str,
+        to_date: str,
+        per_page: Optional[int] = None,
+        page: Optional[int] = None,
+        transaction_id: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the disputes on a page one at a time as the response is parsed.
+
+        Useful for large pages: disputes are available before the whole body has
+        been received and the raw body is never buffered. Requires the optional
+        ``stream`` extra (ijson). Pagination metadata is not returned; use
+        ``list_disputes`` when you need it.
+
+        Args:
+            from_date: A timestamp from which to start listing dispute e.g. 2016-09-21
+            to_date: A timestamp at which to stop listing dispute e.g. 2016-09-21
+            per_page: Specify how many records you want to retrieve per page. If not specify we use a default value of 50.
+            page: Specify exactly what dispute you want to page. If not specify we use a default value of 1.
+            transaction_id: Transaction Id
+            status: Dispute Status. Acceptable values: { awaiting-merchant-feedback | awaiting-bank-feedback | pending | resolved }
+
+        Returns:
+            Iterator[Dict[str, Any]]: The disputes on the requested page.
+        """
+        params = _dispute_params(
+            from_date, to_date, per_page, page, transaction_id, status
+        )
+        return self.request_stream("dispute", params=params)
+
+    def fetch_dispute(self, dispute_id: str) -> PaystackResponse:
         """
         Get more details about a dispute.
 
@@ -69,13 +110,36 @@ class DisputesAPI(BaseClient):
             dispute_id: The dispute ID you want to fetch
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
+        """
+        return self.request("GET", _DISPUTE_PATH(dispute_id))
+
+    def fetch_many(
+        self, dispute_ids: Iterable[str], max_workers: int = 16
+    ) -> Dict[str, PaystackResponse]:
+        """
+        Get more details about several disputes concurrently.
+
+        Calls run in parallel over the client's pooled session, so keep
+        ``max_workers`` at or below the client's ``pool_size``.
+
+        Args:
+            dispute_ids: The dispute IDs you want to fetch
+            max_workers: Maximum number of requests in flight at once
+
+        Returns:
+            Dict[str, PaystackResponse]: Each ID mapped to its response data and
+                metadata.
         """
-        return self.request("GET", f"dispute/{dispute_id}")
+        return self._fan_out(
+            {
+                dispute_id: partial(self.fetch_dispute, dispute_id)
+                for dispute_id in dispute_ids
+            },
+            max_workers=max_workers,
+        )
 
-    def list_transaction_disputes(
-        self, transaction_id: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def list_transaction_disputes(self, transaction_id: str) -> PaystackResponse:
         """
         This endpoint retrieves disputes for a particular transaction
 
@@ -83,16 +147,17 @@ class DisputesAPI(BaseClient):
             transaction_id: The transaction ID you want to fetch
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        return self.request("GET", f"dispute/transaction/{transaction_id}")
+        return self.request("GET", _TRANSACTION_DISPUTES_PATH(transaction_id))
 
+    @require("dispute_id", "refund_amount")
     def update_dispute(
         self,
         dispute_id: str,
         refund_amount: Union[int, str],
         uploaded_filename: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Update details of a dispute on your integration
 
@@ -102,17 +167,15 @@ class DisputesAPI(BaseClient):
             uploaded_filename: filename of attachment returned via response from upload url(GET /dispute/:id/upload_url)
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        self._validate_required_params(
-            dispute_id=dispute_id, refund_amount=refund_amount
-        )
         payload = {"refund_amount": refund_amount}
-        if uploaded_filename:
+        if uploaded_filename is not None:
             payload["uploaded_filename"] = uploaded_filename
 
-        return self.request("PUT", f"dispute/{dispute_id}", json_data=payload)
+        return self.request("PUT", _DISPUTE_PATH(dispute_id), json_data=payload)
 
+    @require("customer_email", "customer_name", "customer_phone", "service_details")
     def add_evidence(
         self,
         dispute_id: str,
@@ -122,7 +185,7 @@ class DisputesAPI(BaseClient):
         service_details: str,
         delivery_address: Optional[str] = None,
         delivery_date: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Provide evidence for a dispute
 
@@ -136,30 +199,24 @@ class DisputesAPI(BaseClient):
             delivery_date: ISO 8601 representation of delivery date (YYYY-MM-DD)
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        self._validate_required_params(
-            customer_email=customer_email,
-            customer_name=customer_name,
-            customer_phone=customer_phone,
-            service_details=service_details,
+        optional_fields = (
+            ("delivery_address", delivery_address),
+            ("delivery_date", delivery_date),
         )
         payload = {
             "customer_email": customer_email,
             "customer_name": customer_name,
             "customer_phone": customer_phone,
             "service_details": service_details,
+            **{k: v for k, v in optional_fields if v is not None},
         }
-        if delivery_address:
-            payload["delivery_address"] = delivery_address
-        if delivery_date:
-            payload["delivery_date"] = delivery_date
 
-        return self.request("POST", f"dispute/{dispute_id}/evidence", json_data=payload)
+        return self.request("POST", _EVIDENCE_PATH(dispute_id), json_data=payload)
 
-    def get_upload_url(
-        self, dispute_id: str, upload_filename: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    @require("dispute_id", "upload_filename")
+    def get_upload_url(self, dispute_id: str, upload_filename: str) -> PaystackResponse:
         """
         This endpoint retrieves disputes for a particular transaction
 
@@ -168,14 +225,14 @@ class DisputesAPI(BaseClient):
             upload_filename: The file name, with its extension, that you want to upload. e.g filename.pdf
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        self._validate_required_params(
-            dispute_id=dispute_id, upload_filename=upload_filename
-        )
         params = {"upload_filename": upload_filename}
-        return self.request("GET", f"dispute/{dispute_id}/upload_url", params=params)
+        return self.request("GET", _UPLOAD_URL_PATH(dispute_id), params=params)
 
+    @require(
+        "dispute_id", "resolution", "message", "refund_amount", "uploaded_filename"
+    )
     def resolve_dispute(
         self,
         dispute_id: str,
@@ -184,7 +241,7 @@ class DisputesAPI(BaseClient):
         refund_amount: Union[int, str],
         uploaded_filename: str,
         evidence: Optional[int] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Resolve a dispute on your integration
 
@@ -197,25 +254,18 @@ class DisputesAPI(BaseClient):
             evidence: Evidence Id for fraud claims
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        self._validate_required_params(
-            dispute_id=dispute_id,
-            resolution=resolution,
-            message=message,
-            refund_amount=refund_amount,
-            uploaded_filename=uploaded_filename,
-        )
         payload = {
             "resolution": resolution,
             "message": message,
             "refund_amount": refund_amount,
             "uploaded_filename": uploaded_filename,
         }
-        if evidence:
+        if evidence is not None:
             payload["evidence"] = evidence
 
-        return self.request("PUT", f"dispute/{dispute_id}/resolve", json_data=payload)
+        return self.request("PUT", _RESOLVE_PATH(dispute_id), json_data=payload)
 
     def export_disputes(
         self,
@@ -225,10 +275,14 @@ class DisputesAPI(BaseClient):
         page: Optional[int] = None,
         transaction_id: Optional[str] = None,
         status: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Export disputes available on your integration
 
+        Paystack prepares the export as a file and responds with a link to it, so
+        the response stays small however many disputes match. To read matching
+        disputes record by record instead, use ``stream_disputes``.
+
         Args:
             per_page: Specify how many records you want to retrieve per page. If not specify we use a default value of 50.
             page: Specify exactly what dispute you want to page. If not specify we use a default value of 1.
@@ -238,19 +292,16 @@ class DisputesAPI(BaseClient):
             status: Dispute Status. Acceptable values: { awaiting-merchant-feedback | awaiting-bank-feedback | pending | resolved }
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        payload = {
-            "from": from_date,
-            "to": to_date,
-        }
-        if per_page:
-            payload["perPage"] = per_page
-        if page:
-            payload["page"] = page
-        if transaction_id:
-            payload["transaction"] = transaction_id
-        if status:
-            payload["status"] = status
-
-        return self.request("GET", "dispute/export", params=payload)
+        params = _dispute_params(
+            from_date, to_date, per_page, page, transaction_id, status
+        )
+
+        return self.request("GET", "dispute/export", params=params)
+
+
+class AsyncDisputesAPI(AsyncBaseClient, DisputesAPI):
+    """Asynchronous Disputes API client; every method returns an awaitable."""
+
+    __slots__ = ()
@@ -1,18 +1,27 @@
 # miscellaneous.py
-import requests
-from typing import Optional, Union, Dict, Any, Tuple
-from ..core import BaseClient
+from typing import Optional, Union
+from ..core import BaseClient, PaystackResponse, require
 from ..exceptions import APIError
 
+_VALID_COUNTRIES = frozenset(("ghana", "kenya", "nigeria", "south africa"))
+_VALID_GATEWAYS = frozenset(("emandate", "digitalbankmandate"))
+_VALID_TYPES = frozenset(("mobile_money", "ghipps"))
+
+_COUNTRY_ERROR = "country must be one of: ghana, kenya, nigeria, south africa"
+_GATEWAY_ERROR = "gateway must be one of: emandate, digitalbankmandate"
+_TYPE_ERROR = "type must be one of: mobile_money, ghipps"
+_PER_PAGE_ERROR = "per_page must be between 1 and 100"
+
+# Query-string spelling of boolean filters; other values go through str().lower()
+_BOOL_STR = {True: "true", False: "false"}
+
 
 class MiscellaneousAPI(BaseClient):
     """Miscellaneous API client for supporting APIs that provide additional details to other APIs."""
 
-    def __init__(
-        self, secret_key: str, session: requests.Session = None, base_url: str = None
-    ):
-        super().__init__(secret_key, session=session, base_url=base_url)
+    __slots__ = ()
 
+    @require("country", "use_cursor", "per_page")
     def list_banks(
         self,
         country: str,
@@ -27,7 +36,8 @@ class MiscellaneousAPI(BaseClient):
         type: Optional[str] = None,
         currency: Optional[str] = None,
         include_nip_sort_code: Optional[bool] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        cache_ttl: Optional[float] = None,
+    ) -> PaystackResponse:
         """Get a list of all supported banks and their properties.
 
         Args:
@@ -45,54 +55,52 @@ class MiscellaneousAPI(BaseClient):
             type (Optional[str]): Type of financial channel. For Ghana: 'mobile_money' or 'ghipps'
             currency (Optional[str]): One of the supported currency codes
             include_nip_sort_code (Optional[bool]): Flag to return Nigerian banks with NIP institution code
+            cache_ttl (Optional[float]): Seconds to reuse a cached response for
+                identical calls (disabled by default)
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Raises:
             APIError: If country value is invalid or per_page exceeds limits
         """
-        self._validate_required_params(
-            country=country, use_cursor=use_cursor, per_page=per_page
-        )
-
         payload = {}
 
         if country:
-            valid_countries = ["ghana", "kenya", "nigeria", "south africa"]
-            if country.lower() not in valid_countries:
-                raise APIError(f"country must be one of: {', '.join(valid_countries)}")
-            payload["country"] = country.lower()
+            country = country.lower()
+            if country not in _VALID_COUNTRIES:
+                raise APIError(_COUNTRY_ERROR)
+            payload["country"] = country
 
         if per_page is not None:
-            if per_page <= 0 or per_page > 100:
-                raise APIError("per_page must be between 1 and 100")
+            if not 0 < per_page <= 100:
+                raise APIError(_PER_PAGE_ERROR)
             payload["perPage"] = per_page
 
         if gateway:
-            valid_gateways = ["emandate", "digitalbankmandate"]
-            if gateway not in valid_gateways:
-                raise APIError(f"gateway must be one of: {', '.join(valid_gateways)}")
+            if gateway not in _VALID_GATEWAYS:
+                raise APIError(_GATEWAY_ERROR)
             payload["gateway"] = gateway
 
         # Validate type parameter for Ghana if provided
         if type:
-            valid_types = ["mobile_money", "ghipps"]
-            if type not in valid_types:
-                raise APIError(f"type must be one of: {', '.join(valid_types)}")
+            if type not in _VALID_TYPES:
+                raise APIError(_TYPE_ERROR)
             payload["type"] = type
 
         # Add boolean parameters
-        if use_cursor is not None:
-            payload["use_cursor"] = str(use_cursor).lower()
-        if pay_with_bank_transfer is not None:
-            payload["pay_with_bank_transfer"] = str(pay_with_bank_transfer).lower()
-        if pay_with_bank is not None:
-            payload["pay_with_bank"] = str(pay_with_bank).lower()
-        if enabled_for_verification is not None:
-            payload["enabled_for_verification"] = str(enabled_for_verification).lower()
-        if include_nip_sort_code is not None:
-            payload["include_nip_sort_code"] = str(include_nip_sort_code).lower()
+        bool_fields = (
+            ("use_cursor", use_cursor),
+            ("pay_with_bank_transfer", pay_with_bank_transfer),
+            ("pay_with_bank", pay_with_bank),
+            ("enabled_for_verification", enabled_for_verification),
+            ("include_nip_sort_code", include_nip_sort_code),
+        )
+        payload.update(
+            (k, _BOOL_STR[v] if isinstance(v, bool) else str(v).lower())
+            for k, v in bool_fields
+            if v is not None
+        )
 
         # Add cursor parameters
         if next_cursor:
@@ -104,52 +112,58 @@ class MiscellaneousAPI(BaseClient):
         if currency:
             payload["currency"] = currency
 
-        return self.request("GET", "bank", params=payload)
+        return self.request("GET", "bank", params=payload, cache_ttl=cache_ttl)
 
-    def list_countries(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def list_countries(self, cache_ttl: Optional[float] = None) -> PaystackResponse:
         """Get a list of countries that Paystack currently supports.
 
+        Args:
+            cache_ttl (Optional[float]): Seconds to reuse a cached response (disabled by
+                default)
+
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Note:
             This endpoint has no parameters - it returns all supported countries
         """
-        return self.request("GET", "country")
+        return self.request("GET", "country", cache_ttl=cache_ttl)
 
+    @require("country")
     def list_states(
-        self, country: Union[str, int]
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        self, country: Union[str, int], cache_ttl: Optional[float] = None
+    ) -> PaystackResponse:
         """Get a list of states for a country for address verification.
 
         Args:
             country (Union[str, int]): The country code of the states to list.
                                      This is obtained after a charge request and can be
                                      either a country code string (e.g., 'CA') or integer ID
+            cache_ttl (Optional[float]): Seconds to reuse a cached response for
+                identical calls (disabled by default)
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Raises:
             APIError: If country parameter is not provided
         """
-        # Validate required parameter
-        self._validate_required_params(country=country)
-
         params = {"country": str(country)}
 
-        return self.request("GET", "address_verification/states", params=params)
+        return self.request(
+            "GET", "address_verification/states", params=params, cache_ttl=cache_ttl
+        )
 
     def get_nigerian_banks(
         self, include_nip_sort_code: bool = False
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """Convenience method to get all Nigerian banks.
 
         Args:
             include_nip_sort_code (bool): Whether to include NIP institution codes
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         return self.list_banks(
             country="nigeria",
@@ -160,51 +174,47 @@ class MiscellaneousAPI(BaseClient):
 
     def get_ghanaian_mobile_money_providers(
         self,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """Convenience method to get Ghanaian mobile money providers.
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         return self.list_banks(
             country="ghana", use_cursor=False, per_page=50, type="mobile_money"
         )
 
-    def get_ghanaian_banks(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def get_ghanaian_banks(self) -> PaystackResponse:
         """Convenience method to get Ghanaian banks.
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         return self.list_banks(
             country="ghana", use_cursor=False, per_page=50, type="ghipps"
         )
 
-    def get_banks_for_transfer(
-        self, country: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def get_banks_for_transfer(self, country: str) -> PaystackResponse:
         """Convenience method to get banks that support bank transfers.
 
         Args:
             country (Optional[str]): Country to filter by
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         return self.list_banks(
             country=country, use_cursor=False, per_page=50, pay_with_bank_transfer=True
         )
 
-    def get_banks_for_direct_payment(
-        self, country: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def get_banks_for_direct_payment(self, country: str) -> PaystackResponse:
         """Convenience method to get banks that support direct payments.
 
         Args:
             country (Optional[str]): Country to filter by
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         return self.list_banks(
             country=country, use_cursor=False, per_page=50, pay_with_bank=True
@@ -212,14 +222,14 @@ class MiscellaneousAPI(BaseClient):
 
     def get_south_african_verification_banks(
         self, currency: Optional[str] = None
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """Convenience method to get South African banks that support account verification.
 
         Args:
             currency (Optional[str]): Currency to filter by
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         return self.list_banks(
             country="south africa",
@@ -3,9 +3,9 @@ The Payment Pages API provides a quick and secure way to collect payment for pro
 """
 
 import requests
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any
 
-from ..core import BaseClient
+from ..core import BaseClient, PaystackResponse
 
 
 class PaymentPagesAPI(BaseClient):
@@ -13,6 +13,8 @@ class PaymentPagesAPI(BaseClient):
     The Payment Pages API provides a quick and secure way to collect payment for products.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, secret_key: str, session: requests.Session = None, base_url: str = None
     ):
@@ -35,7 +37,7 @@ class PaymentPagesAPI(BaseClient):
         notification_email: Optional[str] = None,
         collect_phone: Optional[bool] = None,
         custom_fields: Optional[List[Dict[str, Any]]] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Create a payment page on your integration
 
@@ -57,12 +59,12 @@ class PaymentPagesAPI(BaseClient):
             custom_fields: If you would like to accept custom fields, specify them here.
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {"name": name}
         if description:
             payload["description"] = description
-        if amount:
+        if amount is not None:
             payload["amount"] = amount
         if currency:
             payload["currency"] = currency
@@ -97,7 +99,7 @@ class PaymentPagesAPI(BaseClient):
         page: Optional[int] = None,
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         List payment pages available on your integration
 
@@ -108,12 +110,12 @@ class PaymentPagesAPI(BaseClient):
             to_date: A timestamp at which to stop listing page e.g. 2016-09-24T00:00:05.000Z, 2016-09-21
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         params = {}
-        if per_page:
+        if per_page is not None:
             params["perPage"] = per_page
-        if page:
+        if page is not None:
             params["page"] = page
         if from_date:
             params["from"] = from_date
@@ -122,9 +124,7 @@ class PaymentPagesAPI(BaseClient):
 
         return self.request("GET", "page", params=params)
 
-    def fetch_payment_page(
-        self, id_or_slug: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def fetch_payment_page(self, id_or_slug: str) -> PaystackResponse:
         """
         Get details of a payment page on your integration
 
@@ -132,7 +132,7 @@ class PaymentPagesAPI(BaseClient):
             id_or_slug: The page ID or slug you want to fetch
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         return self.request("GET", f"page/{id_or_slug}")
 
@@ -143,7 +143,7 @@ class PaymentPagesAPI(BaseClient):
         description: Optional[str] = None,
         amount: Optional[int] = None,
         active: Optional[bool] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Update a payment page details on your integration
 
@@ -155,23 +155,21 @@ class PaymentPagesAPI(BaseClient):
             active: Set to false to deactivate page url
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {}
         if name:
             payload["name"] = name
         if description:
             payload["description"] = description
-        if amount:
+        if amount is not None:
             payload["amount"] = amount
         if active is not None:
             payload["active"] = active
 
         return self.request("PUT", f"page/{id_or_slug}", json_data=payload)
 
-    def check_slug_availability(
-        self, slug: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def check_slug_availability(self, slug: str) -> PaystackResponse:
         """
         Check the availability of a slug for a payment page
 
@@ -179,13 +177,11 @@ class PaymentPagesAPI(BaseClient):
             slug: URL slug to be confirmed
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         return self.request("GET", f"page/check_slug_availability/{slug}")
 
-    def add_products(
-        self, page_id: int, product_ids: List[int]
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def add_products(self, page_id: int, product_ids: List[int]) -> PaystackResponse:
         """
         Add products to a payment page
 
@@ -194,7 +190,7 @@ class PaymentPagesAPI(BaseClient):
             product_ids: Ids of all the products
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {"product": product_ids}
         return self.request("POST", f"page/{page_id}/product", json_data=payload)
@@ -3,9 +3,9 @@ The Payment Requests API allows you manage requests for payment of goods and ser
 """
 
 import requests
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any
 
-from ..core import BaseClient
+from ..core import BaseClient, PaystackResponse
 
 
 class PaymentRequestsAPI(BaseClient):
@@ -13,6 +13,8 @@ class PaymentRequestsAPI(BaseClient):
     The Payment Requests API allows you manage requests for payment of goods and services.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, secret_key: str, session: requests.Session = None, base_url: str = None
     ):
@@ -32,7 +34,7 @@ class PaymentRequestsAPI(BaseClient):
         has_invoice: Optional[bool] = None,
         invoice_number: Optional[int] = None,
         split_code: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Create a payment request for a transaction on your integration
 
@@ -51,10 +53,10 @@ class PaymentRequestsAPI(BaseClient):
             split_code: The split code of the transaction split. e.g. SPL_98WF13Eb3w
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {"customer": customer}
-        if amount:
+        if amount is not None:
             payload["amount"] = amount
         if due_date:
             payload["due_date"] = due_date
@@ -89,7 +91,7 @@ class PaymentRequestsAPI(BaseClient):
         include_archive: Optional[str] = None,
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         List the payment requests available on your integration
 
@@ -104,12 +106,12 @@ class PaymentRequestsAPI(BaseClient):
             to_date: A timestamp at which to stop listing payment requests e.g. 2016-09-24T00:00:05.000Z, 2016-09-21
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         params = {}
-        if per_page:
+        if per_page is not None:
             params["perPage"] = per_page
-        if page:
+        if page is not None:
             params["page"] = page
         if customer:
             params["customer"] = customer
@@ -126,9 +128,7 @@ class PaymentRequestsAPI(BaseClient):
 
         return self.request("GET", "paymentrequest", params=params)
 
-    def fetch_payment_request(
-        self, id_or_code: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def fetch_payment_request(self, id_or_code: str) -> PaystackResponse:
         """
         Get details of a payment request on your integration
 
@@ -136,13 +136,11 @@ class PaymentRequestsAPI(BaseClient):
             id_or_code: The payment request ID or code you want to fetch
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         return self.request("GET", f"paymentrequest/{id_or_code}")
 
-    def verify_payment_request(
-        self, code: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def verify_payment_request(self, code: str) -> PaystackResponse:
         """
         Verify details of a payment request on your integration
 
@@ -150,11 +148,11 @@ class PaymentRequestsAPI(BaseClient):
             code: Payment Request code
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         return self.request("GET", f"paymentrequest/verify/{code}")
 
-    def send_notification(self, code: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def send_notification(self, code: str) -> PaystackResponse:
         """
         Send notification of a payment request to your customers
 
@@ -162,22 +160,22 @@ class PaymentRequestsAPI(BaseClient):
             code: Payment Request code
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         return self.request("POST", f"paymentrequest/notify/{code}")
 
-    def payment_request_total(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def payment_request_total(self) -> PaystackResponse:
         """
         Get payment requests metric
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         return self.request("GET", "paymentrequest/totals")
 
     def finalize_payment_request(
         self, code: str, send_notification: Optional[bool] = None
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Finalize a draft payment request
 
@@ -186,7 +184,7 @@ class PaymentRequestsAPI(BaseClient):
             send_notification: Indicates whether Paystack sends an email notification to customer. Defaults to true
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {}
         if send_notification is not None:
@@ -210,7 +208,7 @@ class PaymentRequestsAPI(BaseClient):
         draft: Optional[bool] = None,
         invoice_number: Optional[int] = None,
         split_code: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Update a payment request details on your integration
 
@@ -229,12 +227,12 @@ class PaymentRequestsAPI(BaseClient):
             split_code: The split code of the transaction split. e.g. SPL_98WF13Eb3w
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {}
         if customer:
             payload["customer"] = customer
-        if amount:
+        if amount is not None:
             payload["amount"] = amount
         if due_date:
             payload["due_date"] = due_date
@@ -257,9 +255,7 @@ class PaymentRequestsAPI(BaseClient):
 
         return self.request("PUT", f"paymentrequest/{id_or_code}", json_data=payload)
 
-    def archive_payment_request(
-        self, code: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def archive_payment_request(self, code: str) -> PaystackResponse:
         """
         Used to archive a payment request. A payment request will no longer be fetched on list or returned on verify
 
@@ -267,6 +263,6 @@ class PaymentRequestsAPI(BaseClient):
             code: Payment Request code
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         return self.request("POST", f"paymentrequest/archive/{code}")
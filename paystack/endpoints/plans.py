@@ -2,10 +2,13 @@
 The Plans API allows you create and manage installment payment options on your integration.
 """
 
-import requests
-from typing import Optional, Dict, Any, Tuple, Union
+from functools import partial
+from typing import Optional, Dict, Iterable, Union
 
-from ..core import BaseClient
+from ..core import BaseClient, PaystackResponse
+from ..async_core import AsyncBaseClient
+
+_PLAN_PATH = "plan/{}".format
 
 
 class PlansAPI(BaseClient):
@@ -13,10 +16,7 @@ class PlansAPI(BaseClient):
     The Plans API allows you create and manage installment payment options on your integration.
     """
 
-    def __init__(
-        self, secret_key: str, session: requests.Session = None, base_url: str = None
-    ):
-        super().__init__(secret_key, session=session, base_url=base_url)
+    __slots__ = ()
 
     def create_plan(
         self,
@@ -28,7 +28,7 @@ class PlansAPI(BaseClient):
         send_sms: Optional[bool] = None,
         currency: Optional[str] = None,
         invoice_limit: Optional[int] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Create a plan on your integration
 
@@ -43,23 +43,21 @@ class PlansAPI(BaseClient):
             invoice_limit: Number of invoices to raise during subscription to this plan. Can be overridden by specifying an invoice_limit while subscribing.
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
+        optional_fields = (
+            ("description", description),
+            ("send_invoices", send_invoices),
+            ("send_sms", send_sms),
+            ("currency", currency),
+            ("invoice_limit", invoice_limit),
+        )
         payload = {
             "name": name,
             "amount": amount,
             "interval": interval,
+            **{k: v for k, v in optional_fields if v is not None},
         }
-        if description:
-            payload["description"] = description
-        if send_invoices is not None:
-            payload["send_invoices"] = send_invoices
-        if send_sms is not None:
-            payload["send_sms"] = send_sms
-        if currency:
-            payload["currency"] = currency
-        if invoice_limit:
-            payload["invoice_limit"] = invoice_limit
 
         return self.request("POST", "plan", json_data=payload)
 
@@ -70,7 +68,7 @@ class PlansAPI(BaseClient):
         status: Optional[str] = None,
         interval: Optional[str] = None,
         amount: Optional[Union[int, str]] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         List plans available on your integration
 
@@ -82,33 +80,59 @@ class PlansAPI(BaseClient):
             amount: Filter list by plans with specified amount using the supported currency
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        params = {}
-        if per_page:
-            params["perPage"] = per_page
-        if page:
-            params["page"] = page
-        if status:
-            params["status"] = status
-        if interval:
-            params["interval"] = interval
-        if amount:
-            params["amount"] = amount
+        fields = (
+            ("perPage", per_page),
+            ("page", page),
+            ("status", status),
+            ("interval", interval),
+            ("amount", amount),
+        )
+        params = {k: v for k, v in fields if v is not None}
 
         return self.request("GET", "plan", params=params)
 
-    def fetch_plan(self, id_or_code: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def fetch_plan(
+        self, id_or_code: str, cache_ttl: Optional[float] = None
+    ) -> PaystackResponse:
         """
         Get details of a plan on your integration
 
         Args:
             id_or_code: The plan ID or code you want to fetch
+            cache_ttl: Seconds to reuse a cached response for identical calls (disabled
+                by default)
+
+        Returns:
+            PaystackResponse: A named tuple containing the response data and metadata.
+        """
+        return self.request("GET", _PLAN_PATH(id_or_code), cache_ttl=cache_ttl)
+
+    def fetch_many(
+        self, ids_or_codes: Iterable[str], max_workers: int = 16
+    ) -> Dict[str, PaystackResponse]:
+        """
+        Get details of several plans on your integration concurrently.
+
+        Calls run in parallel over the client's pooled session, so keep
+        ``max_workers`` at or below the client's ``pool_size``.
+
+        Args:
+            ids_or_codes: The plan IDs or codes you want to fetch
+            max_workers: Maximum number of requests in flight at once
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            Dict[str, PaystackResponse]: Each ID or code mapped to its response data and
+                metadata.
         """
-        return self.request("GET", f"plan/{id_or_code}")
+        return self._fan_out(
+            {
+                id_or_code: partial(self.fetch_plan, id_or_code)
+                for id_or_code in ids_or_codes
+            },
+            max_workers=max_workers,
+        )
 
     def update_plan(
         self,
@@ -122,7 +146,7 @@ class PlansAPI(BaseClient):
         currency: Optional[str] = None,
         invoice_limit: Optional[int] = None,
         update_existing_subscriptions: Optional[bool] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Update a plan details on your integration
 
@@ -139,26 +163,25 @@ class PlansAPI(BaseClient):
             update_existing_subscriptions: Set to true if you want the existing subscriptions to use the new changes. Set to false and only new subscriptions will be changed. Defaults to true when not set.
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        payload = {}
-        if name:
-            payload["name"] = name
-        if amount:
-            payload["amount"] = amount
-        if interval:
-            payload["interval"] = interval
-        if description:
-            payload["description"] = description
-        if send_invoices is not None:
-            payload["send_invoices"] = send_invoices
-        if send_sms is not None:
-            payload["send_sms"] = send_sms
-        if currency:
-            payload["currency"] = currency
-        if invoice_limit:
-            payload["invoice_limit"] = invoice_limit
-        if update_existing_subscriptions is not None:
-            payload["update_existing_subscriptions"] = update_existing_subscriptions
-
-        return self.request("PUT", f"plan/{id_or_code}", json_data=payload)
+        fields = (
+            ("name", name),
+            ("amount", amount),
+            ("interval", interval),
+            ("description", description),
+            ("send_invoices", send_invoices),
+            ("send_sms", send_sms),
+            ("currency", currency),
+            ("invoice_limit", invoice_limit),
+            ("update_existing_subscriptions", update_existing_subscriptions),
+        )
+        payload = {k: v for k, v in fields if v is not None}
+
+        return self.request("PUT", _PLAN_PATH(id_or_code), json_data=payload)
+
+
+class AsyncPlansAPI(AsyncBaseClient, PlansAPI):
+    """Asynchronous Plans API client; every method returns an awaitable."""
+
+    __slots__ = ()
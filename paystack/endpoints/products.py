@@ -2,10 +2,12 @@
 The Products API allows you create and manage inventories on your integration.
 """
 
-import requests
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Iterator
 
-from ..core import BaseClient
+from ..core import BaseClient, PaystackResponse, _next_page
+from ..async_core import AsyncBaseClient
+
+_PRODUCT_PATH = "product/{}".format
 
 
 class ProductsAPI(BaseClient):
@@ -13,10 +15,7 @@ class ProductsAPI(BaseClient):
     The Products API allows you create and manage inventories on your integration.
     """
 
-    def __init__(
-        self, secret_key: str, session: requests.Session = None, base_url: str = None
-    ):
-        super().__init__(secret_key, session=session, base_url=base_url)
+    __slots__ = ()
 
     def create_product(
         self,
@@ -26,7 +25,7 @@ class ProductsAPI(BaseClient):
         currency: str,
         unlimited: Optional[bool] = None,
         quantity: Optional[int] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Create a product on your integration
 
@@ -39,18 +38,19 @@ class ProductsAPI(BaseClient):
             quantity: Number of products in stock. Use if unlimited is false
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
+        optional_fields = (
+            ("unlimited", unlimited),
+            ("quantity", quantity),
+        )
         payload = {
             "name": name,
             "description": description,
             "price": price,
             "currency": currency,
+            **{k: v for k, v in optional_fields if v is not None},
         }
-        if unlimited is not None:
-            payload["unlimited"] = unlimited
-        if quantity:
-            payload["quantity"] = quantity
 
         return self.request("POST", "product", json_data=payload)
 
@@ -60,7 +60,7 @@ class ProductsAPI(BaseClient):
         page: Optional[int] = None,
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         List products available on your integration
 
@@ -71,31 +71,59 @@ class ProductsAPI(BaseClient):
             to_date: A timestamp at which to stop listing product e.g. 2016-09-24T00:00:05.000Z, 2016-09-21
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        params = {}
-        if per_page:
-            params["perPage"] = per_page
-        if page:
-            params["page"] = page
-        if from_date:
-            params["from"] = from_date
-        if to_date:
-            params["to"] = to_date
+        fields = (
+            ("perPage", per_page),
+            ("page", page),
+            ("from", from_date),
+            ("to", to_date),
+        )
+        params = {k: v for k, v in fields if v is not None}
 
         return self.request("GET", "product", params=params)
 
-    def fetch_product(self, product_id: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def iter_products(
+        self,
+        per_page: int = 50,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every product across all pages.
+
+        The next page is requested while the current one is being consumed. On
+        the async client, iterate with ``async for``.
+
+        Args:
+            per_page: Number of records fetched per request (default: 50)
+            from_date: A timestamp from which to start listing product e.g. 2016-09-24T00:00:05.000Z, 2016-09-21
+            to_date: A timestamp at which to stop listing product e.g. 2016-09-24T00:00:05.000Z, 2016-09-21
+
+        Returns:
+            Iterator[Dict[str, Any]]: Each product on the integration.
+        """
+        return self._paginate(
+            lambda page: self.list_products(per_page, page, from_date, to_date),
+            _next_page,
+            start=1,
+        )
+
+    def fetch_product(
+        self, product_id: str, cache_ttl: Optional[float] = None
+    ) -> PaystackResponse:
         """
         Get details of a product on your integration
 
         Args:
             product_id: The product ID you want to fetch
+            cache_ttl: Seconds to reuse a cached response for identical calls (disabled
+                by default)
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        return self.request("GET", f"product/{product_id}")
+        return self.request("GET", _PRODUCT_PATH(product_id), cache_ttl=cache_ttl)
 
     def update_product(
         self,
@@ -106,7 +134,7 @@ class ProductsAPI(BaseClient):
         currency: Optional[str] = None,
         unlimited: Optional[bool] = None,
         quantity: Optional[int] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Update a product details on your integration
 
@@ -120,20 +148,22 @@ class ProductsAPI(BaseClient):
             quantity: Number of products in stock. Use if unlimited is false
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        payload = {}
-        if name:
-            payload["name"] = name
-        if description:
-            payload["description"] = description
-        if price:
-            payload["price"] = price
-        if currency:
-            payload["currency"] = currency
-        if unlimited is not None:
-            payload["unlimited"] = unlimited
-        if quantity:
-            payload["quantity"] = quantity
-
-        return self.request("PUT", f"product/{product_id}", json_data=payload)
+        fields = (
+            ("name", name),
+            ("description", description),
+            ("price", price),
+            ("currency", currency),
+            ("unlimited", unlimited),
+            ("quantity", quantity),
+        )
+        payload = {k: v for k, v in fields if v is not None}
+
+        return self.request("PUT", _PRODUCT_PATH(product_id), json_data=payload)
+
+
+class AsyncProductsAPI(AsyncBaseClient, ProductsAPI):
+    """Asynchronous Products API client; every method returns an awaitable."""
+
+    __slots__ = ()
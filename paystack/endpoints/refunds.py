@@ -1,13 +1,15 @@
 # refund.py
 import requests
-from typing import Optional, Union, Dict, Any, Tuple
-from ..core import BaseClient
+from typing import Optional, Union
+from ..core import BaseClient, PaystackResponse
 from ..exceptions import APIError
 
 
 class RefundsAPI(BaseClient):
     """Refund API client for creating and managing transaction refunds."""
 
+    __slots__ = ()
+
     def __init__(
         self, secret_key: str, session: requests.Session = None, base_url: str = None
     ):
@@ -20,7 +22,7 @@ class RefundsAPI(BaseClient):
         currency: Optional[str] = None,
         customer_note: Optional[str] = None,
         merchant_note: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """Initiate a refund on your integration.
 
         Args:
@@ -32,12 +34,12 @@ class RefundsAPI(BaseClient):
             merchant_note (Optional[str]): Internal merchant reason for the refund
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Raises:
             APIError: If transaction parameter is not provided
         """
-        self._validate_required_params(transaction=transaction)
+        self._require("transaction", transaction)
 
         payload = {"transaction": str(transaction)}
 
@@ -62,7 +64,7 @@ class RefundsAPI(BaseClient):
         to_date: Optional[str] = None,
         per_page: Optional[int] = None,
         page: Optional[int] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """List refunds available on your integration.
 
         Args:
@@ -74,7 +76,7 @@ class RefundsAPI(BaseClient):
             page (Optional[int]): Page number to retrieve (default: 1)
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Raises:
             APIError: If per_page or page parameters are invalid
@@ -102,20 +104,18 @@ class RefundsAPI(BaseClient):
 
         return self.request("GET", "refund", params=payload)
 
-    def fetch(
-        self, refund_id: Union[str, int]
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def fetch(self, refund_id: Union[str, int]) -> PaystackResponse:
         """Get details of a refund on your integration.
 
         Args:
             refund_id (Union[str, int]): The ID of the initiated refund
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Raises:
             APIError: If refund_id is not provided
         """
-        self._validate_required_params(refund_id=refund_id)
+        self._require("refund_id", refund_id)
 
         return self.request("GET", f"refund/{refund_id}")
@@ -2,10 +2,12 @@
 The Settlements API allows you gain insights into payouts made by Paystack to your bank account.
 """
 
-import requests
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Iterator
 
-from ..core import BaseClient
+from ..core import BaseClient, PaystackResponse, _next_page
+from ..async_core import AsyncBaseClient
+
+_SETTLEMENT_TRANSACTIONS_PATH = "settlement/{}/transactions".format
 
 
 class SettlementsAPI(BaseClient):
@@ -13,10 +15,7 @@ class SettlementsAPI(BaseClient):
     The Settlements API allows you gain insights into payouts made by Paystack to your bank account.
     """
 
-    def __init__(
-        self, secret_key: str, session: requests.Session = None, base_url: str = None
-    ):
-        super().__init__(secret_key, session=session, base_url=base_url)
+    __slots__ = ()
 
     def list_settlements(
         self,
@@ -26,7 +25,7 @@ class SettlementsAPI(BaseClient):
         subaccount: Optional[str] = None,
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         List settlements made to your settlement accounts
 
@@ -39,24 +38,52 @@ class SettlementsAPI(BaseClient):
             to_date: A timestamp at which to stop listing settlements e.g. 2016-09-24T00:00:05.000Z, 2016-09-21
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        params = {}
-        if per_page:
-            params["perPage"] = per_page
-        if page:
-            params["page"] = page
-        if status:
-            params["status"] = status
-        if subaccount:
-            params["subaccount"] = subaccount
-        if from_date:
-            params["from"] = from_date
-        if to_date:
-            params["to"] = to_date
+        fields = (
+            ("perPage", per_page),
+            ("page", page),
+            ("status", status),
+            ("subaccount", subaccount),
+            ("from", from_date),
+            ("to", to_date),
+        )
+        params = {k: v for k, v in fields if v is not None}
 
         return self.request("GET", "settlement", params=params)
 
+    def iter_settlements(
+        self,
+        per_page: int = 50,
+        status: Optional[str] = None,
+        subaccount: Optional[str] = None,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every settlement across all pages.
+
+        The next page is requested while the current one is being consumed. On
+        the async client, iterate with ``async for``.
+
+        Args:
+            per_page: Number of records fetched per request (default: 50)
+            status: Fetch settlements based on their state. Value can be one of success, processing, pending or failed.
+            subaccount: Provide a subaccount ID to export only settlements for that subaccount. Set to none to export only transactions for the account.
+            from_date: A timestamp from which to start listing settlements e.g. 2016-09-24T00:00:05.000Z, 2016-09-21
+            to_date: A timestamp at which to stop listing settlements e.g. 2016-09-24T00:00:05.000Z, 2016-09-21
+
+        Returns:
+            Iterator[Dict[str, Any]]: Each matching settlement.
+        """
+        return self._paginate(
+            lambda page: self.list_settlements(
+                per_page, page, status, subaccount, from_date, to_date
+            ),
+            _next_page,
+            start=1,
+        )
+
     def list_settlement_transactions(
         self,
         settlement_id: str,
@@ -64,7 +91,7 @@ class SettlementsAPI(BaseClient):
         page: Optional[int] = None,
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Get the transactions that make up a particular settlement
 
@@ -76,18 +103,52 @@ class SettlementsAPI(BaseClient):
             to_date: A timestamp at which to stop listing settlement transactions e.g. 2016-09-24T00:00:05.000Z, 2016-09-21
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        params = {}
-        if per_page:
-            params["perPage"] = per_page
-        if page:
-            params["page"] = page
-        if from_date:
-            params["from"] = from_date
-        if to_date:
-            params["to"] = to_date
+        fields = (
+            ("perPage", per_page),
+            ("page", page),
+            ("from", from_date),
+            ("to", to_date),
+        )
+        params = {k: v for k, v in fields if v is not None}
 
         return self.request(
-            "GET", f"settlement/{settlement_id}/transactions", params=params
+            "GET", _SETTLEMENT_TRANSACTIONS_PATH(settlement_id), params=params
+        )
+
+    def iter_settlement_transactions(
+        self,
+        settlement_id: str,
+        per_page: int = 50,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every transaction in a settlement across all pages.
+
+        The next page is requested while the current one is being consumed. On
+        the async client, iterate with ``async for``.
+
+        Args:
+            settlement_id: The settlement ID in which you want to fetch its transactions
+            per_page: Number of records fetched per request (default: 50)
+            from_date: A timestamp from which to start listing settlement transactions e.g. 2016-09-24T00:00:05.000Z, 2016-09-21
+            to_date: A timestamp at which to stop listing settlement transactions e.g. 2016-09-24T00:00:05.000Z, 2016-09-21
+
+        Returns:
+            Iterator[Dict[str, Any]]: Each transaction in the settlement.
+        """
+        return self._paginate(
+            lambda page: self.list_settlement_transactions(
+                settlement_id, per_page, page, from_date, to_date
+            ),
+            _next_page,
+            start=1,
         )
+
+
+class AsyncSettlementsAPI(AsyncBaseClient, SettlementsAPI):
+    """Asynchronous Settlements API client; every method returns an awaitable."""
+
+    __slots__ = ()
@@ -3,9 +3,9 @@ The Subaccounts API allows you create and manage subaccounts on your integration
 """
 
 import requests
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any
 
-from ..core import BaseClient
+from ..core import BaseClient, PaystackResponse
 
 
 class SubaccountsAPI(BaseClient):
@@ -13,6 +13,8 @@ class SubaccountsAPI(BaseClient):
     The Subaccounts API allows you create and manage subaccounts on your integration.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, secret_key: str, session: requests.Session = None, base_url: str = None
     ):
@@ -29,7 +31,7 @@ class SubaccountsAPI(BaseClient):
         primary_contact_name: Optional[str] = None,
         primary_contact_phone: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Create a subacount on your integration
 
@@ -45,7 +47,7 @@ class SubaccountsAPI(BaseClient):
             metadata: Stringified JSON object. Add a custom_fields attribute which has an array of objects if you would like the fields to be added to your transaction when displayed on the dashboard. Sample: {"custom_fields":[{"display_name":"Cart ID","variable_name": "cart_id","value": "8393"}]}
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {
             "business_name": business_name,
@@ -72,7 +74,7 @@ class SubaccountsAPI(BaseClient):
         page: Optional[int] = None,
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         List subaccounts available on your integration
 
@@ -83,12 +85,12 @@ class SubaccountsAPI(BaseClient):
             to_date: A timestamp at which to stop listing subaccounts e.g. 2016-09-24T00:00:05.000Z, 2016-09-21
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         params = {}
-        if per_page:
+        if per_page is not None:
             params["perPage"] = per_page
-        if page:
+        if page is not None:
             params["page"] = page
         if from_date:
             params["from"] = from_date
@@ -97,9 +99,7 @@ class SubaccountsAPI(BaseClient):
 
         return self.request("GET", "subaccount", params=params)
 
-    def fetch_subaccount(
-        self, id_or_code: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def fetch_subaccount(self, id_or_code: str) -> PaystackResponse:
         """
         Get details of a subaccount on your integration
 
@@ -107,7 +107,7 @@ class SubaccountsAPI(BaseClient):
             id_or_code: The subaccount ID or code you want to fetch
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         return self.request("GET", f"subaccount/{id_or_code}")
 
@@ -125,7 +125,7 @@ class SubaccountsAPI(BaseClient):
         primary_contact_phone: Optional[str] = None,
         settlement_schedule: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Update a subaccount details on your integration
 
@@ -144,7 +144,7 @@ class SubaccountsAPI(BaseClient):
             metadata: Stringified JSON object. Add a custom_fields attribute which has an array of objects if you would like the fields to be added to your transaction when displayed on the dashboard. Sample: {"custom_fields":[{"display_name":"Cart ID","variable_name": "cart_id","value": "8393"}]}
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {}
         if business_name:
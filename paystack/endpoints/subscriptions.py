@@ -2,10 +2,15 @@
 The Subscriptions API allows you create and manage recurring payment on your integration.
 """
 
-import requests
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Iterator, Dict, Any
 
-from ..core import BaseClient
+from ..core import BaseClient, PaystackResponse, _next_page
+from ..async_core import AsyncBaseClient
+
+# Path templates for endpoints that take path parameters
+_SUBSCRIPTION_PATH = "subscription/{}".format
+_MANAGE_LINK_PATH = "subscription/{}/manage/link".format
+_MANAGE_EMAIL_PATH = "subscription/{}/manage/email".format
 
 
 class SubscriptionsAPI(BaseClient):
@@ -13,10 +18,7 @@ class SubscriptionsAPI(BaseClient):
     The Subscriptions API allows you create and manage recurring payment on your integration.
     """
 
-    def __init__(
-        self, secret_key: str, session: requests.Session = None, base_url: str = None
-    ):
-        super().__init__(secret_key, session=session, base_url=base_url)
+    __slots__ = ()
 
     def create_subscription(
         self,
@@ -24,7 +26,7 @@ class SubscriptionsAPI(BaseClient):
         plan: str,
         authorization: Optional[str] = None,
         start_date: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Create a subscription on your integration
 
@@ -35,16 +37,17 @@ class SubscriptionsAPI(BaseClient):
             start_date: Set the date for the first debit. (ISO 8601 format) e.g. 2017-05-16T00:30:13+01:00
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
+        optional_fields = (
+            ("authorization", authorization),
+            ("start_date", start_date),
+        )
         payload = {
             "customer": customer,
             "plan": plan,
+            **{k: v for k, v in optional_fields if v is not None},
         }
-        if authorization:
-            payload["authorization"] = authorization
-        if start_date:
-            payload["start_date"] = start_date
 
         return self.request("POST", "subscription", json_data=payload)
 
@@ -54,7 +57,7 @@ class SubscriptionsAPI(BaseClient):
         page: Optional[int] = None,
         customer: Optional[int] = None,
         plan: Optional[int] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         List subscriptions available on your integration
 
@@ -65,37 +68,61 @@ class SubscriptionsAPI(BaseClient):
             plan: Filter by Plan ID
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
-        """
-        params = {}
-        if per_page:
-            params["perPage"] = per_page
-        if page:
-            params["page"] = page
-        if customer:
-            params["customer"] = customer
-        if plan:
-            params["plan"] = plan
+            PaystackResponse: A named tuple containing the response data and metadata.
+        """
+        fields = (
+            ("perPage", per_page),
+            ("page", page),
+            ("customer", customer),
+            ("plan", plan),
+        )
+        params = {k: v for k, v in fields if v is not None}
 
         return self.request("GET", "subscription", params=params)
 
+    def iter_subscriptions(
+        self,
+        per_page: int = 50,
+        customer: Optional[int] = None,
+        plan: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every subscription across all pages.
+
+        The next page is requested while the current one is being consumed. On
+        the async client, iterate with ``async for``.
+
+        Args:
+            per_page: Number of records fetched per request (default: 50)
+            customer: Filter by Customer ID
+            plan: Filter by Plan ID
+
+        Returns:
+            Iterator[Dict[str, Any]]: Each matching subscription.
+        """
+        return self._paginate(
+            lambda page: self.list_subscriptions(per_page, page, customer, plan),
+            _next_page,
+            start=1,
+        )
+
     def fetch_subscription(
-        self, id_or_code: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        self, id_or_code: str, cache_ttl: Optional[float] = None
+    ) -> PaystackResponse:
         """
         Get details of a subscription on your integration
 
         Args:
             id_or_code: The subscription ID or code you want to fetch
+            cache_ttl: Seconds to reuse a cached response for identical calls (disabled
+                by default)
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        return self.request("GET", f"subscription/{id_or_code}")
+        return self.request("GET", _SUBSCRIPTION_PATH(id_or_code), cache_ttl=cache_ttl)
 
-    def enable_subscription(
-        self, code: str, token: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def enable_subscription(self, code: str, token: str) -> PaystackResponse:
         """
         Enable a subscription on your integration
 
@@ -104,7 +131,7 @@ class SubscriptionsAPI(BaseClient):
             token: Email token
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {
             "code": code,
@@ -112,9 +139,7 @@ class SubscriptionsAPI(BaseClient):
         }
         return self.request("POST", "subscription/enable", json_data=payload)
 
-    def disable_subscription(
-        self, code: str, token: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def disable_subscription(self, code: str, token: str) -> PaystackResponse:
         """
         Disable a subscription on your integration
 
@@ -123,7 +148,7 @@ class SubscriptionsAPI(BaseClient):
             token: Email token
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {
             "code": code,
@@ -131,9 +156,7 @@ class SubscriptionsAPI(BaseClient):
         }
         return self.request("POST", "subscription/disable", json_data=payload)
 
-    def generate_update_subscription_link(
-        self, code: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def generate_update_subscription_link(self, code: str) -> PaystackResponse:
         """
         Generate a link for updating the card on a subscription
 
@@ -141,13 +164,11 @@ class SubscriptionsAPI(BaseClient):
             code: Subscription code
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        return self.request("GET", f"subscription/{code}/manage/link")
+        return self.request("GET", _MANAGE_LINK_PATH(code))
 
-    def send_update_subscription_link(
-        self, code: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def send_update_subscription_link(self, code: str) -> PaystackResponse:
         """
         Email a customer a link for updating the card on their subscription
 
@@ -155,6 +176,12 @@ class SubscriptionsAPI(BaseClient):
             code: Subscription code
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        return self.request("POST", f"subscription/{code}/manage/email")
+        return self.request("POST", _MANAGE_EMAIL_PATH(code))
+
+
+class AsyncSubscriptionsAPI(AsyncBaseClient, SubscriptionsAPI):
+    """Asynchronous Subscriptions API client; every method returns an awaitable."""
+
+    __slots__ = ()
@@ -2,10 +2,16 @@
 The Terminal API allows you to build delightful in-person payment experiences.
 """
 
-import requests
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Iterator
 
-from ..core import BaseClient
+from ..core import BaseClient, PaystackResponse, _next_cursor
+from ..async_core import AsyncBaseClient
+
+# Path templates for endpoints that take path parameters
+_EVENT_PATH = "terminal/{}/event".format
+_EVENT_STATUS_PATH = "terminal/{}/event/{}".format
+_PRESENCE_PATH = "terminal/{}/presence".format
+_TERMINAL_PATH = "terminal/{}".format
 
 
 class TerminalAPI(BaseClient):
@@ -13,14 +19,11 @@ class TerminalAPI(BaseClient):
     The Terminal API allows you to build delightful in-person payment experiences.
     """
 
-    def __init__(
-        self, secret_key: str, session: requests.Session = None, base_url: str = None
-    ):
-        super().__init__(secret_key, session=session, base_url=base_url)
+    __slots__ = ()
 
     def send_event(
         self, terminal_id: str, type: str, action: str, data: Dict[str, Any]
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Send an event from your application to the Paystack Terminal
 
@@ -31,18 +34,16 @@ class TerminalAPI(BaseClient):
             data: The paramters needed to perform the specified action. For the invoice type, you need to pass the invoice id and offline reference: {id: invoice_id, reference: offline_reference}. For the transaction type, you can pass the transaction id: {id: transaction_id}
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {
             "type": type,
             "action": action,
             "data": data,
         }
-        return self.request("POST", f"terminal/{terminal_id}/event", json_data=payload)
+        return self.request("POST", _EVENT_PATH(terminal_id), json_data=payload)
 
-    def fetch_event_status(
-        self, terminal_id: str, event_id: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def fetch_event_status(self, terminal_id: str, event_id: str) -> PaystackResponse:
         """
         Check the status of an event sent to the Terminal
 
@@ -51,13 +52,11 @@ class TerminalAPI(BaseClient):
             event_id: The ID of the event that was sent to the Terminal
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        return self.request("GET", f"terminal/{terminal_id}/event/{event_id}")
+        return self.request("GET", _EVENT_STATUS_PATH(terminal_id, event_id))
 
-    def fetch_terminal_status(
-        self, terminal_id: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def fetch_terminal_status(self, terminal_id: str) -> PaystackResponse:
         """
         Check the availiability of a Terminal before sending an event to it
 
@@ -65,16 +64,16 @@ class TerminalAPI(BaseClient):
             terminal_id: The ID of the Terminal you want to check
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        return self.request("GET", f"terminal/{terminal_id}/presence")
+        return self.request("GET", _PRESENCE_PATH(terminal_id))
 
     def list_terminals(
         self,
         per_page: Optional[int] = None,
         next_cursor: Optional[str] = None,
         previous_cursor: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         List the Terminals available on your integration
 
@@ -84,36 +83,58 @@ class TerminalAPI(BaseClient):
             previous_cursor: A cursor that indicates your place in the list. It should be used to fetch the previous page of the list after an intial next request
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        params = {}
-        if per_page:
-            params["perPage"] = per_page
-        if next_cursor:
-            params["next"] = next_cursor
-        if previous_cursor:
-            params["previous"] = previous_cursor
+        fields = (
+            ("perPage", per_page),
+            ("next", next_cursor),
+            ("previous", previous_cursor),
+        )
+        params = {k: v for k, v in fields if v is not None}
 
         return self.request("GET", "terminal", params=params)
 
-    def fetch_terminal(self, terminal_id: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def iter_terminals(
+        self, per_page: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every Terminal, following the ``next`` cursor in ``meta``.
+
+        The next page is requested while the current one is being consumed. On
+        the async client, iterate with ``async for``.
+
+        Args:
+            per_page: Number of records fetched per request
+
+        Returns:
+            Iterator[Dict[str, Any]]: Each Terminal on the integration.
+        """
+        return self._paginate(
+            lambda cursor: self.list_terminals(per_page, cursor), _next_cursor
+        )
+
+    def fetch_terminal(
+        self, terminal_id: str, cache_ttl: Optional[float] = None
+    ) -> PaystackResponse:
         """
         Get the details of a Terminal
 
         Args:
             terminal_id: The ID of the Terminal the event was sent to.
+            cache_ttl: Seconds to reuse a cached response for identical calls (disabled
+                by default)
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        return self.request("GET", f"terminal/{terminal_id}")
+        return self.request("GET", _TERMINAL_PATH(terminal_id), cache_ttl=cache_ttl)
 
     def update_terminal(
         self,
         terminal_id: str,
         name: Optional[str] = None,
         address: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Update the details of a Terminal
 
@@ -123,19 +144,17 @@ class TerminalAPI(BaseClient):
             address: The address of the Terminal
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        payload = {}
-        if name:
-            payload["name"] = name
-        if address:
-            payload["address"] = address
+        fields = (
+            ("name", name),
+            ("address", address),
+        )
+        payload = {k: v for k, v in fields if v is not None}
 
-        return self.request("PUT", f"terminal/{terminal_id}", json_data=payload)
+        return self.request("PUT", _TERMINAL_PATH(terminal_id), json_data=payload)
 
-    def commission_terminal(
-        self, serial_number: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def commission_terminal(self, serial_number: str) -> PaystackResponse:
         """
         Activate your debug device by linking it to your integration
 
@@ -143,14 +162,12 @@ class TerminalAPI(BaseClient):
             serial_number: Device Serial Number
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {"serial_number": serial_number}
         return self.request("POST", "terminal/commission_device", json_data=payload)
 
-    def decommission_terminal(
-        self, serial_number: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def decommission_terminal(self, serial_number: str) -> PaystackResponse:
         """
         Unlink your debug device from your integration
 
@@ -158,7 +175,13 @@ class TerminalAPI(BaseClient):
             serial_number: Device Serial Number
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {"serial_number": serial_number}
         return self.request("POST", "terminal/decommission_device", json_data=payload)
+
+
+class AsyncTerminalAPI(AsyncBaseClient, TerminalAPI):
+    """Asynchronous Terminal API client; every method returns an awaitable."""
+
+    __slots__ = ()
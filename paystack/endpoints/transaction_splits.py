@@ -2,10 +2,17 @@
 The Transaction Splits API enables merchants split the settlement for a transaction across their payout account, and one or more subaccounts.
 """
 
-import requests
-from typing import Optional, List, Dict, Any, Tuple
+from functools import partial
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Mapping, Union
 
-from ..core import BaseClient
+from ..core import BaseClient, PaystackResponse, _next_page
+from ..async_core import AsyncBaseClient
+from ..exceptions import PaystackError, ValidationError
+
+# Path templates for endpoints that take path parameters
+_SPLIT_PATH = "split/{}".format
+_ADD_SUBACCOUNT_PATH = "split/{}/subaccount/add".format
+_REMOVE_SUBACCOUNT_PATH = "split/{}/subaccount/remove".format
 
 
 class TransactionSplitsAPI(BaseClient):
@@ -13,10 +20,7 @@ class TransactionSplitsAPI(BaseClient):
     The Transaction Splits API enables merchants split the settlement for a transaction across their payout account, and one or more subaccounts.
     """
 
-    def __init__(
-        self, secret_key: str, session: requests.Session = None, base_url: str = None
-    ):
-        super().__init__(secret_key, session=session, base_url=base_url)
+    __slots__ = ()
 
     def create_split(
         self,
@@ -26,7 +30,7 @@ class TransactionSplitsAPI(BaseClient):
         subaccounts: List[Dict[str, Any]],
         bearer_type: str,
         bearer_subaccount: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Create a split payment on your integration
 
@@ -39,7 +43,7 @@ class TransactionSplitsAPI(BaseClient):
             bearer_subaccount: Subaccount code
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {
             "name": name,
@@ -48,7 +52,7 @@ class TransactionSplitsAPI(BaseClient):
             "subaccounts": subaccounts,
             "bearer_type": bearer_type,
         }
-        if bearer_subaccount:
+        if bearer_subaccount is not None:
             payload["bearer_subaccount"] = bearer_subaccount
 
         return self.request("POST", "split", json_data=payload)
@@ -62,7 +66,7 @@ class TransactionSplitsAPI(BaseClient):
         page: Optional[int] = None,
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         List the transaction splits available on your integration
 
@@ -76,37 +80,70 @@ class TransactionSplitsAPI(BaseClient):
             to_date: A timestamp at which to stop listing splits e.g. 2019-09-24T00:00:05.000Z, 2019-09-21
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
-        """
-        params = {}
-        if name:
-            params["name"] = name
-        if active is not None:
-            params["active"] = active
-        if sort_by:
-            params["sort_by"] = sort_by
-        if per_page:
-            params["perPage"] = per_page
-        if page:
-            params["page"] = page
-        if from_date:
-            params["from"] = from_date
-        if to_date:
-            params["to"] = to_date
+            PaystackResponse: A named tuple containing the response data and metadata.
+        """
+        fields = (
+            ("name", name),
+            ("active", active),
+            ("sort_by", sort_by),
+            ("perPage", per_page),
+            ("page", page),
+            ("from", from_date),
+            ("to", to_date),
+        )
+        params = {k: v for k, v in fields if v is not None}
 
         return self.request("GET", "split", params=params)
 
-    def fetch_split(self, split_id: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def iter_splits(
+        self,
+        name: Optional[str] = None,
+        active: Optional[bool] = None,
+        sort_by: Optional[str] = None,
+        per_page: int = 50,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every split across all pages.
+
+        The next page is requested while the current one is being consumed. On
+        the async client, iterate with ``async for``.
+
+        Args:
+            name: The name of the split
+            active: Any of true or false
+            sort_by: Sort by name, defaults to createdAt date
+            per_page: Number of records fetched per request (default: 50)
+            from_date: A timestamp from which to start listing splits e.g. 2019-09-24T00:00:05.000Z, 2019-09-21
+            to_date: A timestamp at which to stop listing splits e.g. 2019-09-24T00:00:05.000Z, 2019-09-21
+
+        Returns:
+            Iterator[Dict[str, Any]]: Each matching split.
+        """
+        return self._paginate(
+            lambda page: self.list_splits(
+                name, active, sort_by, per_page, page, from_date, to_date
+            ),
+            _next_page,
+            start=1,
+        )
+
+    def fetch_split(
+        self, split_id: str, cache_ttl: Optional[float] = None
+    ) -> PaystackResponse:
         """
         Get details of a split on your integration
 
         Args:
             split_id: The id of the split
+            cache_ttl: Seconds to reuse a cached response for identical calls (disabled
+                by default)
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        return self.request("GET", f"split/{split_id}")
+        return self.request("GET", _SPLIT_PATH(split_id), cache_ttl=cache_ttl)
 
     def update_split(
         self,
@@ -115,7 +152,7 @@ class TransactionSplitsAPI(BaseClient):
         active: bool,
         bearer_type: Optional[str] = None,
         bearer_subaccount: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Update a transaction split details on your integration
 
@@ -127,22 +164,23 @@ class TransactionSplitsAPI(BaseClient):
             bearer_subaccount: Subaccount code of a subaccount in the split group. This should be specified only if the bearer_type is subaccount
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
+        optional_fields = (
+            ("bearer_type", bearer_type),
+            ("bearer_subaccount", bearer_subaccount),
+        )
         payload = {
             "name": name,
             "active": active,
+            **{k: v for k, v in optional_fields if v is not None},
         }
-        if bearer_type:
-            payload["bearer_type"] = bearer_type
-        if bearer_subaccount:
-            payload["bearer_subaccount"] = bearer_subaccount
 
-        return self.request("PUT", f"split/{split_id}", json_data=payload)
+        return self.request("PUT", _SPLIT_PATH(split_id), json_data=payload)
 
     def add_update_subaccount_split(
         self, split_id: str, subaccount: str, share: int
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Add a Subaccount to a Transaction Split, or update the share of an existing Subaccount in a Transaction Split
 
@@ -152,19 +190,17 @@ class TransactionSplitsAPI(BaseClient):
             share: This is the transaction share for the subaccount
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {
             "subaccount": subaccount,
             "share": share,
         }
-        return self.request(
-            "POST", f"split/{split_id}/subaccount/add", json_data=payload
-        )
+        return self.request("POST", _ADD_SUBACCOUNT_PATH(split_id), json_data=payload)
 
     def remove_subaccount_from_split(
         self, split_id: str, subaccount: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Remove a subaccount from a transaction split
 
@@ -173,9 +209,75 @@ class TransactionSplitsAPI(BaseClient):
             subaccount: This is the sub account code
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {"subaccount": subaccount}
         return self.request(
-            "POST", f"split/{split_id}/subaccount/remove", json_data=payload
+            "POST", _REMOVE_SUBACCOUNT_PATH(split_id), json_data=payload
         )
+
+    def bulk_sync_subaccounts(
+        self,
+        split_id: str,
+        desired: Iterable[Mapping[str, Any]] = (),
+        remove: Iterable[str] = (),
+        max_workers: int = 16,
+    ) -> Dict[str, Union[PaystackResponse, PaystackError]]:
+        """
+        Add, update and remove several subaccounts of a split concurrently.
+
+        Paystack only changes one subaccount per request, so the calls run in
+        parallel over the client's pooled session; keep ``max_workers`` at or
+        below the client's ``pool_size``. The calls are independent writes, so
+        one failing does not stop or undo the others: failures are returned in
+        place of that subaccount's response rather than raised.
+
+        Args:
+            split_id: Split Id
+            desired: Subaccounts to add or update, each
+                ``{"subaccount": code, "share": share}``
+            remove: Codes of the subaccounts to remove from the split
+            max_workers: Maximum number of requests in flight at once
+
+        Returns:
+            Dict[str, Union[PaystackResponse, PaystackError]]: Each subaccount code
+                mapped to its response data and metadata, or to the exception its
+                request raised.
+
+        Raises:
+            ValidationError: If a subaccount is repeated, or is both in ``desired`` and
+                ``remove``; no request is sent.
+        """
+        calls = {}
+        for sub in desired:
+            subaccount = sub["subaccount"]
+            if subaccount in calls:
+                raise ValidationError(
+                    f"Subaccount {subaccount} appears more than once in desired",
+                    field_errors={"desired": "Must not repeat a subaccount"},
+                )
+            calls[subaccount] = partial(
+                self.add_update_subaccount_split, split_id, subaccount, sub["share"]
+            )
+        updated = set(calls)
+        for subaccount in remove:
+            if subaccount in updated:
+                raise ValidationError(
+                    f"Subaccount {subaccount} cannot be both updated and removed",
+                    field_errors={"remove": "Must not repeat a desired subaccount"},
+                )
+            if subaccount in calls:
+                raise ValidationError(
+                    f"Subaccount {subaccount} appears more than once in remove",
+                    field_errors={"remove": "Must not repeat a subaccount"},
+                )
+            calls[subaccount] = partial(
+                self.remove_subaccount_from_split, split_id, subaccount
+            )
+        return self._fan_out(calls, max_workers=max_workers, return_exceptions=True)
+
+
+class AsyncTransactionSplitsAPI(AsyncBaseClient, TransactionSplitsAPI):
+    """Asynchronous Transaction Splits API client; every method returns an awaitable."""
+
+    __slots__ = ()
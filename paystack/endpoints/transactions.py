@@ -1,17 +1,25 @@
-from typing import Optional, Dict, Any, Union, Tuple
+from typing import Optional, Dict, Any, Union
 
 import requests
-from ..core import BaseClient
+from ..core import BaseClient, PaystackResponse
+from ..async_core import AsyncBaseClient
 from ..exceptions import APIError, ValidationError
-from ..utils.validators import (
-    _validate_amount_and_email,
-    _validate_charge_authorization,
-)
+from ..utils.helpers import json_dumps
+
+_LIST_STATUSES = frozenset(("failed", "success", "abandoned"))
+_PARTIAL_DEBIT_CURRENCIES = frozenset(("NGN", "GHS"))
+
+# Path templates for endpoints that take a single path parameter
+_TRANSACTION_PATH = "transaction/{}".format
+_VERIFY_PATH = "transaction/verify/{}".format
+_TIMELINE_PATH = "transaction/timeline/{}".format
 
 
 class TransactionsAPI(BaseClient):
     """Transaction API client for processing payments and managing transactions."""
 
+    __slots__ = ()
+
     def __init__(
         self, secret_key: str, session: requests.Session = None, base_url: str = None
     ):
@@ -32,7 +40,7 @@ class TransactionsAPI(BaseClient):
         subaccount: Optional[str] = None,
         transaction_charge: Optional[int] = None,
         bearer: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """Initialize a transaction for payment.
 
         Args:
@@ -51,7 +59,7 @@ class TransactionsAPI(BaseClient):
             bearer (Optional[str]): Who bears Paystack charges ('account' or 'subaccount')
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Raises:
             APIError: If email or amount is invalid
@@ -70,9 +78,7 @@ class TransactionsAPI(BaseClient):
             payload["invoice_limit"] = invoice_limit
         if metadata is not None:
             # Convert metadata dict to JSON string as per API requirements
-            import json
-
-            payload["metadata"] = json.dumps(metadata)
+            payload["metadata"] = json_dumps(metadata).decode("utf-8")
         if channels:
             payload["channels"] = channels
         if split_code:
@@ -86,20 +92,20 @@ class TransactionsAPI(BaseClient):
 
         return self.request("POST", "transaction/initialize", json_data=payload)
 
-    def verify(self, reference: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def verify(self, reference: str) -> PaystackResponse:
         """Verify a transaction status.
 
         Args:
             reference (str): Transaction reference to verify
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Raises:
             APIError: If reference is not provided
         """
-        self._validate_required_params(reference=reference)
-        return self.request("GET", f"transaction/verify/{reference}")
+        self._require("reference", reference)
+        return self.request("GET", _VERIFY_PATH(reference))
 
     def list_transactions(
         self,
@@ -111,7 +117,7 @@ class TransactionsAPI(BaseClient):
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
         amount: Optional[Union[int, str]] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """List transactions with optional filtering.
 
         Args:
@@ -125,7 +131,7 @@ class TransactionsAPI(BaseClient):
             amount (Optional[Union[int, str]]): Amount to filter by
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         params = {}
 
@@ -138,7 +144,7 @@ class TransactionsAPI(BaseClient):
         if terminal_id:
             params["terminalid"] = terminal_id
         if status:
-            if status not in ["failed", "success", "abandoned"]:
+            if status not in _LIST_STATUSES:
                 raise APIError(
                     "status must be one of: 'failed', 'success', 'abandoned'"
                 )
@@ -152,20 +158,20 @@ class TransactionsAPI(BaseClient):
 
         return self.request("GET", "transaction", params=params)
 
-    def fetch(self, transaction_id: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def fetch(self, transaction_id: int) -> PaystackResponse:
         """Fetch details of a single transaction.
 
         Args:
             transaction_id (Union[int, str]): The ID of the transaction to fetch
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Raises:
             APIError: If transaction_id is not provided
         """
-        self._validate_required_params(transaction_id=transaction_id)
-        return self.request("GET", f"transaction/{transaction_id}")
+        self._require("transaction_id", transaction_id)
+        return self.request("GET", _TRANSACTION_PATH(transaction_id))
 
     def charge_authorization(
         self,
@@ -180,7 +186,7 @@ class TransactionsAPI(BaseClient):
         bearer: Optional[str] = None,
         queue: Optional[bool] = None,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """Charge a customer's authorization (for recurring payments).
 
         Args:
@@ -197,7 +203,7 @@ class TransactionsAPI(BaseClient):
             metadata (Optional[Dict]): Additional data to store
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Raises:
             APIError: If required parameters are invalid
@@ -224,30 +230,26 @@ class TransactionsAPI(BaseClient):
         if queue is not None:
             payload["queue"] = queue
         if metadata:
-            import json
-
-            payload["metadata"] = json.dumps(metadata)
+            payload["metadata"] = json_dumps(metadata).decode("utf-8")
 
         return self.request(
             "POST", "transaction/charge_authorization", json_data=payload
         )
 
-    def view_timeline(
-        self, id_or_reference: Union[int, str]
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def view_timeline(self, id_or_reference: Union[int, str]) -> PaystackResponse:
         """View the timeline/history of a transaction.
 
         Args:
             id_or_reference (Union[int, str]): Transaction ID or reference
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Raises:
             APIError: If id_or_reference is not provided
         """
-        self._validate_required_params(id_or_reference=id_or_reference)
-        return self.request("GET", f"transaction/timeline/{id_or_reference}")
+        self._require("id_or_reference", id_or_reference)
+        return self.request("GET", _TIMELINE_PATH(id_or_reference))
 
     def get_totals(
         self,
@@ -255,7 +257,7 @@ class TransactionsAPI(BaseClient):
         page: Optional[int] = None,
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """Get transaction totals for your integration.
 
         Args:
@@ -265,7 +267,7 @@ class TransactionsAPI(BaseClient):
             to_date (Optional[str]): End date for totals calculation
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         params = {}
 
@@ -293,7 +295,7 @@ class TransactionsAPI(BaseClient):
         settled: Optional[bool] = None,
         settlement: Optional[int] = None,
         payment_page: Optional[int] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """Export transactions as CSV.
 
         Args:
@@ -310,7 +312,7 @@ class TransactionsAPI(BaseClient):
             payment_page (Optional[int]): Payment page ID filter
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         query = {}
 
@@ -347,7 +349,7 @@ class TransactionsAPI(BaseClient):
         email: str,
         reference: Optional[str] = None,
         at_least: Optional[Union[int, str]] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Perform a partial debit transaction.
 
@@ -363,17 +365,17 @@ class TransactionsAPI(BaseClient):
             at_least (Optional[Union[int, str]]): Minimum acceptable amount in kobo
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
 
         Raises:
             APIError: If required parameters are missing or invalid
         """
         self._validate_email(email)
-        self._validate_required_params(currency=currency)
+        self._require("currency", currency)
         self._validate_amount(amount, currency)
 
         # Validate currency for partial debit
-        if currency not in ["NGN", "GHS"]:
+        if currency not in _PARTIAL_DEBIT_CURRENCIES:
             raise ValidationError("currency must be 'NGN' or 'GHS' for partial debit")
 
         payload = {
@@ -390,3 +392,9 @@ class TransactionsAPI(BaseClient):
             payload["at_least"] = str(at_least)
 
         return self.request("POST", "transaction/partial_debit", json_data=payload)
+
+
+class AsyncTransactionsAPI(AsyncBaseClient, TransactionsAPI):
+    """Asynchronous Transactions API client; every method returns an awaitable."""
+
+    __slots__ = ()
@@ -3,9 +3,9 @@ The Transfers API allows you automate sending money to your customers.
 """
 
 import requests
-from typing import Optional, List, Dict, Any, Tuple, Union
+from typing import Optional, List, Dict, Any, Union
 
-from ..core import BaseClient
+from ..core import BaseClient, PaystackResponse
 
 
 class TransfersAPI(BaseClient):
@@ -13,6 +13,8 @@ class TransfersAPI(BaseClient):
     The Transfers API allows you automate sending money to your customers.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, secret_key: str, session: requests.Session = None, base_url: str = None
     ):
@@ -26,7 +28,7 @@ class TransfersAPI(BaseClient):
         reason: Optional[str] = None,
         currency: Optional[str] = None,
         reference: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Send money to your customers.
 
@@ -39,7 +41,7 @@ class TransfersAPI(BaseClient):
             reference: If specified, the field should be a unique identifier (in lowercase) for the object. Only -,_ and alphanumeric characters allowed.
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         self._validate_required_params(
             source=source, amount=amount, recipient=recipient
@@ -58,9 +60,7 @@ class TransfersAPI(BaseClient):
 
         return self.request("POST", "transfer", json_data=payload)
 
-    def finalize_transfer(
-        self, transfer_code: str, otp: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def finalize_transfer(self, transfer_code: str, otp: str) -> PaystackResponse:
         """
         Finalize an initiated transfer
 
@@ -69,7 +69,7 @@ class TransfersAPI(BaseClient):
             otp: OTP sent to business phone to verify transfer
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         self._validate_required_params(transfer_code=transfer_code, otp=otp)
         payload = {
@@ -80,7 +80,7 @@ class TransfersAPI(BaseClient):
 
     def initiate_bulk_transfer(
         self, source: str, transfers: List[Dict[str, Any]]
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Batch multiple transfers in a single request.
 
@@ -89,7 +89,7 @@ class TransfersAPI(BaseClient):
             transfers: A list of transfer object. Each object should contain amount, recipient, and reference
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         self._validate_required_params(source=source, transfers=transfers)
         payload = {
@@ -105,7 +105,7 @@ class TransfersAPI(BaseClient):
         recipient: Optional[int] = None,
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         List the transfers made on your integration.
 
@@ -117,12 +117,12 @@ class TransfersAPI(BaseClient):
             to_date: A timestamp at which to stop listing transfer e.g. 2016-09-24T00:00:05.000Z, 2016-09-21
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         params = {}
-        if per_page:
+        if per_page is not None:
             params["perPage"] = per_page
-        if page:
+        if page is not None:
             params["page"] = page
         if recipient:
             params["recipient"] = recipient
@@ -133,7 +133,7 @@ class TransfersAPI(BaseClient):
 
         return self.request("GET", "transfer", params=params)
 
-    def fetch_transfer(self, id_or_code: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def fetch_transfer(self, id_or_code: str) -> PaystackResponse:
         """
         Get details of a transfer on your integration.
 
@@ -141,12 +141,12 @@ class TransfersAPI(BaseClient):
             id_or_code: The transfer ID or code you want to fetch
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        self._validate_required_params(id_or_code=id_or_code)
+        self._require("id_or_code", id_or_code)
         return self.request("GET", f"transfer/{id_or_code}")
 
-    def verify_transfer(self, reference: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def verify_transfer(self, reference: str) -> PaystackResponse:
         """
         Verify the status of a transfer on your integration.
 
@@ -154,7 +154,7 @@ class TransfersAPI(BaseClient):
             reference: Transfer reference
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        self._validate_required_params(reference=reference)
+        self._require("reference", reference)
         return self.request("GET", f"transfer/verify/{reference}")
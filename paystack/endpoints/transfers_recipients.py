@@ -3,9 +3,36 @@ The Transfer Recipients API allows you create and manage beneficiaries that you
 """
 
 import requests
-from typing import Optional, List, Dict, Any, Tuple
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any
 
-from ..core import BaseClient
+from ..core import BaseClient, PaystackResponse
+from ..async_core import AsyncBaseClient
+from ..exceptions import ValidationError
+
+_RECIPIENT_PATH = "transferrecipient/{}".format
+
+_RECIPIENT_TYPES = frozenset(
+    ("nuban", "ghipss", "mobile_money", "basa", "kepss", "authorization")
+)
+_RECIPIENT_TYPE_ERROR = (
+    "type must be one of: nuban, ghipss, mobile_money, basa, kepss, authorization"
+)
+_RECIPIENT_TYPE_ERRORS = MappingProxyType({"type": "Unsupported recipient type"})
+
+# Keys every bulk recipient needs; authorization recipients carry no bank_code.
+_BATCH_REQUIRED_KEYS = ("type", "name", "bank_code")
+_AUTHORIZATION_REQUIRED_KEYS = ("type", "name")
+
+
+def _missing_recipient_keys(recipient: Dict[str, Any]) -> List[str]:
+    """Required keys that are absent or empty on one bulk recipient."""
+    required = (
+        _AUTHORIZATION_REQUIRED_KEYS
+        if recipient.get("type") == "authorization"
+        else _BATCH_REQUIRED_KEYS
+    )
+    return [key for key in required if not recipient.get(key)]
 
 
 class TransferRecipientsAPI(BaseClient):
@@ -13,6 +40,8 @@ class TransferRecipientsAPI(BaseClient):
     The Transfer Recipients API allows you create and manage beneficiaries that you send money to.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, secret_key: str, session: requests.Session = None, base_url: str = None
     ):
@@ -28,7 +57,7 @@ class TransferRecipientsAPI(BaseClient):
         currency: Optional[str] = None,
         authorization_code: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Creates a new recipient. A duplicate account number will lead to the retrieval of the existing record.
 
@@ -43,30 +72,35 @@ class TransferRecipientsAPI(BaseClient):
             metadata: Store additional information about your recipient in a structured format, JSON
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
+
+        Raises:
+            ValidationError: If type is not a supported recipient type
         """
+        if type not in _RECIPIENT_TYPES:
+            raise ValidationError(
+                _RECIPIENT_TYPE_ERROR, field_errors=_RECIPIENT_TYPE_ERRORS
+            )
+
+        optional_fields = (
+            ("account_number", account_number),
+            ("bank_code", bank_code),
+            ("description", description),
+            ("currency", currency),
+            ("authorization_code", authorization_code),
+            ("metadata", metadata),
+        )
         payload = {
             "type": type,
             "name": name,
+            **{k: v for k, v in optional_fields if v is not None},
         }
-        if account_number:
-            payload["account_number"] = account_number
-        if bank_code:
-            payload["bank_code"] = bank_code
-        if description:
-            payload["description"] = description
-        if currency:
-            payload["currency"] = currency
-        if authorization_code:
-            payload["authorization_code"] = authorization_code
-        if metadata:
-            payload["metadata"] = metadata
 
         return self.request("POST", "transferrecipient", json_data=payload)
 
     def bulk_create_transfer_recipient(
         self, batch: List[Dict[str, Any]]
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Create multiple transfer recipients in batches. A duplicate account number will lead to the retrieval of the existing record.
 
@@ -74,8 +108,26 @@ class TransferRecipientsAPI(BaseClient):
             batch: A list of transfer recipient object. Each object should contain type, name, and bank_code. Any Create Transfer Recipient param can also be passed.
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
+
+        Raises:
+            ValidationError: If a recipient is missing type, name or bank_code
         """
+        bad = next(
+            (
+                (index, missing)
+                for index, missing in enumerate(map(_missing_recipient_keys, batch))
+                if missing
+            ),
+            None,
+        )
+        if bad is not None:
+            index, missing = bad
+            raise ValidationError(
+                f"batch[{index}] is missing required keys: {', '.join(missing)}",
+                field_errors={f"batch[{index}]": f"Missing {', '.join(missing)}"},
+            )
+
         payload = {"batch": batch}
         return self.request("POST", "transferrecipient/bulk", json_data=payload)
 
@@ -85,7 +137,7 @@ class TransferRecipientsAPI(BaseClient):
         page: Optional[int] = None,
         from_date: Optional[str] = None,
         to_date: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         List transfer recipients available on your integration
 
@@ -96,23 +148,19 @@ class TransferRecipientsAPI(BaseClient):
             to_date: A timestamp at which to stop listing transfer recipients e.g. 2016-09-24T00:00:05.000Z, 2016-09-21
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        params = {}
-        if per_page:
-            params["perPage"] = per_page
-        if page:
-            params["page"] = page
-        if from_date:
-            params["from"] = from_date
-        if to_date:
-            params["to"] = to_date
+        fields = (
+            ("perPage", per_page),
+            ("page", page),
+            ("from", from_date),
+            ("to", to_date),
+        )
+        params = {k: v for k, v in fields if v is not None}
 
         return self.request("GET", "transferrecipient", params=params)
 
-    def fetch_transfer_recipient(
-        self, id_or_code: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def fetch_transfer_recipient(self, id_or_code: str) -> PaystackResponse:
         """
         Fetch the details of a transfer recipient
 
@@ -120,13 +168,13 @@ class TransferRecipientsAPI(BaseClient):
             id_or_code: An ID or code for the recipient whose details you want to receive.
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        return self.request("GET", f"transferrecipient/{id_or_code}")
+        return self.request("GET", _RECIPIENT_PATH(id_or_code))
 
     def update_transfer_recipient(
         self, id_or_code: str, name: Optional[str] = None, email: Optional[str] = None
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Update transfer recipients available on your integration
 
@@ -136,19 +184,14 @@ class TransferRecipientsAPI(BaseClient):
             email: Email address of the recipient
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        payload = {}
-        if name:
-            payload["name"] = name
-        if email:
-            payload["email"] = email
+        fields = (("name", name), ("email", email))
+        payload = {k: v for k, v in fields if v is not None}
 
-        return self.request("PUT", f"transferrecipient/{id_or_code}", json_data=payload)
+        return self.request("PUT", _RECIPIENT_PATH(id_or_code), json_data=payload)
 
-    def delete_transfer_recipient(
-        self, id_or_code: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def delete_transfer_recipient(self, id_or_code: str) -> PaystackResponse:
         """
         Delete a transfer recipient (sets the transfer recipient to inactive)
 
@@ -156,6 +199,13 @@ class TransferRecipientsAPI(BaseClient):
             id_or_code: An ID or code for the recipient who you want to delete.
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        return self.request("DELETE", f"transferrecipient/{id_or_code}")
+        return self.request("DELETE", _RECIPIENT_PATH(id_or_code))
+
+
+class AsyncTransferRecipientsAPI(AsyncBaseClient, TransferRecipientsAPI):
+    """Asynchronous Transfer Recipients API client; every method returns an
+    awaitable."""
+
+    __slots__ = ()
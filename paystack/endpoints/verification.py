@@ -3,9 +3,28 @@ The Verification API allows you perform KYC processes.
 """
 
 import requests
-from typing import Optional, Dict, Any, Tuple
-
-from ..core import BaseClient
+from types import MappingProxyType
+from typing import Optional
+
+from ..core import BaseClient, PaystackResponse, require
+from ..async_core import AsyncBaseClient
+from ..exceptions import ValidationError
+
+_CARD_BIN_PATH = "decision/bin/{}".format
+
+_ACCOUNT_TYPES = frozenset(("personal", "business"))
+_DOCUMENT_TYPES = frozenset(
+    ("identityNumber", "passportNumber", "businessRegistrationNumber")
+)
+_ACCOUNT_TYPE_ERRORS = MappingProxyType(
+    {"account_type": "Must be 'personal' or 'business'"}
+)
+_DOCUMENT_TYPE_ERRORS = MappingProxyType(
+    {
+        "document_type": "Must be one of: identityNumber, passportNumber, "
+        "businessRegistrationNumber"
+    }
+)
 
 
 class VerificationAPI(BaseClient):
@@ -13,14 +32,15 @@ class VerificationAPI(BaseClient):
     The Verification API allows you perform KYC processes.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, secret_key: str, session: requests.Session = None, base_url: str = None
     ):
         super().__init__(secret_key, session=session, base_url=base_url)
 
-    def resolve_account(
-        self, account_number: str, bank_code: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    @require("account_number", "bank_code")
+    def resolve_account(self, account_number: str, bank_code: str) -> PaystackResponse:
         """
         Confirm an account belongs to the right customer.
 
@@ -29,18 +49,22 @@ class VerificationAPI(BaseClient):
             bank_code: You can get the list of bank codes by calling the List Banks endpoint
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        self._validate_required_params(
-            account_number=account_number, bank_code=bank_code
-        )
-
         params = {
             "account_number": account_number,
             "bank_code": bank_code,
         }
         return self.request("GET", "bank/resolve", params=params)
 
+    @require(
+        "account_name",
+        "account_number",
+        "account_type",
+        "bank_code",
+        "country_code",
+        "document_type",
+    )
     def validate_account(
         self,
         account_name: str,
@@ -50,7 +74,7 @@ class VerificationAPI(BaseClient):
         country_code: str,
         document_type: str,
         document_number: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Confirm the authenticity of a customer's account number before sending money.
 
@@ -64,16 +88,22 @@ class VerificationAPI(BaseClient):
             document_number: Customer’s mode of identity number
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
+
+        Raises:
+            ValidationError: If account_type or document_type is not supported
         """
-        self._validate_required_params(
-            account_name=account_name,
-            account_number=account_number,
-            account_type=account_type,
-            bank_code=bank_code,
-            country_code=country_code,
-            document_type=document_type,
-        )
+        if account_type not in _ACCOUNT_TYPES:
+            raise ValidationError(
+                "account_type must be either 'personal' or 'business'",
+                field_errors=_ACCOUNT_TYPE_ERRORS,
+            )
+        if document_type not in _DOCUMENT_TYPES:
+            raise ValidationError(
+                "document_type must be one of: identityNumber, passportNumber, "
+                "businessRegistrationNumber",
+                field_errors=_DOCUMENT_TYPE_ERRORS,
+            )
 
         payload = {
             "account_name": account_name,
@@ -88,7 +118,7 @@ class VerificationAPI(BaseClient):
 
         return self.request("POST", "bank/validate", json_data=payload)
 
-    def resolve_card_bin(self, card_bin: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def resolve_card_bin(self, card_bin: str) -> PaystackResponse:
         """
         Get more information about a customer's card.
 
@@ -96,8 +126,14 @@ class VerificationAPI(BaseClient):
             card_bin: First 6 characters of card
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
-        self._validate_required_params(card_bin=card_bin)
+        self._require("card_bin", card_bin)
+
+        return self.request("GET", _CARD_BIN_PATH(card_bin))
+
+
+class AsyncVerificationAPI(AsyncBaseClient, VerificationAPI):
+    """Asynchronous Verification API client; every method returns an awaitable."""
 
-        return self.request("GET", f"decision/bin/{card_bin}")
+    __slots__ = ()
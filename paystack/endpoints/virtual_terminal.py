@@ -3,9 +3,9 @@ The Virtual Terminal API allows you to accept in-person payments without a POS d
 """
 
 import requests
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any
 
-from ..core import BaseClient
+from ..core import BaseClient, PaystackResponse
 
 
 class VirtualTerminalAPI(BaseClient):
@@ -13,6 +13,8 @@ class VirtualTerminalAPI(BaseClient):
     The Virtual Terminal API allows you to accept in-person payments without a POS device.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, secret_key: str, session: requests.Session = None, base_url: str = None
     ):
@@ -25,7 +27,7 @@ class VirtualTerminalAPI(BaseClient):
         metadata: Optional[List[Dict[str, Any]]] = None,
         currency: Optional[List[str]] = None,
         custom_fields: Optional[List[Dict[str, Any]]] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Create a Virtual Terminal on your integration
 
@@ -37,7 +39,7 @@ class VirtualTerminalAPI(BaseClient):
             custom_fields: An array of objects representing custom fields to display on the form. Each object contains a display_name parameter, representing what will be displayed on the Virtual Terminal page, and variable_name parameter for referencing the custom field programmatically
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {
             "name": name,
@@ -59,7 +61,7 @@ class VirtualTerminalAPI(BaseClient):
         search: Optional[str] = None,
         next_cursor: Optional[str] = None,
         previous_cursor: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         List Virtual Terminals on your integration
 
@@ -71,12 +73,12 @@ class VirtualTerminalAPI(BaseClient):
             previous_cursor: Cursor for previous page
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         params = {}
         if status:
             params["status"] = status
-        if per_page:
+        if per_page is not None:
             params["perPage"] = per_page
         if search:
             params["search"] = search
@@ -87,9 +89,7 @@ class VirtualTerminalAPI(BaseClient):
 
         return self.request("GET", "virtual_terminal", params=params)
 
-    def fetch_virtual_terminal(
-        self, code: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def fetch_virtual_terminal(self, code: str) -> PaystackResponse:
         """
         Fetch a Virtual Terminal on your integration
 
@@ -97,13 +97,11 @@ class VirtualTerminalAPI(BaseClient):
             code: Code of the Virtual Terminal
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         return self.request("GET", f"virtual_terminal/{code}")
 
-    def update_virtual_terminal(
-        self, code: str, name: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def update_virtual_terminal(self, code: str, name: str) -> PaystackResponse:
         """
         Update a Virtual Terminal on your integration
 
@@ -112,14 +110,12 @@ class VirtualTerminalAPI(BaseClient):
             name: Name of the Virtual Terminal
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {"name": name}
         return self.request("PUT", f"virtual_terminal/{code}", json_data=payload)
 
-    def deactivate_virtual_terminal(
-        self, code: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def deactivate_virtual_terminal(self, code: str) -> PaystackResponse:
         """
         Deactivate a Virtual Terminal on your integration
 
@@ -127,13 +123,13 @@ class VirtualTerminalAPI(BaseClient):
             code: Code of the Virtual Terminal to deactivate
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         return self.request("PUT", f"virtual_terminal/{code}/deactivate")
 
     def assign_destination_to_virtual_terminal(
         self, code: str, destinations: List[Dict[str, Any]]
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Add a destination (WhatsApp number) to a Virtual Terminal on your integration
 
@@ -142,7 +138,7 @@ class VirtualTerminalAPI(BaseClient):
             destinations: An array of objects containing the notification recipients for payments to the Virtual Terminal. Each object includes a target parameter for the Whatsapp phone number to send notifications to, and a name parameter for a descriptive label.
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {"destinations": destinations}
         return self.request(
@@ -151,7 +147,7 @@ class VirtualTerminalAPI(BaseClient):
 
     def unassign_destination_from_virtual_terminal(
         self, code: str, targets: List[str]
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Unassign a destination (WhatsApp Number) summary of transactions from a Virtual Terminal on your integration
 
@@ -160,7 +156,7 @@ class VirtualTerminalAPI(BaseClient):
             targets: Array of destination targets to unassign
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {"targets": targets}
         return self.request(
@@ -169,7 +165,7 @@ class VirtualTerminalAPI(BaseClient):
 
     def add_split_code_to_virtual_terminal(
         self, code: str, split_code: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Add a split code to a Virtual Terminal on your integration
 
@@ -178,7 +174,7 @@ class VirtualTerminalAPI(BaseClient):
             split_code: Split code to be added to the Virtual Terminal
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {"split_code": split_code}
         return self.request(
@@ -187,7 +183,7 @@ class VirtualTerminalAPI(BaseClient):
 
     def remove_split_code_from_virtual_terminal(
         self, code: str, split_code: str
-    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    ) -> PaystackResponse:
         """
         Remove a split code from a Virtual Terminal on your integration
 
@@ -196,7 +192,7 @@ class VirtualTerminalAPI(BaseClient):
             split_code: Split code to be removed from the Virtual Terminal
 
         Returns:
-            Tuple[Dict[str, Any], Dict[str, Any]]: A tuple containing the response data and metadata.
+            PaystackResponse: A named tuple containing the response data and metadata.
         """
         payload = {"split_code": split_code}
         return self.request(
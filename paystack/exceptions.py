@@ -5,8 +5,7 @@ This module provides a hierarchy of exceptions that make it easier for developer
 to handle different types of errors when using the Paystack API.
 """
 
-from typing import Optional, Dict, Any, Union
-import json
+from typing import Optional, Dict, Any, Mapping, Union
 
 
 class PaystackError(Exception):
@@ -100,7 +99,7 @@ class ValidationError(PaystackError):
     """
 
     def __init__(
-        self, message: str, field_errors: Optional[Dict[str, str]] = None, **kwargs
+        self, message: str, field_errors: Optional[Mapping[str, str]] = None, **kwargs
     ):
         super().__init__(message, **kwargs)
         self.field_errors = field_errors or {}
@@ -229,7 +228,10 @@ class TransactionFailureError(PaystackError):
 
 
 def create_error_from_response(
-    response, status_code: int, request_id: Optional[str] = None
+    response,
+    status_code: int,
+    request_id: Optional[str] = None,
+    headers: Optional[Mapping[str, str]] = None,
 ) -> PaystackError:
     """
     Factory function to create appropriate exception from API response.
@@ -241,15 +243,22 @@ def create_error_from_response(
         response: HTTP response object or response data dict
         status_code: HTTP status code
         request_id: Request ID from response headers
+        headers: Response headers, used to read Retry-After when ``response``
+            is the already-parsed body rather than the response object
 
     Returns:
         Appropriate PaystackError subclass instance
     """
 
     # Try to extract error message and data from response
+    # Imported here: utils.helpers itself imports this module.
+    from .utils.helpers import json_loads
+
     field_errors = None
     try:
-        if hasattr(response, "json"):
+        if isinstance(getattr(response, "content", None), bytes):
+            data = json_loads(response.content)
+        elif hasattr(response, "json"):
             data = response.json()
         elif isinstance(response, dict):
             data = response
@@ -262,7 +271,7 @@ def create_error_from_response(
         if "errors" in data and isinstance(data["errors"], dict):
             field_errors = data["errors"]
 
-    except (json.JSONDecodeError, AttributeError):
+    except (ValueError, AttributeError):
         message = f"HTTP {status_code} error"
         data = {}
 
@@ -283,8 +292,10 @@ def create_error_from_response(
     elif status_code == 429:
         # Extract retry-after from response if available
         retry_after = None
-        if hasattr(response, "headers"):
-            retry_after = response.headers.get("Retry-After")
+        if headers is None and hasattr(response, "headers"):
+            headers = response.headers
+        if headers is not None:
+            retry_after = headers.get("Retry-After")
             if retry_after:
                 try:
                     retry_after = int(retry_after)
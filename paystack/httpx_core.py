@@ -0,0 +1,288 @@
+"""
+An httpx-based HTTP/2 transport for :class:`paystack.core.BaseClient`.
+
+httpx and h2 are optional dependencies; install them with
+``pip install "paystack-api-wrapper[http2]"``. Select the transport with
+``BaseClient(..., http_backend="httpx")`` or by setting the
+``PAYSTACK_HTTP_BACKEND=httpx`` environment variable. The async clients
+take ``AsyncBaseClient(..., http_backend="httpx")``.
+"""
+
+import asyncio
+import contextlib
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+import requests
+
+from .core import (
+    _RETRY_METHODS,
+    _RETRY_STATUSES,
+    _UNPROCESSED_STATUSES,
+    _retry_delay,
+)
+from .exceptions import NetworkError
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - depends on the installed extras
+    httpx = None
+
+
+class _StreamReader:
+    """File-like view of a streamed httpx body, as ijson expects from ``.raw``."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._buffer = b""
+        # Accepted for parity with urllib3's response.raw; httpx always decodes.
+        self.decode_content = True
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+class _StreamedResponse:
+    """Wrap a streamed httpx response in the parts of ``requests.Response``
+    that :meth:`BaseClient.request_stream` relies on."""
+
+    def __init__(self, response: "httpx.Response"):
+        self._response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.raw = _StreamReader(response.iter_bytes())
+
+    @property
+    def content(self) -> bytes:
+        return self._response.read()
+
+    def close(self) -> None:
+        self._response.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class HttpxSession:
+    """A ``requests.Session`` stand-in that sends requests over HTTP/2 with httpx.
+
+    Only the surface :class:`BaseClient` uses is implemented: ``headers``,
+    ``request`` and ``close``. Per-call headers are merged over the session
+    headers and a ``None`` value removes a header, as with ``requests``.
+    Transport failures are re-raised as the matching ``requests`` exceptions
+    so the client's error handling applies unchanged.
+
+    Responses are retried with the same policy as the requests backend:
+    GET, PUT and DELETE on 429 and 5xx, POST on 429 only, waiting for a capped
+    ``Retry-After`` or jittered exponential backoff between attempts.
+
+    Args:
+        pool_size (int): Keep-alive connections kept in the pool.
+        max_connections (int): Upper bound on open connections.
+        retries (int): Retries for failed connection attempts.
+        http2 (bool): Negotiate HTTP/2 where the server supports it.
+        status_retries (int): Retries for responses with a retryable status.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 20,
+        max_connections: int = 100,
+        retries: int = 3,
+        http2: bool = True,
+        status_retries: int = 3,
+    ):
+        if httpx is None:
+            raise ImportError(
+                "httpx is required for the httpx backend. "
+                'Install it with: pip install "paystack-api-wrapper[http2]"'
+            )
+        limits = httpx.Limits(
+            max_keepalive_connections=pool_size, max_connections=max_connections
+        )
+        self.headers = httpx.Headers()
+        self.status_retries = status_retries
+        self._client = httpx.Client(
+            http2=http2,
+            limits=limits,
+            transport=httpx.HTTPTransport(http2=http2, limits=limits, retries=retries),
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, Optional[str]]] = None,
+        data: Optional[bytes] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ):
+        merged = self.headers.copy()
+        for name, value in (headers or {}).items():
+            if value is None:
+                merged.pop(name, None)
+            else:
+                merged[name] = value
+        if params:
+            # requests omits None-valued parameters; httpx would send them empty.
+            params = {k: v for k, v in params.items() if v is not None}
+        request = self._client.build_request(
+            method,
+            url,
+            headers=merged,
+            content=data,
+            params=params,
+            timeout=timeout,
+        )
+        retry_statuses = (
+            _RETRY_STATUSES if method in _RETRY_METHODS else _UNPROCESSED_STATUSES
+        )
+        attempt = 0
+        while True:
+            response = self._send(request, stream)
+            if (
+                attempt >= self.status_retries
+                or response.status_code not in retry_statuses
+            ):
+                break
+            attempt += 1
+            response.close()
+            time.sleep(_retry_delay(attempt, response.headers))
+        return _StreamedResponse(response) if stream else response
+
+    def _send(self, request: "httpx.Request", stream: bool) -> "httpx.Response":
+        try:
+            return self._client.send(request, stream=stream)
+        except httpx.ConnectTimeout as e:
+            raise requests.exceptions.ConnectTimeout(e) from e
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.ReadTimeout(e) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e) from e
+        except httpx.HTTPError as e:
+            raise requests.exceptions.RequestException(e) from e
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class _AsyncStreamReader:
+    """Async file-like view of a streamed httpx body, as ``ijson.parse_async``
+    expects."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+        self._buffer = b""
+
+    async def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            try:
+                chunk = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                break
+            self._buffer += chunk
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+class _AsyncResponse:
+    """Wrap a streamed httpx response in the parts of ``aiohttp.ClientResponse``
+    that :class:`paystack.async_core.AsyncBaseClient` relies on."""
+
+    def __init__(self, response: "httpx.Response"):
+        self._response = response
+        self.status = response.status_code
+        self.headers = response.headers
+        self.content = _AsyncStreamReader(response.aiter_bytes())
+
+    async def read(self) -> bytes:
+        return await self._response.aread()
+
+
+class AsyncHttpxSession:
+    """An ``aiohttp.ClientSession`` stand-in that multiplexes requests over HTTP/2.
+
+    Only the surface :class:`AsyncBaseClient` uses is implemented: ``request``,
+    ``get``, ``closed`` and ``close``. Timeouts are re-raised as
+    :class:`asyncio.TimeoutError` and other transport failures as
+    :class:`NetworkError`, so the client's error handling applies unchanged.
+
+    Args:
+        timeout (float): Timeout in seconds for each request.
+        max_connections (int): Upper bound on open connections.
+        pool_size (int): Keep-alive connections kept in the pool.
+        http2 (bool): Negotiate HTTP/2 where the server supports it.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 10,
+        max_connections: int = 100,
+        pool_size: int = 20,
+        http2: bool = True,
+    ):
+        if httpx is None:
+            raise ImportError(
+                "httpx is required for the httpx backend. "
+                'Install it with: pip install "paystack-api-wrapper[http2]"'
+            )
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_keepalive_connections=pool_size, max_connections=max_connections
+            ),
+        )
+
+    @property
+    def closed(self) -> bool:
+        return self._client.is_closed
+
+    @contextlib.asynccontextmanager
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[bytes] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[_AsyncResponse]:
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+        request = self._client.build_request(
+            method, url, headers=headers, content=data, params=params
+        )
+        try:
+            response = await self._client.send(request, stream=True)
+            try:
+                yield _AsyncResponse(response)
+            finally:
+                await response.aclose()
+        except httpx.TimeoutException as e:
+            raise asyncio.TimeoutError() from e
+        except httpx.TransportError as e:
+            raise NetworkError(f"Connection error: {e}") from e
+        except httpx.HTTPError as e:
+            raise NetworkError(f"Request failed: {e}") from e
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    async def close(self) -> None:
+        await self._client.aclose()
@@ -1,8 +1,17 @@
 from .helpers import validate_email
-from .validators import _validate_amount_and_email, _validate_charge_authorization
 
 __all__ = [
     "validate_email",
     "_validate_amount_and_email",
     "_validate_charge_authorization",
 ]
+
+
+def __getattr__(name):
+    # The client no longer uses these validators itself, so their module is
+    # only imported when something asks for them (PEP 562).
+    if name in ("_validate_amount_and_email", "_validate_charge_authorization"):
+        from . import validators
+
+        return getattr(validators, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,63 @@
+"""
+A small thread-safe TTL cache used to memoize idempotent GET responses.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Least-recently-used cache whose entries expire after a per-entry TTL.
+
+    Args:
+        maxsize (int): Maximum number of entries kept; the least recently used
+            entry is evicted once the limit is reached.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for ``key``, or ``None`` if absent or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, resource: Optional[str] = None) -> None:
+        """Drop entries for ``resource`` and everything below it, or all entries.
+
+        Keys are expected to start with the endpoint path, so invalidating
+        ``"customer"`` drops ``"customer"`` and ``"customer/CUS_xyz"`` alike.
+        """
+        with self._lock:
+            if resource is None:
+                self._data.clear()
+                return
+            nested = resource + "/"
+            stale = [
+                k for k in self._data if k[0] == resource or k[0].startswith(nested)
+            ]
+            for key in stale:
+                del self._data[key]
+
+    def __len__(self) -> int:
+        return len(self._data)
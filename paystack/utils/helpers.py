@@ -1,7 +1,74 @@
+import json
 import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Union
 
 from ..exceptions import ValidationError
 
+try:
+    import orjson
+
+    # numpy scalars and arrays (e.g. amounts computed in pandas) are encoded
+    # natively instead of raising.
+    _ORJSON_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None
+
+# A single compiled regex (matched in C by ``re``) plus the memo below is
+# cheaper than full RFC 5322 parsers such as email-validator, which are pure
+# Python, and it accepts exactly the addresses Paystack's API does.
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+
+# Shared, read-only field errors for the email checks below.
+_EMAIL_REQUIRED_ERRORS = MappingProxyType({"email": "Email address is required"})
+_EMAIL_FORMAT_ERRORS = MappingProxyType(
+    {"email": "Please provide a valid email address"}
+)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serialize ``obj`` to UTF-8 JSON bytes, using orjson when it is installed.
+
+    Args:
+        obj (Any): The value to serialize.
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_DUMPS_OPTIONS)
+    # Match orjson's compact, unescaped UTF-8 output so request bodies are the
+    # same bytes whichever encoder is installed.
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def json_loads(raw: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+
+    Args:
+        raw (Union[bytes, str]): The encoded JSON document.
+
+    Raises:
+        ValueError: If ``raw`` is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=10_000)
+def is_valid_email_format(email: str) -> bool:
+    """
+    Check ``email`` against the address pattern Paystack accepts.
+
+    Results are memoized, so repeat customers skip the regex entirely.
+    """
+    # fullmatch, unlike match with a "$" anchor, rejects a trailing newline.
+    return _EMAIL_RE.fullmatch(email) is not None
+
 
 def validate_email(email):
     """
@@ -16,13 +83,11 @@ def validate_email(email):
     if not email or not isinstance(email, str) or len(email) > 254:
         raise ValidationError(
             message="Email is required",
-            field_errors={"email": "Email address is required"},
+            field_errors=_EMAIL_REQUIRED_ERRORS,
         )
 
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-
-    if not re.match(pattern, email):
+    if not is_valid_email_format(email):
         raise ValidationError(
             message="Invalid email format",
-            field_errors={"email": "Please provide a valid email address"},
+            field_errors=_EMAIL_FORMAT_ERRORS,
         )
@@ -0,0 +1,61 @@
+"""
+Incremental parsing of large Paystack list responses.
+
+ijson is an optional dependency; install it with
+``pip install "paystack-api-wrapper[stream]"``.
+"""
+
+from typing import Any, List, Optional
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    ijson = None
+
+
+def require_ijson():
+    """Return the ijson module, or raise a helpful ImportError if it is missing."""
+    if ijson is None:
+        raise ImportError(
+            "ijson is required for streaming responses. "
+            'Install it with: pip install "paystack-api-wrapper[stream]"'
+        )
+    return ijson
+
+
+class ItemCollector:
+    """
+    Turn ijson parse events into the items found at ``item_path``.
+
+    Also records the top-level ``status`` and ``message`` fields so callers can
+    detect Paystack's HTTP 200 ``"status": false`` errors once parsing ends.
+
+    Args:
+        item_path (str): ijson prefix of the items to emit, e.g. ``"data.item"``.
+    """
+
+    def __init__(self, item_path: str):
+        self.item_path = item_path
+        self.status: Optional[bool] = None
+        self.message: Optional[str] = None
+        self._builder = None
+
+    def feed(self, prefix: str, event: str, value: Any) -> List[Any]:
+        """Consume one parse event and return any items it completed."""
+        if self._builder is not None:
+            self._builder.event(event, value)
+            if prefix == self.item_path and event in ("end_map", "end_array"):
+                item, self._builder = self._builder.value, None
+                return [item]
+            return []
+        if prefix == self.item_path:
+            if event in ("start_map", "start_array"):
+                self._builder = ijson.ObjectBuilder()
+                self._builder.event(event, value)
+                return []
+            return [value]
+        if prefix == "status" and event == "boolean":
+            self.status = value
+        elif prefix == "message" and event == "string":
+            self.message = value
+        return []
@@ -22,14 +22,21 @@ def _validate_amount_and_email(email: str, amount: Union[int, str]):
 
     validate_email(email)
 
-    try:
+    # Plain ints and digit-only strings, the usual inputs, skip the
+    # try/except; anything else falls back to int() for its error handling.
+    if type(amount) is int:
+        amount_int = amount
+    elif type(amount) is str and amount.isdecimal():
         amount_int = int(amount)
-        if amount_int <= 0:
-            raise ValidationError("Amount must be a positive number")
-    except (ValueError, TypeError):
-        raise ValidationError(
-            "Amount must be a valid number string without comma or decimal"
-        )
+    else:
+        try:
+            amount_int = int(amount)
+        except (ValueError, TypeError):
+            raise ValidationError(
+                "Amount must be a valid number string without comma or decimal"
+            )
+    if amount_int <= 0:
+        raise ValidationError("Amount must be a positive number")
 
 
 def _validate_charge_authorization(
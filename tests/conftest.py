@@ -1,6 +1,10 @@
-import pytest
+import asyncio
 import os
 
+import pytest
+from aioresponses import aioresponses
+from yarl import URL
+
 from paystack.core import BaseClient
 from paystack.client import PaystackClient
 from paystack.endpoints import *
@@ -152,3 +156,35 @@ def verification_client(client):
 @pytest.fixture
 def virtual_terminal_client(client):
     return client.virtual_terminal
+
+
+class AsyncAPIRunner:
+    """Runs calls against a fresh async endpoint client with aiohttp mocked out."""
+
+    base_url = "https://api.paystack.co/"
+
+    def __init__(self, secret_key, mocked):
+        self.secret_key = secret_key
+        self.mocked = mocked
+
+    def run(self, api_class, call):
+        """Open ``api_class`` with ``async with``, await ``call(api)`` and return its
+        result."""
+
+        async def main():
+            async with api_class(self.secret_key) as api:
+                return await call(api)
+
+        return asyncio.run(main())
+
+    def sent(self, method, url):
+        """Return the requests made to ``url``, as recorded by aioresponses."""
+        return self.mocked.requests.get((method, URL(url)), [])
+
+
+@pytest.fixture
+def async_api(secret_key):
+    """Fixture to run async endpoint calls with aiohttp requests mocked by
+    aioresponses."""
+    with aioresponses() as mocked:
+        yield AsyncAPIRunner(secret_key, mocked)
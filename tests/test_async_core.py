@@ -0,0 +1,291 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+from paystack import (
+    APIError,
+    AsyncBaseClient,
+    AuthenticationError,
+    InvalidResponseError,
+    NetworkError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    ValidationError,
+)
+
+BASE_URL = "https://api.paystack.co/"
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_async_client_rejects_invalid_secret_key():
+    with pytest.raises(AuthenticationError):
+        AsyncBaseClient(secret_key="pk_test_123")
+
+
+def test_async_request_returns_data_and_meta(secret_key):
+    async def main():
+        async with AsyncBaseClient(secret_key=secret_key) as client:
+            with aioresponses() as mocked:
+                mocked.get(
+                    f"{BASE_URL}/test",
+                    payload={
+                        "status": True,
+                        "message": "ok",
+                        "data": {"x": 1},
+                        "meta": {"page": 1},
+                    },
+                )
+                result = await client.request("GET", "test")
+                sent = mocked.requests[("GET", aiohttp.client.URL(f"{BASE_URL}/test"))]
+                return result, sent[0].kwargs["headers"]
+
+    (data, meta), headers = run(main())
+    assert data == {"x": 1}
+    assert meta == {"page": 1}
+    assert headers["Authorization"] == f"Bearer {secret_key}"
+
+
+def test_async_request_without_authorization_for_public_calls(secret_key):
+    async def main():
+        async with AsyncBaseClient(secret_key=secret_key) as client:
+            with aioresponses() as mocked:
+                mocked.get(
+                    f"{BASE_URL}/test",
+                    payload={"status": True, "message": "ok", "data": {}},
+                )
+                await client.request("GET", "test", private=False)
+                sent = mocked.requests[("GET", aiohttp.client.URL(f"{BASE_URL}/test"))]
+                return sent[0].kwargs["headers"]
+
+    headers = run(main())
+    assert "Authorization" not in headers
+
+
+def test_async_requests_run_concurrently_over_one_session(secret_key):
+    async def main():
+        async with AsyncBaseClient(secret_key=secret_key) as client:
+            with aioresponses() as mocked:
+                for i in range(3):
+                    mocked.get(
+                        f"{BASE_URL}/customer/{i}",
+                        payload={"status": True, "message": "ok", "data": {"id": i}},
+                    )
+                results = await asyncio.gather(
+                    *(client.request("GET", f"customer/{i}") for i in range(3))
+                )
+                session = client.session
+            return results, session
+
+    results, session = run(main())
+    assert [data["id"] for data, _ in results] == [0, 1, 2]
+    assert session.closed
+
+
+def test_async_request_sends_lowercase_boolean_params(secret_key):
+    async def main():
+        async with AsyncBaseClient(secret_key=secret_key) as client:
+            with aioresponses() as mocked:
+                mocked.get(
+                    f"{BASE_URL}/test?use_cursor=true",
+                    payload={"status": True, "message": "ok", "data": []},
+                )
+                return await client.request("GET", "test", params={"use_cursor": True})
+
+    data, _ = run(main())
+    assert data == []
+
+
+@pytest.mark.parametrize(
+    "status, body, exc",
+    [
+        (404, {"status": False, "message": "Not found"}, NotFoundError),
+        (429, {"status": False, "message": "Slow down"}, RateLimitError),
+        (200, {"status": False, "message": "Nope"}, APIError),
+    ],
+)
+def test_async_request_maps_errors(secret_key, status, body, exc):
+    async def main():
+        async with AsyncBaseClient(secret_key=secret_key, max_retries=0) as client:
+            with aioresponses() as mocked:
+                mocked.get(f"{BASE_URL}/test", status=status, payload=body)
+                await client.request("GET", "test")
+
+    with pytest.raises(exc):
+        run(main())
+
+
+def test_async_request_invalid_json(secret_key):
+    async def main():
+        async with AsyncBaseClient(secret_key=secret_key) as client:
+            with aioresponses() as mocked:
+                mocked.get(f"{BASE_URL}/test", body="not json")
+                await client.request("GET", "test")
+
+    with pytest.raises(InvalidResponseError):
+        run(main())
+
+
+@pytest.mark.parametrize(
+    "error, message",
+    [
+        (asyncio.TimeoutError(), "timed out after 10 seconds"),
+        (aiohttp.ClientConnectionError("refused"), "Connection error"),
+        (aiohttp.ClientPayloadError("broken"), "Request failed"),
+    ],
+)
+def test_async_request_network_errors(secret_key, error, message):
+    async def main():
+        async with AsyncBaseClient(secret_key=secret_key) as client:
+            with aioresponses() as mocked:
+                mocked.get(f"{BASE_URL}/test", exception=error)
+                await client.request("GET", "test")
+
+    with pytest.raises(NetworkError) as excinfo:
+        run(main())
+    assert message in str(excinfo.value)
+
+
+def test_async_close_leaves_injected_session_open(secret_key):
+    async def main():
+        session = aiohttp.ClientSession()
+        client = AsyncBaseClient(secret_key=secret_key, session=session)
+        await client.close()
+        still_open = not session.closed
+        await session.close()
+        return still_open
+
+    assert run(main())
+
+
+def test_async_request_caches_get_and_invalidates_on_write(secret_key):
+    async def main():
+        async with AsyncBaseClient(secret_key=secret_key) as client:
+            with aioresponses() as mocked:
+                url = f"{BASE_URL}/plan/PLN_1"
+                body = {"status": True, "message": "ok", "data": {"id": 1}}
+                mocked.get(url, payload=body, repeat=True)
+                mocked.put(url, payload=body)
+                await client.request("GET", "plan/PLN_1", cache_ttl=30)
+                await client.request("GET", "plan/PLN_1", cache_ttl=30)
+                await client.request(
+                    "PUT", "plan/PLN_1", json_data={}, idempotency_key="idem-1"
+                )
+                await client.request("GET", "plan/PLN_1", cache_ttl=30)
+                gets = mocked.requests[("GET", aiohttp.client.URL(url))]
+                puts = mocked.requests[("PUT", aiohttp.client.URL(url))]
+                return len(gets), puts[0].kwargs["headers"]
+
+    get_count, put_headers = run(main())
+    assert get_count == 2
+    assert put_headers["Idempotency-Key"] == "idem-1"
+
+
+def test_async_request_stream_yields_items(secret_key):
+    async def main():
+        async with AsyncBaseClient(secret_key=secret_key) as client:
+            with aioresponses() as mocked:
+                mocked.get(
+                    f"{BASE_URL}/customer",
+                    payload={
+                        "status": True,
+                        "message": "ok",
+                        "data": [{"id": 1}, {"id": 2}],
+                    },
+                )
+                return [item async for item in client.request_stream("customer")]
+
+    assert run(main()) == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.parametrize(
+    "status, body, exc",
+    [
+        (200, {"status": False, "message": "Nope"}, APIError),
+        (404, {"status": False, "message": "Not found"}, NotFoundError),
+    ],
+)
+def test_async_request_stream_errors(secret_key, status, body, exc):
+    async def main():
+        async with AsyncBaseClient(secret_key=secret_key) as client:
+            with aioresponses() as mocked:
+                mocked.get(f"{BASE_URL}/customer", status=status, payload=body)
+                return [item async for item in client.request_stream("customer")]
+
+    with pytest.raises(exc):
+        run(main())
+
+
+def test_async_request_retries_idempotent_calls(secret_key, monkeypatch):
+    monkeypatch.setattr("paystack.async_core._retry_delay", lambda *args: 0)
+
+    async def main():
+        async with AsyncBaseClient(secret_key=secret_key) as client:
+            with aioresponses() as mocked:
+                url = f"{BASE_URL}/test"
+                mocked.get(url, status=429, payload={"message": "slow down"})
+                mocked.get(url, status=503, payload={"message": "unavailable"})
+                mocked.get(url, payload={"status": True, "message": "ok", "data": 1})
+                mocked.post(url, status=429, payload={"message": "slow down"})
+                mocked.post(url, status=503, payload={"message": "unavailable"})
+                data, _ = await client.request("GET", "test")
+                with pytest.raises(ServerError):
+                    await client.request("POST", "test", json_data={})
+                return (
+                    data,
+                    len(mocked.requests[("GET", aiohttp.client.URL(url))]),
+                    len(mocked.requests[("POST", aiohttp.client.URL(url))]),
+                )
+
+    assert run(main()) == (1, 3, 2)
+
+
+def test_async_retry_delay_honours_capped_retry_after():
+    from paystack.async_core import _retry_delay
+
+    assert _retry_delay(1, {"Retry-After": "2"}) == 2
+    assert _retry_delay(1, {"Retry-After": "600"}) == 5
+    assert 1 <= _retry_delay(2, {"Retry-After": "soon"}) <= 1.25
+
+
+def test_async_fan_out_can_return_exceptions(secret_key):
+    async def ok():
+        return "done"
+
+    async def fail():
+        raise ValidationError("nope")
+
+    async def main():
+        async with AsyncBaseClient(secret_key) as client:
+            return await client._fan_out(
+                {"a": ok, "b": fail}, max_workers=2, return_exceptions=True
+            )
+
+    results = run(main())
+    assert results["a"] == "done"
+    assert isinstance(results["b"], ValidationError)
+
+
+def test_async_client_rejects_sync_context_manager(secret_key):
+    with pytest.raises(TypeError, match="use 'async with'"):
+        with AsyncBaseClient(secret_key):
+            pass
+
+
+def test_async_network_errors_without_aiohttp(secret_key, monkeypatch):
+    monkeypatch.setattr("paystack.async_core.aiohttp", None)
+    monkeypatch.setattr("paystack.async_core._CONNECTION_ERRORS", ())
+    monkeypatch.setattr("paystack.async_core._CLIENT_ERRORS", ())
+    client = AsyncBaseClient(secret_key, http_backend="httpx")
+
+    with pytest.raises(NetworkError, match="timed out"):
+        with client._network_errors():
+            raise asyncio.TimeoutError
+    with pytest.raises(KeyError):
+        with client._network_errors():
+            raise KeyError("unrelated")
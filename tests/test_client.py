@@ -1,5 +1,12 @@
+import collections.abc
+import inspect
+import typing
+
 import pytest
+
+import paystack.endpoints
 from paystack import PaystackClient
+from paystack.core import PaystackResponse
 
 
 def test_paystack_client_initialization():
@@ -38,3 +45,80 @@ def test_paystack_client_initialization():
 def test_paystack_client_repr():
     client = PaystackClient(secret_key="sk_test_abcdefghijklmnopqrstuvwxyz1234567890")
     assert repr(client) == "PaystackClient(base_url='https://api.paystack.co/')"
+
+
+def test_paystack_client_endpoints_share_one_pooled_session():
+    from requests.adapters import HTTPAdapter
+
+    client = PaystackClient(secret_key="sk_test_abcdefghijklmnopqrstuvwxyz1234567890")
+    endpoints = (
+        client.disputes,
+        client.plans,
+        client.integration,
+        client.miscellaneous,
+    )
+
+    assert all(endpoint.session is client.session for endpoint in endpoints)
+    assert isinstance(
+        client.session.get_adapter("https://api.paystack.co/"), HTTPAdapter
+    )
+
+
+def test_paystack_client_context_manager_keeps_shared_session_open(mocker):
+    with PaystackClient(
+        secret_key="sk_test_abcdefghijklmnopqrstuvwxyz1234567890"
+    ) as client:
+        close = mocker.spy(client.session, "close")
+
+    close.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "api_class", ["DisputesAPI", "IntegrationAPI", "MiscellaneousAPI", "PlansAPI"]
+)
+def test_standalone_endpoint_clients_use_default_base_url(api_class):
+    import paystack.endpoints
+
+    api = getattr(paystack.endpoints, api_class)(
+        "sk_test_abcdefghijklmnopqrstuvwxyz1234567890"
+    )
+
+    assert api.base_url == "https://api.paystack.co/"
+
+
+def test_paystack_client_forwards_transport_settings():
+    from paystack.httpx_core import HttpxSession
+
+    client = PaystackClient(
+        secret_key="sk_test_abcdefghijklmnopqrstuvwxyz1234567890",
+        timeout=30,
+        http_backend="httpx",
+    )
+
+    assert isinstance(client.session, HttpxSession)
+    assert client.disputes.session is client.session
+    assert client.timeout == client.plans.timeout == client.miscellaneous.timeout == 30
+
+
+SYNC_API_CLASSES = sorted(
+    name
+    for name, member in vars(paystack.endpoints).items()
+    if inspect.isclass(member) and name.endswith("API") and not name.startswith("Async")
+)
+
+
+@pytest.mark.parametrize("api_class", SYNC_API_CLASSES)
+def test_endpoint_methods_are_annotated_with_paystack_response(api_class):
+    cls = getattr(paystack.endpoints, api_class)
+    for name, member in vars(cls).items():
+        if not inspect.isfunction(member) or name.startswith("_"):
+            continue
+        annotation = inspect.signature(member).return_annotation
+        origin = typing.get_origin(annotation)
+        if origin is collections.abc.Iterator:
+            continue
+        if origin is dict:
+            value = typing.get_args(annotation)[1]
+            assert PaystackResponse in (value, *typing.get_args(value)), name
+        else:
+            assert annotation is PaystackResponse, name
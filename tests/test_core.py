@@ -1,14 +1,14 @@
 import pytest
 import responses
-from requests.exceptions import Timeout, ConnectTimeout, ReadTimeout
+from requests.exceptions import ConnectTimeout, ReadTimeout, Timeout
 
 from paystack import (
     APIError,
-    NetworkError,
-    InvalidResponseError,
-    ValidationError,
     AuthenticationError,
+    InvalidResponseError,
+    NetworkError,
     TransactionFailureError,
+    ValidationError,
 )
 
 
@@ -26,20 +26,61 @@ def test_baseclient_sets_authorization_header(base_client, secret_key):
     assert data == {"x": 1}
 
 
-def test_baseclient_removes_authorization_header_for_private_false(base_client, mocker):
+@responses.activate
+def test_baseclient_removes_authorization_header_for_private_false(base_client):
+    responses.add(
+        responses.GET,
+        f"{base_client.base_url}/test",
+        json={"status": True, "message": "ok", "data": {"x": 1}},
+        status=200,
+    )
+
+    data, meta = base_client.request("GET", "test", private=False)
+
+    # Assert that the 'Authorization' header was not sent with the request
+    sent_headers = responses.calls[0].request.headers
+    assert "Authorization" not in sent_headers
+    assert sent_headers["User-Agent"] == "paystack-client/1.0.0"
+    assert "Authorization" in base_client.session.headers
+    assert data == {"x": 1}
+
+
+@responses.activate
+def test_baseclient_negotiates_compressed_json(base_client):
+    from urllib3.util import make_headers
+
+    responses.add(
+        responses.GET,
+        f"{base_client.base_url}/test",
+        json={"status": True, "message": "ok", "data": {}},
+        status=200,
+    )
+
+    base_client.request("GET", "test")
+
+    sent_headers = responses.calls[0].request.headers
+    assert sent_headers["Accept"] == "application/json"
+    assert (
+        sent_headers["Accept-Encoding"]
+        == make_headers(accept_encoding=True)["accept-encoding"]
+    )
+    assert "gzip" in sent_headers["Accept-Encoding"]
+    assert sent_headers["Connection"] == "keep-alive"
+
+
+def test_baseclient_passes_no_per_call_headers_by_default(base_client, mocker):
     mock_request = mocker.patch.object(base_client.session, "request")
     mock_request.return_value = mocker.Mock(
         status_code=200,
-        json=lambda: {"status": True, "message": "ok", "data": {"x": 1}},
+        content=b'{"status": true, "message": "ok", "data": {"x": 1}}',
         headers={"x-amzn-requestid": "test-request-id"},
     )
 
-    data, meta = base_client.request("GET", "test", private=False)
+    base_client.request("GET", "test")
+    assert mock_request.call_args[1]["headers"] is None
 
-    # Assert that the 'Authorization' header was removed before the request was sent
-    called_headers = mock_request.call_args[1]["headers"]
-    assert "Authorization" not in called_headers
-    assert data == {"x": 1}
+    base_client.request("POST", "test", idempotency_key="idem-123")
+    assert mock_request.call_args[1]["headers"] == {"Idempotency-Key": "idem-123"}
 
 
 def test_baseclient_repr_with_empty_secret_key():
@@ -295,6 +336,13 @@ def test_validate_amount_invalid_type(base_client):
         base_client._validate_amount(amount="abc")
 
 
+def test_validate_amount_accepts_int_and_digit_strings(base_client):
+    base_client._validate_amount(amount=10000)
+    base_client._validate_amount(amount="10000")
+    with pytest.raises(ValidationError, match="Amount too small for NGN"):
+        base_client._validate_amount(amount="-500")
+
+
 @responses.activate
 def test_validate_amount_too_small(base_client):
     responses.add(
@@ -421,3 +469,575 @@ def test_handle_success_response_paystack_error_with_field_errors(base_client):
         base_client.request("POST", "initiate_payment")
     assert "Validation failed" in str(excinfo.value)
     assert excinfo.value.field_errors == {"email": "Invalid email address"}
+
+
+def test_baseclient_mounts_pooled_adapter(secret_key):
+    from paystack.core import BaseClient
+
+    client = BaseClient(secret_key=secret_key, pool_size=50)
+    adapter = client.session.get_adapter("https://api.paystack.co/")
+    assert adapter._pool_maxsize == 50
+    assert adapter._pool_connections == 1
+    assert adapter.max_retries.total == 5
+    assert adapter.max_retries.status == 3
+    assert 429 in adapter.max_retries.status_forcelist
+    assert "POST" not in adapter.max_retries.allowed_methods
+
+
+def test_retry_caps_retry_after_wait():
+    from urllib3 import HTTPResponse
+
+    from paystack.core import _build_retry
+
+    retry = _build_retry(None)
+    response = HTTPResponse(status=429, headers={"Retry-After": "120"})
+    assert retry.get_retry_after(response) == retry.MAX_RETRY_AFTER
+    assert retry.new(total=1).get_retry_after(response) == retry.MAX_RETRY_AFTER
+
+
+@responses.activate
+def test_baseclient_retries_get_on_rate_limit(base_client):
+    url = f"{base_client.base_url}/test"
+    responses.add(responses.GET, url, json={"message": "slow down"}, status=429)
+    responses.add(
+        responses.GET,
+        url,
+        json={"status": True, "message": "ok", "data": {"x": 1}},
+        status=200,
+    )
+
+    data, _ = base_client.request("GET", "test")
+
+    assert data == {"x": 1}
+    assert len(responses.calls) == 2
+
+
+def test_baseclient_keeps_injected_session(secret_key):
+    import requests
+
+    from paystack.core import BaseClient
+
+    session = requests.Session()
+    client = BaseClient(secret_key=secret_key, session=session)
+    assert client.session is session
+    assert client.session.get_adapter("https://api.paystack.co/").max_retries.total == 0
+
+
+@responses.activate
+def test_baseclient_retries_idempotent_requests_on_gateway_errors(base_client):
+    url = f"{base_client.base_url}/test"
+    responses.add(responses.GET, url, json={"message": "unavailable"}, status=503)
+    responses.add(
+        responses.GET,
+        url,
+        json={"status": True, "message": "ok", "data": {"x": 1}},
+        status=200,
+    )
+
+    data, _ = base_client.request("GET", "test")
+
+    assert data == {"x": 1}
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_baseclient_does_not_retry_post(base_client):
+    from paystack import ServerError
+
+    responses.add(
+        responses.POST,
+        f"{base_client.base_url}/test",
+        json={"message": "unavailable"},
+        status=503,
+    )
+
+    with pytest.raises(ServerError):
+        base_client.request("POST", "test", json_data={"a": 1})
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_baseclient_retries_post_on_rate_limit(base_client):
+    url = f"{base_client.base_url}/test"
+    responses.add(responses.POST, url, json={"message": "slow down"}, status=429)
+    responses.add(
+        responses.POST,
+        url,
+        json={"status": True, "message": "ok", "data": {"x": 1}},
+        status=200,
+    )
+
+    data, _ = base_client.request("POST", "test", json_data={"a": 1})
+
+    assert data == {"x": 1}
+    assert len(responses.calls) == 2
+    assert responses.calls[1].request.body == responses.calls[0].request.body
+
+
+@responses.activate
+def test_baseclient_max_retries_zero_disables_retries(secret_key):
+    from paystack import ServerError
+    from paystack.core import BaseClient
+
+    client = BaseClient(secret_key=secret_key, max_retries=0)
+    responses.add(
+        responses.GET,
+        f"{client.base_url}/test",
+        json={"message": "unavailable"},
+        status=503,
+    )
+
+    with pytest.raises(ServerError):
+        client.request("GET", "test")
+    assert len(responses.calls) == 1
+
+
+def test_baseclient_shares_session_per_key_and_base_url(secret_key):
+    from paystack.core import BaseClient
+    from paystack.endpoints import ChargeAPI, CustomersAPI, DisputesAPI, PlansAPI
+
+    assert BaseClient(secret_key).session is BaseClient(secret_key).session
+    assert CustomersAPI(secret_key).session is ChargeAPI(secret_key).session
+    assert DisputesAPI(secret_key).session is PlansAPI(secret_key).session
+    assert BaseClient(secret_key).session is not BaseClient("sk_test_other_key").session
+    assert (
+        BaseClient(secret_key).session
+        is not BaseClient(secret_key, base_url="https://example.com").session
+    )
+
+
+@responses.activate
+def test_baseclient_caches_get_when_ttl_given(base_client):
+    base_client.invalidate()
+    responses.add(
+        responses.GET,
+        f"{base_client.base_url}/cached",
+        json={"status": True, "message": "ok", "data": {"x": 1}},
+        status=200,
+    )
+
+    first = base_client.request("GET", "cached", params={"a": 1}, cache_ttl=30)
+    second = base_client.request("GET", "cached", params={"a": 1}, cache_ttl=30)
+    base_client.request("GET", "cached", params={"a": 2}, cache_ttl=30)
+    base_client.request("GET", "cached", params={"a": 1})
+
+    assert first == second
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_baseclient_mutating_request_invalidates_resource(base_client):
+    base_client.invalidate()
+    responses.add(
+        responses.GET,
+        f"{base_client.base_url}/thing/1",
+        json={"status": True, "message": "ok", "data": {"x": 1}},
+        status=200,
+    )
+    responses.add(
+        responses.PUT,
+        f"{base_client.base_url}/thing/1",
+        json={"status": True, "message": "ok", "data": {"x": 2}},
+        status=200,
+    )
+
+    base_client.request("GET", "thing/1", cache_ttl=30)
+    base_client.request("PUT", "thing/1", json_data={"x": 2})
+    base_client.request("GET", "thing/1", cache_ttl=30)
+
+    assert [call.request.method for call in responses.calls] == ["GET", "PUT", "GET"]
+
+
+@responses.activate
+def test_baseclient_does_not_cache_errors(base_client):
+    from paystack import NotFoundError
+
+    base_client.invalidate()
+    url = f"{base_client.base_url}/flaky"
+    responses.add(responses.GET, url, json={"message": "missing"}, status=404)
+    responses.add(
+        responses.GET,
+        url,
+        json={"status": True, "message": "ok", "data": {"x": 1}},
+        status=200,
+    )
+
+    with pytest.raises(NotFoundError):
+        base_client.request("GET", "flaky", cache_ttl=30)
+    data, _ = base_client.request("GET", "flaky", cache_ttl=30)
+    assert data == {"x": 1}
+
+
+@responses.activate
+def test_baseclient_rate_limit_parses_body_once(base_client, mocker):
+    from paystack import RateLimitError, core
+
+    loads = mocker.spy(core, "json_loads")
+    responses.add(
+        responses.GET,
+        f"{base_client.base_url}/limited",
+        json={"status": False, "message": "Too many requests"},
+        headers={"Retry-After": "15"},
+        status=429,
+    )
+
+    with pytest.raises(RateLimitError) as excinfo:
+        base_client.request("GET", "limited")
+
+    assert excinfo.value.retry_after == 15
+    assert excinfo.value.message == "Too many requests"
+    assert loads.call_count == 1
+
+
+def test_build_url_strips_leading_slash_and_memoizes(base_client):
+    from paystack.core import _join_url
+
+    _join_url.cache_clear()
+    assert base_client._build_url("/customer/CUS_1") == (
+        f"{base_client.base_url}/customer/CUS_1"
+    )
+    assert base_client._build_url("/customer/CUS_1") == (
+        f"{base_client.base_url}/customer/CUS_1"
+    )
+    assert _join_url.cache_info().hits == 1
+
+
+@responses.activate
+def test_request_returns_paystack_response(base_client):
+    from paystack import PaystackResponse
+
+    responses.add(
+        responses.GET,
+        f"{base_client.base_url}/test",
+        json={"status": True, "message": "ok", "data": {"x": 1}, "meta": {"page": 1}},
+        status=200,
+    )
+
+    result = base_client.request("GET", "test")
+
+    assert isinstance(result, PaystackResponse)
+    assert result.data == {"x": 1}
+    assert result.meta == {"page": 1}
+    assert result == ({"x": 1}, {"page": 1})
+    assert not hasattr(result, "__dict__")
+
+
+@pytest.mark.parametrize("value", [None, "", "   "])
+def test_require_rejects_missing_value(base_client, value):
+    with pytest.raises(ValidationError) as excinfo:
+        base_client._require("reference", value)
+    assert excinfo.value.message == "Missing required parameters: reference"
+    assert excinfo.value.field_errors == {"reference": "This field is required"}
+
+
+@pytest.mark.parametrize("value", ["ref_123", 0, 123])
+def test_require_accepts_present_value(base_client, value):
+    base_client._require("reference", value)
+
+
+def test_require_decorator_checks_positional_keyword_and_default_arguments():
+    from paystack.core import require
+
+    @require("a", "b")
+    def method(self, a, b=None, c=None):
+        return a, b
+
+    assert method(None, "x", b=0) == ("x", 0)
+    assert method(None, "x", "y") == ("x", "y")
+
+    with pytest.raises(ValidationError) as excinfo:
+        method(None, " ")
+    assert excinfo.value.message == "Missing required parameters: a, b"
+    assert excinfo.value.field_errors == {
+        "a": "This field is required",
+        "b": "This field is required",
+    }
+
+
+@responses.activate
+def test_mutating_request_skips_invalidation_when_cache_empty(base_client, mocker):
+    base_client.invalidate()
+    invalidate = mocker.spy(base_client._cache, "invalidate")
+    responses.add(
+        responses.POST,
+        f"{base_client.base_url}/test",
+        json={"status": True, "message": "ok", "data": {}},
+        status=200,
+    )
+
+    base_client.request("POST", "test", json_data={"a": 1})
+
+    invalidate.assert_not_called()
+
+
+@responses.activate
+def test_request_stream_yields_items(base_client):
+    responses.add(
+        responses.GET,
+        f"{base_client.base_url}/customer",
+        json={
+            "status": True,
+            "message": "Customers retrieved",
+            "data": [{"id": 1, "tags": ["a"]}, {"id": 2, "tags": []}],
+            "meta": {"page": 1},
+        },
+        status=200,
+    )
+
+    items = base_client.request_stream("customer", params={"perPage": 2})
+
+    assert list(items) == [{"id": 1, "tags": ["a"]}, {"id": 2, "tags": []}]
+    assert responses.calls[0].request.params == {"perPage": "2"}
+
+
+@responses.activate
+def test_request_stream_raises_for_status_false(base_client):
+    responses.add(
+        responses.GET,
+        f"{base_client.base_url}/customer",
+        json={"status": False, "message": "Invalid query"},
+        status=200,
+    )
+
+    with pytest.raises(APIError, match="Invalid query"):
+        list(base_client.request_stream("customer"))
+
+
+@responses.activate
+def test_request_stream_maps_http_errors(base_client):
+    from paystack import NotFoundError
+
+    responses.add(
+        responses.GET,
+        f"{base_client.base_url}/customer",
+        json={"status": False, "message": "Not found"},
+        status=404,
+    )
+
+    with pytest.raises(NotFoundError):
+        list(base_client.request_stream("customer"))
+
+
+@responses.activate
+def test_request_stream_invalid_json(base_client):
+    responses.add(
+        responses.GET,
+        f"{base_client.base_url}/customer",
+        body='{"status": true, "data": [{"id": 1}, ',
+        status=200,
+    )
+
+    with pytest.raises(InvalidResponseError):
+        list(base_client.request_stream("customer"))
+
+
+def test_request_stream_requires_ijson(base_client, monkeypatch):
+    from paystack.utils import streaming
+
+    monkeypatch.setattr(streaming, "ijson", None)
+
+    with pytest.raises(ImportError, match="stream"):
+        list(base_client.request_stream("customer"))
+
+
+def test_single_flight_coalesces_concurrent_calls(base_client):
+    import threading
+    import time
+
+    calls = []
+    release = threading.Event()
+
+    def slow_call():
+        calls.append(1)
+        release.wait(timeout=5)
+        return "result"
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(base_client._single_flight("key", slow_call))
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+    assert base_client._inflight == {}
+
+
+def test_single_flight_shares_exceptions_and_resets(base_client):
+    def failing_call():
+        raise NetworkError("boom")
+
+    with pytest.raises(NetworkError):
+        base_client._single_flight("key", failing_call)
+    assert base_client._single_flight("key", lambda: "ok") == "ok"
+
+
+def test_paginate_prefetches_next_page_while_rows_are_consumed(base_client):
+    import threading
+
+    from paystack.core import PaystackResponse, _next_page
+
+    second_page_requested = threading.Event()
+
+    def fetch(page):
+        if page == 2:
+            second_page_requested.set()
+        return PaystackResponse([page], {"page": page, "pageCount": 2})
+
+    rows = base_client._paginate(fetch, _next_page, start=1)
+
+    assert next(rows) == 1
+    assert second_page_requested.wait(timeout=5)
+    assert list(rows) == [2]
+
+
+def test_paginate_stops_on_empty_page(base_client):
+    from paystack.core import PaystackResponse, _next_page
+
+    pages = []
+
+    def fetch(page):
+        pages.append(page)
+        return PaystackResponse([], {"page": page, "pageCount": 5})
+
+    assert list(base_client._paginate(fetch, _next_page, start=1)) == []
+    assert pages == [1]
+
+
+@responses.activate
+def test_request_schema_projects_cached_rows(base_client):
+    base_client.invalidate()
+    responses.add(
+        responses.GET,
+        f"{base_client.base_url}/rows",
+        json={"status": True, "message": "ok", "data": [{"a": 1, "b": 2}]},
+        status=200,
+    )
+
+    records, _ = base_client.request("GET", "rows", cache_ttl=30, schema=("b", "a"))
+    rows, _ = base_client.request("GET", "rows", cache_ttl=30)
+
+    assert records == [(2, 1)]
+    assert rows == [{"a": 1, "b": 2}]
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_request_schema_ignores_non_list_data(base_client):
+    responses.add(
+        responses.GET,
+        f"{base_client.base_url}/single",
+        json={"status": True, "message": "ok", "data": {"a": 1}},
+        status=200,
+    )
+
+    data, _ = base_client.request("GET", "single", schema=("a",))
+
+    assert data == {"a": 1}
+
+
+def test_baseclient_context_manager_keeps_shared_session_open(secret_key, mocker):
+    from paystack.core import BaseClient
+
+    other = BaseClient(secret_key=secret_key, pool_size=3)
+    close = mocker.spy(other.session, "close")
+    with BaseClient(secret_key=secret_key, pool_size=3) as client:
+        assert client.session is other.session
+
+    close.assert_not_called()
+    assert BaseClient(secret_key=secret_key, pool_size=3).session is other.session
+
+
+def test_close_sessions_closes_and_forgets_shared_sessions(secret_key, mocker):
+    from paystack import close_sessions
+    from paystack.core import BaseClient
+
+    session = BaseClient(secret_key=secret_key, pool_size=3).session
+    close = mocker.spy(session, "close")
+
+    close_sessions()
+
+    close.assert_called_once()
+    assert BaseClient(secret_key=secret_key, pool_size=3).session is not session
+
+
+def test_baseclient_close_leaves_injected_session_open(secret_key, mocker):
+    import requests
+
+    from paystack.core import BaseClient
+
+    session = requests.Session()
+    close = mocker.spy(session, "close")
+    BaseClient(secret_key=secret_key, session=session).close()
+    close.assert_not_called()
+
+
+def test_endpoint_clients_have_no_instance_dict(secret_key):
+    import paystack.endpoints
+    from paystack.core import BaseClient
+
+    api_classes = [
+        cls
+        for name, cls in vars(paystack.endpoints).items()
+        if isinstance(cls, type) and name.endswith("API")
+    ]
+    assert len(api_classes) > 20
+
+    for client in (
+        BaseClient(secret_key=secret_key),
+        *(api_class(secret_key) for api_class in api_classes),
+    ):
+        assert not hasattr(client, "__dict__")
+        with pytest.raises(AttributeError):
+            client.unexpected = True
+
+
+@responses.activate
+def test_request_sends_pre_encoded_json_body(base_client):
+    from paystack.utils.helpers import json_dumps
+
+    responses.add(
+        responses.POST,
+        f"{base_client.base_url}/plan",
+        json={"status": True, "message": "ok", "data": {}},
+        status=200,
+    )
+    payload = {"name": "Monthly", "amount": 5000, "description": "Café plan"}
+
+    base_client.request("POST", "plan", json_data=payload)
+
+    sent = responses.calls[0].request
+    assert sent.body == json_dumps(payload)
+    assert isinstance(sent.body, bytes)
+    assert sent.headers["Content-Type"] == "application/json"
+
+
+def test_endpoint_clients_use_base_client_constructor(secret_key):
+    from paystack.core import BaseClient
+    from paystack.endpoints import (
+        ProductsAPI,
+        SettlementsAPI,
+        SubscriptionsAPI,
+        TerminalAPI,
+        TransactionSplitsAPI,
+    )
+
+    for api_class in (
+        ProductsAPI,
+        SettlementsAPI,
+        SubscriptionsAPI,
+        TerminalAPI,
+        TransactionSplitsAPI,
+    ):
+        assert api_class.__init__ is BaseClient.__init__
+        client = api_class(secret_key, timeout=3, pool_size=4)
+        assert client.timeout == 3
+        assert client.session is BaseClient(secret_key, pool_size=4).session
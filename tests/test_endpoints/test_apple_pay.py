@@ -1,5 +1,6 @@
 import responses
 
+from paystack.endpoints import AsyncApplePayAPI
 from tests.utils import assert_api_error_contains
 
 
@@ -107,6 +108,23 @@ def test_list_domains_with_previous_cursor(apple_pay_client):
     assert meta["previous"] == "cursor_previous"
 
 
+@responses.activate
+def test_list_domains_sends_empty_cursor_and_no_empty_query(apple_pay_client):
+    mock_response = {"status": True, "message": "Domains retrieved", "data": []}
+    responses.add(
+        responses.GET,
+        f"{apple_pay_client.base_url}/apple-pay/domain",
+        json=mock_response,
+        status=200,
+    )
+
+    apple_pay_client.list_domains()
+    apple_pay_client.list_domains(next_cursor="")
+
+    assert "?" not in responses.calls[0].request.url
+    assert responses.calls[1].request.url.endswith("/apple-pay/domain?next=")
+
+
 @responses.activate
 def test_list_domains_invalid_key(apple_pay_client):
     mock_response = {"status": False, "message": "Invalid API key"}
@@ -153,3 +171,39 @@ def test_unregister_domain_invalid_key(apple_pay_client):
     assert_api_error_contains(
         apple_pay_client.unregister_domain, "Invalid API key", domain_name=domain_name
     )
+
+
+def test_async_list_domains(async_api):
+    async_api.mocked.get(
+        f"{async_api.base_url}/apple-pay/domain?use_cursor=false",
+        payload={
+            "status": True,
+            "message": "Retrieved",
+            "data": {"domainNames": ["example.com"]},
+        },
+    )
+
+    data, meta = async_api.run(
+        AsyncApplePayAPI, lambda apple_pay: apple_pay.list_domains(use_cursor=False)
+    )
+
+    assert data["domainNames"] == ["example.com"]
+    assert meta == {}
+
+
+@responses.activate
+def test_stream_domains(apple_pay_client):
+    responses.add(
+        responses.GET,
+        f"{apple_pay_client.base_url}/apple-pay/domain",
+        json={
+            "status": True,
+            "message": "Apple Pay registered domains retrieved",
+            "data": {"domainNames": ["example.com", "shop.example.com"]},
+        },
+        status=200,
+    )
+
+    domains = list(apple_pay_client.stream_domains())
+
+    assert domains == ["example.com", "shop.example.com"]
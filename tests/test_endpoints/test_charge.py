@@ -1,7 +1,11 @@
+import asyncio
+import json
+
 import pytest
 import responses
 
 from paystack import ValidationError
+from paystack.endpoints import AsyncChargeAPI
 from tests.utils import assert_api_error_contains
 
 
@@ -69,11 +73,37 @@ def test_create_charge_with_all_optional_params(charge_client):
 
 
 @responses.activate
-def test_create_charge_invalid_bearer(charge_client):
+def test_create_charge_sends_only_provided_fields(charge_client):
+    responses.add(
+        responses.POST,
+        f"{charge_client.base_url}/charge",
+        json={"status": True, "message": "Charge initiated", "data": {}},
+        status=200,
+    )
+
+    charge_client.create(
+        email="customer@example.com",
+        amount=10000,
+        transaction_charge=0,
+        metadata={"cart_id": 398},
+    )
+
+    sent = json.loads(responses.calls[0].request.body)
+    assert json.loads(sent.pop("metadata")) == {"cart_id": 398}
+    assert sent == {
+        "email": "customer@example.com",
+        "amount": "10000",
+        "transaction_charge": 0,
+    }
+
+
+@responses.activate
+@pytest.mark.parametrize("bearer", ["invalid", ""])
+def test_create_charge_invalid_bearer(charge_client, bearer):
     payload = {
         "email": "customer@example.com",
         "amount": "10000",
-        "bearer": "invalid",
+        "bearer": bearer,
     }
     with pytest.raises(
         ValidationError, match="bearer must be either 'account' or 'subaccount'"
@@ -346,3 +376,97 @@ def test_check_pending_charge_invalid_key(charge_client):
     assert_api_error_contains(
         charge_client.check_pending_charge, "Invalid API key", reference=reference
     )
+
+
+def test_async_check_pending_charge(async_api):
+    for ref in ("ref_1", "ref_2"):
+        async_api.mocked.get(
+            f"{async_api.base_url}/charge/{ref}",
+            payload={
+                "status": True,
+                "message": "Reference check successful",
+                "data": {"reference": ref, "status": "success"},
+            },
+        )
+
+    results = async_api.run(
+        AsyncChargeAPI,
+        lambda charge: asyncio.gather(
+            charge.check_pending_charge(reference="ref_1"),
+            charge.check_pending_charge(reference="ref_2"),
+        ),
+    )
+
+    assert [data["reference"] for data, _ in results] == ["ref_1", "ref_2"]
+
+
+def test_async_check_pending_charge_validates_eagerly(secret_key):
+    charge = AsyncChargeAPI(secret_key)
+    with pytest.raises(ValidationError):
+        charge.check_pending_charge(reference="")
+
+
+@responses.activate
+def test_check_many_pending_charges(charge_client):
+    references = ["ref_1", "ref_2"]
+    for ref in references:
+        responses.add(
+            responses.GET,
+            f"{charge_client.base_url}/charge/{ref}",
+            json={
+                "status": True,
+                "message": "Reference check successful",
+                "data": {"reference": ref, "status": "success"},
+            },
+            status=200,
+        )
+
+    results = charge_client.check_many(references)
+
+    assert {ref: data["reference"] for ref, (data, _) in results.items()} == {
+        "ref_1": "ref_1",
+        "ref_2": "ref_2",
+    }
+
+
+def test_async_check_many_pending_charges(async_api):
+    for ref in ("ref_1", "ref_2", "ref_3"):
+        async_api.mocked.get(
+            f"{async_api.base_url}/charge/{ref}",
+            payload={
+                "status": True,
+                "message": "Reference check successful",
+                "data": {"reference": ref},
+            },
+        )
+
+    results = async_api.run(
+        AsyncChargeAPI,
+        lambda charge: charge.check_many(["ref_1", "ref_2", "ref_3"], max_workers=2),
+    )
+
+    assert list(results) == ["ref_1", "ref_2", "ref_3"]
+    assert results["ref_2"][0]["reference"] == "ref_2"
+
+
+def test_async_check_pending_charge_coalesces_concurrent_polls(async_api):
+    url = f"{async_api.base_url}/charge/ref_1"
+    async_api.mocked.get(
+        url,
+        payload={
+            "status": True,
+            "message": "Reference check successful",
+            "data": {"reference": "ref_1", "status": "pending"},
+        },
+        repeat=True,
+    )
+
+    results = async_api.run(
+        AsyncChargeAPI,
+        lambda charge: asyncio.gather(
+            *(charge.check_pending_charge(reference="ref_1") for _ in range(5))
+        ),
+    )
+
+    assert all(data["reference"] == "ref_1" for data, _ in results)
+    assert len(async_api.sent("GET", url)) == 1
@@ -1,7 +1,10 @@
+import json
+
 import pytest
 import responses
-from paystack import ValidationError
+from paystack import PaystackError, ValidationError
 from paystack.exceptions import APIError
+from paystack.endpoints import AsyncCustomersAPI
 
 
 @responses.activate
@@ -30,6 +33,24 @@ def test_create_customer(customers_client):
     assert meta == {}
 
 
+@responses.activate
+def test_create_customer_sends_only_given_fields(customers_client):
+    responses.add(
+        responses.POST,
+        f"{customers_client.base_url}/customer",
+        json={"status": True, "message": "Customer created", "data": {}},
+        status=200,
+    )
+
+    customers_client.create(email="customer@example.com", last_name="", metadata={})
+
+    assert json.loads(responses.calls[0].request.body) == {
+        "email": "customer@example.com",
+        "last_name": "",
+        "metadata": {},
+    }
+
+
 @responses.activate
 def test_create_customer_with_metadata(customers_client):
     payload = {
@@ -133,6 +154,30 @@ def test_list_customers(customers_client):
     assert meta == {}
 
 
+@responses.activate
+def test_list_customers_as_records(customers_client):
+    mock_response = {
+        "status": True,
+        "message": "Customers retrieved",
+        "data": [
+            {"id": 1, "email": "customer1@example.com", "customer_code": "CUS_1"},
+            {"id": 2, "email": "customer2@example.com"},
+        ],
+        "meta": {"total": 2},
+    }
+    responses.add(
+        responses.GET,
+        f"{customers_client.base_url}/customer",
+        json=mock_response,
+        status=200,
+    )
+
+    data, meta = customers_client.list_customers(schema=("id", "customer_code"))
+
+    assert data == [(1, "CUS_1"), (2, None)]
+    assert meta == {"total": 2}
+
+
 @responses.activate
 def test_list_customers_with_all_params(customers_client):
     mock_response = {
@@ -157,6 +202,34 @@ def test_list_customers_with_all_params(customers_client):
     assert meta == {}
 
 
+@responses.activate
+def test_iter_customers_walks_every_page(customers_client):
+    for page, emails in (
+        (1, ["a@example.com", "b@example.com"]),
+        (2, ["c@example.com"]),
+    ):
+        responses.add(
+            responses.GET,
+            f"{customers_client.base_url}/customer?perPage=2&page={page}",
+            json={
+                "status": True,
+                "message": "Customers retrieved",
+                "data": [{"email": email} for email in emails],
+                "meta": {"page": page, "pageCount": 2},
+            },
+            status=200,
+        )
+
+    customers = list(customers_client.iter_customers(per_page=2))
+
+    assert [c["email"] for c in customers] == [
+        "a@example.com",
+        "b@example.com",
+        "c@example.com",
+    ]
+    assert len(responses.calls) == 2
+
+
 @responses.activate
 def test_fetch_customer(customers_client):
     email_or_code = "customer@example.com"
@@ -364,6 +437,11 @@ def test_update_customer_no_fields(customers_client):
         customers_client.update(code=code)
 
 
+def test_update_docstring_documents_arguments(customers_client):
+    assert "Args:" in customers_client.update.__doc__
+    assert "metadata" in customers_client.update.__doc__
+
+
 @responses.activate
 def test_validate_identity(customers_client):
     payload = {
@@ -392,6 +470,49 @@ def test_validate_identity(customers_client):
     assert meta == {}
 
 
+@responses.activate
+def test_validate_identity_sends_only_given_fields(customers_client):
+    responses.add(
+        responses.POST,
+        f"{customers_client.base_url}/customer/CUS_test/identification",
+        json={"status": True, "message": "Identity validated", "data": {}},
+        status=200,
+    )
+
+    customers_client.validate_identity(
+        "CUS_test",
+        "NG",
+        "bank_account",
+        "John",
+        "Doe",
+        bank_code="007",
+        account_number="0123456789",
+    )
+
+    assert json.loads(responses.calls[0].request.body) == {
+        "country": "NG",
+        "type": "bank_account",
+        "first_name": "John",
+        "last_name": "Doe",
+        "bank_code": "007",
+        "account_number": "0123456789",
+    }
+
+
+def test_validate_identity_requires_bvn_or_bank_account(customers_client):
+    with pytest.raises(ValidationError):
+        customers_client.validate_identity(
+            "CUS_test", "NG", "bank_account", "John", "Doe", bank_code="007"
+        )
+
+
+def test_validate_identity_rejects_unknown_fields(customers_client):
+    with pytest.raises(TypeError):
+        customers_client.validate_identity(
+            "CUS_test", "NG", "bank_account", "John", "Doe", bvn="1", foo="bar"
+        )
+
+
 @responses.activate
 def test_set_risk_action(customers_client):
     payload = {
@@ -430,6 +551,19 @@ def test_set_risk_action_invalid_action(customers_client):
         customers_client.set_risk_action(**payload)
 
 
+def test_set_risk_action_errors_share_read_only_field_errors(customers_client):
+    errors = []
+    for _ in range(2):
+        with pytest.raises(ValidationError) as exc_info:
+            customers_client.set_risk_action("CUS_test", "invalid")
+        errors.append(exc_info.value.field_errors)
+
+    assert errors[0] is errors[1]
+    assert errors[0] == {"risk_action": "Must be 'default', 'allow', or 'deny'"}
+    with pytest.raises(TypeError):
+        errors[0]["risk_action"] = "changed"
+
+
 @responses.activate
 def test_initialize_authorization(customers_client):
     payload = {
@@ -512,6 +646,10 @@ def test_initialize_direct_debit(customers_client):
 
     assert data["customer_id"] == payload["customer_id"]
     assert meta == {}
+    assert json.loads(responses.calls[0].request.body) == {
+        "account": payload["account"],
+        "address": payload["address"],
+    }
 
 
 @responses.activate
@@ -590,6 +728,22 @@ def test_initialize_direct_debit_invalid_address_missing_state(customers_client)
         customers_client.initialize_direct_debit(**payload)
 
 
+def test_initialize_direct_debit_names_missing_keys(customers_client):
+    with pytest.raises(ValidationError) as excinfo:
+        customers_client.initialize_direct_debit(
+            customer_id="CUS_test",
+            account={"number": "0123456789", "bank_code": "044"},
+            address={"city": "Lagos"},
+        )
+    assert excinfo.value.field_errors == {"address": "Missing state, street"}
+
+    with pytest.raises(ValidationError) as excinfo:
+        customers_client.initialize_direct_debit(
+            customer_id="CUS_test", account=None, address={}
+        )
+    assert excinfo.value.field_errors == {"account": "Missing bank_code, number"}
+
+
 @responses.activate
 def test_direct_debit_activation_charge(customers_client):
     customer_id = "CUS_test"
@@ -612,6 +766,9 @@ def test_direct_debit_activation_charge(customers_client):
 
     assert data["customer_id"] == customer_id
     assert meta == {}
+    assert json.loads(responses.calls[0].request.body) == {
+        "authorization_id": authorization_id
+    }
 
 
 @responses.activate
@@ -658,3 +815,165 @@ def test_deactivate_authorization(customers_client):
 
     assert data["authorization_code"] == authorization_code
     assert meta == {}
+    assert json.loads(responses.calls[0].request.body) == {
+        "authorization_code": authorization_code
+    }
+
+
+def test_async_fetch_customer(async_api):
+    async_api.mocked.get(
+        f"{async_api.base_url}/customer/CUS_123",
+        payload={
+            "status": True,
+            "message": "Customer retrieved",
+            "data": {"customer_code": "CUS_123"},
+        },
+    )
+
+    data, _ = async_api.run(
+        AsyncCustomersAPI, lambda customers: customers.fetch(email_or_code="CUS_123")
+    )
+
+    assert data["customer_code"] == "CUS_123"
+
+
+def test_async_iter_customers(async_api):
+    for page in (1, 2):
+        async_api.mocked.get(
+            f"{async_api.base_url}/customer?perPage=50&page={page}",
+            payload={
+                "status": True,
+                "message": "Customers retrieved",
+                "data": [{"id": page}],
+                "meta": {"page": page, "pageCount": 2},
+            },
+        )
+
+    async def collect(customers):
+        return [c async for c in customers.iter_customers()]
+
+    assert async_api.run(AsyncCustomersAPI, collect) == [{"id": 1}, {"id": 2}]
+
+
+@responses.activate
+def test_fetch_customer_with_cache_ttl(customers_client):
+    customers_client.invalidate()
+    responses.add(
+        responses.GET,
+        f"{customers_client.base_url}/customer/CUS_cached",
+        json={
+            "status": True,
+            "message": "Customer retrieved",
+            "data": {"customer_code": "CUS_cached"},
+        },
+        status=200,
+    )
+
+    customers_client.fetch(email_or_code="CUS_cached", cache_ttl=60)
+    data, _ = customers_client.fetch(email_or_code="CUS_cached", cache_ttl=60)
+
+    assert data["customer_code"] == "CUS_cached"
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_fetch_many_customers(customers_client):
+    codes = ["CUS_a", "CUS_b", "CUS_c"]
+    for code in codes:
+        responses.add(
+            responses.GET,
+            f"{customers_client.base_url}/customer/{code}",
+            json={
+                "status": True,
+                "message": "Customer retrieved",
+                "data": {"customer_code": code},
+            },
+            status=200,
+        )
+
+    results = customers_client.fetch_many(codes, max_workers=2)
+
+    assert list(results) == codes
+    assert [data["customer_code"] for data, _ in results.values()] == codes
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_fetch_many_customers_reraises_failure(customers_client):
+    from paystack import NotFoundError
+
+    responses.add(
+        responses.GET,
+        f"{customers_client.base_url}/customer/CUS_ok",
+        json={"status": True, "message": "ok", "data": {}},
+        status=200,
+    )
+    responses.add(
+        responses.GET,
+        f"{customers_client.base_url}/customer/CUS_missing",
+        json={"status": False, "message": "Customer not found"},
+        status=404,
+    )
+
+    with pytest.raises(NotFoundError):
+        customers_client.fetch_many(["CUS_ok", "CUS_missing"])
+
+
+@responses.activate
+def test_stream_customers(customers_client):
+    responses.add(
+        responses.GET,
+        f"{customers_client.base_url}/customer",
+        json={
+            "status": True,
+            "message": "Customers retrieved",
+            "data": [{"customer_code": "CUS_1"}, {"customer_code": "CUS_2"}],
+            "meta": {"perPage": 2, "page": 1},
+        },
+        status=200,
+    )
+
+    codes = [c["customer_code"] for c in customers_client.stream_customers(per_page=2)]
+
+    assert codes == ["CUS_1", "CUS_2"]
+    assert responses.calls[0].request.params == {"perPage": "2"}
+
+
+@responses.activate
+def test_direct_debit_activation_charge_many(customers_client):
+    mandates = [("CUS_a", 1), ("CUS_b", 2)]
+    for customer_id, _ in mandates:
+        responses.add(
+            responses.PUT,
+            f"{customers_client.base_url}/customer/{customer_id}/directdebit-activation-charge",
+            json={"status": True, "message": "Mandate is queued for retry"},
+            status=200,
+        )
+
+    results = customers_client.direct_debit_activation_charge_many(mandates)
+
+    assert list(results) == mandates
+    sent = sorted(
+        json.loads(call.request.body)["authorization_id"] for call in responses.calls
+    )
+    assert sent == [1, 2]
+
+
+@responses.activate
+def test_direct_debit_activation_charge_many_returns_failures_with_successes(
+    customers_client,
+):
+    mandates = [("CUS_a", 1), ("CUS_b", 2)]
+    for (customer_id, _), status in zip(mandates, (200, 400)):
+        responses.add(
+            responses.PUT,
+            f"{customers_client.base_url}/customer/{customer_id}"
+            "/directdebit-activation-charge",
+            json={"status": status == 200, "message": "Mandate is queued"},
+            status=status,
+        )
+
+    results = customers_client.direct_debit_activation_charge_many(mandates)
+
+    assert results[("CUS_a", 1)].data is None
+    assert isinstance(results[("CUS_b", 2)], PaystackError)
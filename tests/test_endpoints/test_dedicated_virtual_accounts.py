@@ -1,5 +1,8 @@
+import asyncio
+
 import responses
 
+from paystack.endpoints import AsyncDedicatedVirtualAccountsAPI
 from tests.utils import assert_api_error_contains
 
 
@@ -233,6 +236,25 @@ def test_list_dedicated_virtual_accounts_with_all_optional_params(
     assert meta == {}
 
 
+@responses.activate
+def test_list_dedicated_virtual_accounts_sends_inactive_filter(
+    dedicated_virtual_accounts_client,
+):
+    responses.add(
+        responses.GET,
+        f"{dedicated_virtual_accounts_client.base_url}/dedicated_account?active=False",
+        json={"status": True, "message": "Dedicated accounts retrieved", "data": []},
+        status=200,
+    )
+
+    data, _ = dedicated_virtual_accounts_client.list_dedicated_virtual_accounts(
+        active=False
+    )
+
+    assert data == []
+    assert responses.calls[0].request.url.endswith("/dedicated_account?active=False")
+
+
 @responses.activate
 def test_fetch_dedicated_virtual_account(dedicated_virtual_accounts_client):
     dedicated_account_id = 123
@@ -428,3 +450,65 @@ def test_fetch_bank_providers(dedicated_virtual_accounts_client):
     assert len(data) == 1
     assert data[0]["slug"] == "wema-bank"
     assert meta == {}
+
+
+def test_async_fetch_dedicated_virtual_accounts_concurrently(async_api):
+    for account_id in (1, 2):
+        async_api.mocked.get(
+            f"{async_api.base_url}/dedicated_account/{account_id}",
+            payload={
+                "status": True,
+                "message": "Customer retrieved",
+                "data": {"id": account_id},
+            },
+        )
+
+    results = async_api.run(
+        AsyncDedicatedVirtualAccountsAPI,
+        lambda accounts: asyncio.gather(
+            accounts.fetch_dedicated_virtual_account(dedicated_account_id=1),
+            accounts.fetch_dedicated_virtual_account(dedicated_account_id=2),
+        ),
+    )
+
+    assert [data["id"] for data, _ in results] == [1, 2]
+
+
+@responses.activate
+def test_fetch_many_dedicated_virtual_accounts(dedicated_virtual_accounts_client):
+    for account_id in (1, 2):
+        responses.add(
+            responses.GET,
+            f"{dedicated_virtual_accounts_client.base_url}/dedicated_account/{account_id}",
+            json={
+                "status": True,
+                "message": "Customer retrieved",
+                "data": {"id": account_id},
+            },
+            status=200,
+        )
+
+    results = dedicated_virtual_accounts_client.fetch_many([2, 1])
+
+    assert list(results) == [2, 1]
+    assert results[1][0]["id"] == 1
+
+
+@responses.activate
+def test_fetch_dedicated_virtual_account_cache_invalidated_by_deactivate(
+    dedicated_virtual_accounts_client,
+):
+    client = dedicated_virtual_accounts_client
+    client.invalidate()
+    url = f"{client.base_url}/dedicated_account/7"
+    body = {"status": True, "message": "Customer retrieved", "data": {"id": 7}}
+    responses.add(responses.GET, url, json=body, status=200)
+    responses.add(responses.DELETE, url, json=body, status=200)
+
+    client.fetch_dedicated_virtual_account(7, cache_ttl=30)
+    client.fetch_dedicated_virtual_account(7, cache_ttl=30)
+    client.deactivate_dedicated_account(7)
+    client.fetch_dedicated_virtual_account(7, cache_ttl=30)
+
+    methods = [call.request.method for call in responses.calls]
+    assert methods == ["GET", "DELETE", "GET"]
@@ -1,5 +1,10 @@
+import json
+
+import pytest
 import responses
 
+from paystack import PaystackError, ValidationError
+from paystack.endpoints import AsyncDirectDebitAPI
 from tests.utils import assert_api_error_contains
 
 
@@ -43,6 +48,76 @@ def test_trigger_activation_charge_invalid_key(direct_debit_client):
     )
 
 
+@responses.activate
+def test_trigger_activation_charge_many_sends_batches(direct_debit_client):
+    responses.add(
+        responses.PUT,
+        f"{direct_debit_client.base_url}/directdebit/activation-charge",
+        json={
+            "status": True,
+            "message": "Mandate is now processing",
+            "data": {},
+        },
+        status=200,
+    )
+
+    results = direct_debit_client.trigger_activation_charge_many(
+        list(range(1, 6)), chunk_size=2
+    )
+
+    assert list(results) == [0, 1, 2]
+    sent = sorted(
+        json.loads(call.request.body)["customer_ids"] for call in responses.calls
+    )
+    assert sent == [[1, 2], [3, 4], [5]]
+
+
+@responses.activate
+def test_trigger_activation_charge_many_sends_repeated_batches(direct_debit_client):
+    responses.add(
+        responses.PUT,
+        f"{direct_debit_client.base_url}/directdebit/activation-charge",
+        json={"status": True, "message": "Mandate is now processing", "data": {}},
+        status=200,
+    )
+
+    results = direct_debit_client.trigger_activation_charge_many(
+        [1, 2, 1, 2], chunk_size=2
+    )
+
+    assert list(results) == [0, 1]
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_trigger_activation_charge_many_returns_failures_with_successes(
+    direct_debit_client,
+):
+    def reply(request):
+        if json.loads(request.body)["customer_ids"] == [3, 4]:
+            return 400, {}, json.dumps({"status": False, "message": "Bad batch"})
+        return 200, {}, json.dumps({"status": True, "message": "ok", "data": {}})
+
+    responses.add_callback(
+        responses.PUT,
+        f"{direct_debit_client.base_url}/directdebit/activation-charge",
+        callback=reply,
+    )
+
+    results = direct_debit_client.trigger_activation_charge_many(
+        [1, 2, 3, 4, 5], chunk_size=2
+    )
+
+    assert isinstance(results[1], PaystackError)
+    assert results[0].data == {}
+    assert results[2].data == {}
+
+
+def test_trigger_activation_charge_many_rejects_empty_chunks(direct_debit_client):
+    with pytest.raises(ValidationError):
+        direct_debit_client.trigger_activation_charge_many([1, 2], chunk_size=0)
+
+
 @responses.activate
 def test_list_mandate_authorizations(direct_debit_client):
     mock_response = {
@@ -89,6 +164,38 @@ def test_list_mandate_authorizations_with_params(direct_debit_client):
     assert meta == {}
 
 
+@responses.activate
+def test_iter_mandate_authorizations_follows_cursor(direct_debit_client):
+    url = f"{direct_debit_client.base_url}/directdebit/mandate-authorizations"
+    responses.add(
+        responses.GET,
+        f"{url}?status=active",
+        json={
+            "status": True,
+            "message": "Mandate authorizations retrieved",
+            "data": [{"id": 1}, {"id": 2}],
+            "meta": {"next": "Njow", "previous": None},
+        },
+        status=200,
+    )
+    responses.add(
+        responses.GET,
+        f"{url}?cursor=Njow&status=active",
+        json={
+            "status": True,
+            "message": "Mandate authorizations retrieved",
+            "data": [{"id": 3}],
+            "meta": {"next": None, "previous": "Mjow"},
+        },
+        status=200,
+    )
+
+    mandates = list(direct_debit_client.iter_mandate_authorizations(status="active"))
+
+    assert [m["id"] for m in mandates] == [1, 2, 3]
+    assert len(responses.calls) == 2
+
+
 @responses.activate
 def test_list_mandate_authorizations_with_per_page(direct_debit_client):
     mock_response = {
@@ -123,3 +230,26 @@ def test_list_mandate_authorizations_invalid_key(direct_debit_client):
     assert_api_error_contains(
         direct_debit_client.list_mandate_authorizations, "Invalid API key"
     )
+
+
+def test_async_trigger_activation_charge(async_api):
+    url = f"{async_api.base_url}/directdebit/activation-charge"
+    async_api.mocked.put(
+        url,
+        payload={
+            "status": True,
+            "message": "Activation charge triggered",
+            "data": {"customer_ids": [1, 2]},
+        },
+    )
+
+    data, _ = async_api.run(
+        AsyncDirectDebitAPI,
+        lambda direct_debit: direct_debit.trigger_activation_charge(
+            customer_ids=[1, 2]
+        ),
+    )
+
+    (sent,) = async_api.sent("PUT", url)
+    assert data["customer_ids"] == [1, 2]
+    assert json.loads(sent.kwargs["data"]) == {"customer_ids": [1, 2]}
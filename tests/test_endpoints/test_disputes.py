@@ -1,6 +1,7 @@
 import responses
 
 
+from paystack.endpoints import AsyncDisputesAPI
 from tests.utils import assert_api_error_contains
 
 
@@ -81,6 +82,47 @@ def test_fetch_dispute(disputes_client):
     assert meta == {}
 
 
+@responses.activate
+def test_fetch_many_disputes(disputes_client):
+    for dispute_id in ("DIS_1", "DIS_2"):
+        responses.add(
+            responses.GET,
+            f"{disputes_client.base_url}/dispute/{dispute_id}",
+            json={
+                "status": True,
+                "message": "Dispute retrieved",
+                "data": {"id": dispute_id},
+            },
+            status=200,
+        )
+
+    results = disputes_client.fetch_many(["DIS_2", "DIS_1"])
+
+    assert list(results) == ["DIS_2", "DIS_1"]
+    assert results["DIS_1"][0]["id"] == "DIS_1"
+
+
+def test_async_fetch_many_disputes(async_api):
+    for dispute_id in ("DIS_1", "DIS_2"):
+        async_api.mocked.get(
+            f"{async_api.base_url}/dispute/{dispute_id}",
+            payload={
+                "status": True,
+                "message": "Dispute retrieved",
+                "data": {"id": dispute_id},
+            },
+        )
+
+    results = async_api.run(
+        AsyncDisputesAPI, lambda disputes: disputes.fetch_many(["DIS_1", "DIS_2"])
+    )
+
+    assert {key: data["id"] for key, (data, _) in results.items()} == {
+        "DIS_1": "DIS_1",
+        "DIS_2": "DIS_2",
+    }
+
+
 @responses.activate
 def test_list_transaction_disputes(disputes_client):
     transaction_id = "TRN_test"
@@ -343,3 +385,32 @@ def test_export_disputes_with_all_params(disputes_client):
 
     assert data["url"] == "http://example.com/export"
     assert meta == {}
+
+
+@responses.activate
+def test_stream_disputes(disputes_client):
+    responses.add(
+        responses.GET,
+        f"{disputes_client.base_url}/dispute",
+        json={
+            "status": True,
+            "message": "Disputes retrieved",
+            "data": [{"id": 1}, {"id": 2}],
+            "meta": {"perPage": 2, "page": 1},
+        },
+        status=200,
+    )
+
+    ids = [
+        d["id"]
+        for d in disputes_client.stream_disputes(
+            from_date="2023-01-01", to_date="2023-01-31", per_page=2
+        )
+    ]
+
+    assert ids == [1, 2]
+    assert responses.calls[0].request.params == {
+        "from": "2023-01-01",
+        "to": "2023-01-31",
+        "perPage": "2",
+    }
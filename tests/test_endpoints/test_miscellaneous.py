@@ -327,3 +327,93 @@ def test_get_south_african_verification_banks_with_currency(miscellaneous_client
     assert len(data) == 1
     assert data[0]["name"] == "SA Verify Bank USD"
     assert meta == {}
+
+
+@responses.activate
+def test_list_countries_is_cached_until_invalidated(miscellaneous_client):
+    responses.add(
+        responses.GET,
+        f"{miscellaneous_client.base_url}/country",
+        json={"status": True, "message": "ok", "data": [{"code": "NG"}]},
+        status=200,
+    )
+
+    miscellaneous_client.invalidate()
+    first, _ = miscellaneous_client.list_countries(cache_ttl=60)
+    second, _ = miscellaneous_client.list_countries(cache_ttl=60)
+    assert first == second
+    assert len(responses.calls) == 1
+
+    miscellaneous_client.invalidate("country")
+    miscellaneous_client.list_countries(cache_ttl=60)
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_list_banks_is_not_cached_by_default(miscellaneous_client):
+    responses.add(
+        responses.GET,
+        f"{miscellaneous_client.base_url}/bank",
+        json={"status": True, "message": "ok", "data": []},
+        status=200,
+    )
+
+    for _ in range(2):
+        miscellaneous_client.list_banks(
+            country="nigeria", use_cursor=False, per_page=50
+        )
+
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_list_banks_sends_filters_as_query_string(miscellaneous_client):
+    responses.add(
+        responses.GET,
+        f"{miscellaneous_client.base_url}/bank",
+        json={"status": True, "message": "ok", "data": []},
+        status=200,
+    )
+
+    miscellaneous_client.list_banks(country="Ghana", use_cursor=False, per_page=20)
+
+    sent = responses.calls[0].request
+    assert sent.body is None
+    assert sent.params == {"country": "ghana", "perPage": "20", "use_cursor": "false"}
+
+
+@responses.activate
+@pytest.mark.parametrize(
+    "value, expected", [(True, "true"), ("true", "true"), ("False", "false"), (1, "1")]
+)
+def test_list_banks_accepts_non_bool_filter_values(
+    miscellaneous_client, value, expected
+):
+    responses.add(
+        responses.GET,
+        f"{miscellaneous_client.base_url}/bank",
+        json={"status": True, "message": "ok", "data": []},
+        status=200,
+    )
+
+    miscellaneous_client.list_banks(country="nigeria", use_cursor=value, per_page=10)
+
+    assert responses.calls[0].request.params["use_cursor"] == expected
+
+
+@responses.activate
+def test_bank_presets_accept_positional_arguments(miscellaneous_client):
+    responses.add(
+        responses.GET,
+        f"{miscellaneous_client.base_url}/bank",
+        json={"status": True, "message": "ok", "data": []},
+        status=200,
+    )
+
+    miscellaneous_client.get_nigerian_banks(True)
+    miscellaneous_client.get_banks_for_transfer("ghana")
+    miscellaneous_client.get_south_african_verification_banks("ZAR")
+
+    assert responses.calls[0].request.params["include_nip_sort_code"] == "true"
+    assert responses.calls[1].request.params["country"] == "ghana"
+    assert responses.calls[2].request.params["currency"] == "ZAR"
@@ -1,5 +1,8 @@
+import json
+
 import responses
 
+from paystack.endpoints import AsyncPlansAPI
 from tests.utils import assert_api_error_contains
 
 
@@ -167,6 +170,58 @@ def test_fetch_plan(plans_client):
     assert meta == {}
 
 
+@responses.activate
+def test_fetch_plan_with_cache_ttl(plans_client):
+    plans_client.invalidate()
+    responses.add(
+        responses.GET,
+        f"{plans_client.base_url}/plan/PLN_cached",
+        json={"status": True, "message": "ok", "data": {"plan_code": "PLN_cached"}},
+        status=200,
+    )
+
+    plans_client.fetch_plan("PLN_cached", cache_ttl=3600)
+    data, _ = plans_client.fetch_plan("PLN_cached", cache_ttl=3600)
+
+    assert data["plan_code"] == "PLN_cached"
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_fetch_many_plans(plans_client):
+    for code in ("PLN_1", "PLN_2"):
+        responses.add(
+            responses.GET,
+            f"{plans_client.base_url}/plan/{code}",
+            json={
+                "status": True,
+                "message": "Plan retrieved",
+                "data": {"plan_code": code},
+            },
+            status=200,
+        )
+
+    results = plans_client.fetch_many(["PLN_2", "PLN_1"])
+
+    assert list(results) == ["PLN_2", "PLN_1"]
+    assert results["PLN_1"][0]["plan_code"] == "PLN_1"
+
+
+def test_async_fetch_plan(async_api):
+    async_api.mocked.get(
+        f"{async_api.base_url}/plan/PLN_1",
+        payload={
+            "status": True,
+            "message": "Plan retrieved",
+            "data": {"plan_code": "PLN_1"},
+        },
+    )
+
+    data, _ = async_api.run(AsyncPlansAPI, lambda plans: plans.fetch_plan("PLN_1"))
+
+    assert data["plan_code"] == "PLN_1"
+
+
 @responses.activate
 def test_update_plan(plans_client):
     id_or_code = "PLN_test"
@@ -193,6 +248,23 @@ def test_update_plan(plans_client):
     assert meta == {}
 
 
+@responses.activate
+def test_update_plan_sends_zero_and_false_values(plans_client):
+    responses.add(
+        responses.PUT,
+        f"{plans_client.base_url}/plan/PLN_test",
+        json={"status": True, "message": "Plan updated", "data": {}},
+        status=200,
+    )
+
+    plans_client.update_plan("PLN_test", invoice_limit=0, send_invoices=False)
+
+    assert json.loads(responses.calls[0].request.body) == {
+        "send_invoices": False,
+        "invoice_limit": 0,
+    }
+
+
 @responses.activate
 def test_update_plan_with_all_optional_params(plans_client):
     id_or_code = "PLN_test_update"
@@ -1,6 +1,9 @@
+import json
+
 import responses
 
 
+from paystack.endpoints import AsyncProductsAPI
 from tests.utils import assert_api_error_contains
 
 
@@ -31,6 +34,29 @@ def test_create_product(products_client):
     assert meta == {}
 
 
+@responses.activate
+def test_create_product_sends_zero_quantity(products_client):
+    responses.add(
+        responses.POST,
+        f"{products_client.base_url}/product",
+        json={"status": True, "message": "Product created", "data": {"id": 1}},
+        status=200,
+    )
+
+    products_client.create_product(
+        name="Sold out",
+        description="None left",
+        price=500,
+        currency="NGN",
+        unlimited=False,
+        quantity=0,
+    )
+
+    body = json.loads(responses.calls[0].request.body)
+    assert body["quantity"] == 0
+    assert body["unlimited"] is False
+
+
 @responses.activate
 def test_create_product_with_optional_params(products_client):
     payload = {
@@ -224,3 +250,67 @@ def test_update_product_with_all_optional_params(products_client):
     assert data["name"] == payload["name"]
     assert data["id"] == product_id
     assert meta == {}
+
+
+def test_async_fetch_product(async_api):
+    async_api.mocked.get(
+        f"{async_api.base_url}/product/123",
+        payload={
+            "status": True,
+            "message": "Product retrieved",
+            "data": {"id": 123},
+        },
+    )
+
+    data, _ = async_api.run(
+        AsyncProductsAPI, lambda products: products.fetch_product("123")
+    )
+
+    assert data["id"] == 123
+
+
+@responses.activate
+def test_fetch_product_cache_is_invalidated_by_update(products_client):
+    products_client.invalidate()
+    url = f"{products_client.base_url}/product/42"
+    responses.add(
+        responses.GET,
+        url,
+        json={"status": True, "message": "ok", "data": {"price": 100}},
+        status=200,
+    )
+    responses.add(
+        responses.PUT,
+        url,
+        json={"status": True, "message": "ok", "data": {"price": 200}},
+        status=200,
+    )
+
+    products_client.fetch_product("42", cache_ttl=30)
+    products_client.fetch_product("42", cache_ttl=30)
+    assert len(responses.calls) == 1
+
+    products_client.update_product("42", price=200)
+    products_client.fetch_product("42", cache_ttl=30)
+    assert [call.request.method for call in responses.calls] == ["GET", "PUT", "GET"]
+
+
+@responses.activate
+def test_iter_products_walks_every_page(products_client):
+    for page, ids in ((1, [1, 2]), (2, [3])):
+        responses.add(
+            responses.GET,
+            f"{products_client.base_url}/product?perPage=2&page={page}",
+            json={
+                "status": True,
+                "message": "Products retrieved",
+                "data": [{"id": product_id} for product_id in ids],
+                "meta": {"page": page, "pageCount": 2},
+            },
+            status=200,
+        )
+
+    products = list(products_client.iter_products(per_page=2))
+
+    assert [p["id"] for p in products] == [1, 2, 3]
+    assert len(responses.calls) == 2
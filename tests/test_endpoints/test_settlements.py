@@ -1,5 +1,7 @@
 import responses
 
+from paystack.endpoints import AsyncSettlementsAPI
+
 
 @responses.activate
 def test_list_settlements(settlements_client):
@@ -104,3 +106,23 @@ def test_list_settlement_transactions_with_all_params(settlements_client):
     assert len(data) == 1
     assert data[0]["amount"] == 1000
     assert meta == {}
+
+
+def test_async_list_settlements(async_api):
+    async_api.mocked.get(
+        f"{async_api.base_url}/settlement?perPage=10",
+        payload={
+            "status": True,
+            "message": "Settlements retrieved",
+            "data": [{"id": 1}],
+            "meta": {"perPage": 10},
+        },
+    )
+
+    data, meta = async_api.run(
+        AsyncSettlementsAPI,
+        lambda settlements: settlements.list_settlements(per_page=10),
+    )
+
+    assert data == [{"id": 1}]
+    assert meta == {"perPage": 10}
@@ -1,6 +1,8 @@
+import asyncio
 import responses
 
 
+from paystack.endpoints import AsyncSubscriptionsAPI
 from tests.utils import assert_api_error_contains
 
 
@@ -225,3 +227,44 @@ def test_send_update_subscription_link(subscriptions_client):
 
     assert data["code"] == code
     assert meta == {}
+
+
+def test_async_disable_subscriptions_concurrently(async_api):
+    for _ in range(3):
+        async_api.mocked.post(
+            f"{async_api.base_url}/subscription/disable",
+            payload={
+                "status": True,
+                "message": "Subscription disabled successfully",
+            },
+        )
+
+    results = async_api.run(
+        AsyncSubscriptionsAPI,
+        lambda subscriptions: asyncio.gather(
+            *(
+                subscriptions.disable_subscription(f"SUB_{i}", f"tok_{i}")
+                for i in range(3)
+            )
+        ),
+    )
+
+    assert len(results) == 3
+
+
+def test_async_iter_subscriptions(async_api):
+    for page in (1, 2):
+        async_api.mocked.get(
+            f"{async_api.base_url}/subscription?perPage=50&page={page}",
+            payload={
+                "status": True,
+                "message": "Subscriptions retrieved",
+                "data": [{"id": page}],
+                "meta": {"page": page, "pageCount": 2},
+            },
+        )
+
+    async def collect(subscriptions):
+        return [s async for s in subscriptions.iter_subscriptions()]
+
+    assert async_api.run(AsyncSubscriptionsAPI, collect) == [{"id": 1}, {"id": 2}]
@@ -1,6 +1,8 @@
 import responses
 
 
+from paystack.endpoints import AsyncTerminalAPI
+from paystack.utils.helpers import json_dumps
 from tests.utils import assert_api_error_contains
 
 
@@ -232,3 +234,67 @@ def test_decommission_terminal(terminal_client):
 
     assert data["serial_number"] == serial_number
     assert meta == {}
+
+
+def test_async_fetch_terminal(async_api):
+    async_api.mocked.get(
+        f"{async_api.base_url}/terminal/TRM_1",
+        payload={
+            "status": True,
+            "message": "Terminal retrieved",
+            "data": {"terminal_id": "TRM_1"},
+        },
+    )
+
+    data, _ = async_api.run(
+        AsyncTerminalAPI, lambda terminal: terminal.fetch_terminal("TRM_1")
+    )
+
+    assert data["terminal_id"] == "TRM_1"
+
+
+def test_async_send_event_posts_pre_encoded_body(async_api):
+    event = {"id": "INV_1", "reference": "offline_ref", "items": [{"qty": 2}]}
+    url = f"{async_api.base_url}/terminal/TRM_1/event"
+    async_api.mocked.post(url, payload={"status": True, "message": "Event sent"})
+
+    async_api.run(
+        AsyncTerminalAPI,
+        lambda terminal: terminal.send_event("TRM_1", "invoice", "process", event),
+    )
+
+    (sent,) = async_api.sent("POST", url)
+    body = sent.kwargs["data"]
+    assert body == json_dumps({"type": "invoice", "action": "process", "data": event})
+    assert isinstance(body, bytes)
+
+
+@responses.activate
+def test_iter_terminals_follows_cursor(terminal_client):
+    responses.add(
+        responses.GET,
+        f"{terminal_client.base_url}/terminal?perPage=1",
+        json={
+            "status": True,
+            "message": "Terminals retrieved",
+            "data": [{"terminal_id": "TRM_1"}],
+            "meta": {"next": "cursor_2", "previous": None, "perPage": 1},
+        },
+        status=200,
+    )
+    responses.add(
+        responses.GET,
+        f"{terminal_client.base_url}/terminal?perPage=1&next=cursor_2",
+        json={
+            "status": True,
+            "message": "Terminals retrieved",
+            "data": [{"terminal_id": "TRM_2"}],
+            "meta": {"next": None, "previous": "cursor_1", "perPage": 1},
+        },
+        status=200,
+    )
+
+    terminals = list(terminal_client.iter_terminals(per_page=1))
+
+    assert [t["terminal_id"] for t in terminals] == ["TRM_1", "TRM_2"]
+    assert len(responses.calls) == 2
@@ -1,5 +1,10 @@
+import json
+
+import pytest
 import responses
 
+from paystack import PaystackError, ValidationError
+from paystack.endpoints import AsyncTransactionSplitsAPI
 
 from tests.utils import assert_api_error_contains
 
@@ -259,3 +264,124 @@ def test_remove_subaccount_from_split(transaction_splits_client):
 
     assert data["split_id"] == split_id
     assert meta == {}
+
+
+def test_async_fetch_split(async_api):
+    async_api.mocked.get(
+        f"{async_api.base_url}/split/SPL_1",
+        payload={
+            "status": True,
+            "message": "Split retrieved",
+            "data": {"split_code": "SPL_1"},
+        },
+    )
+
+    data, _ = async_api.run(
+        AsyncTransactionSplitsAPI, lambda splits: splits.fetch_split("SPL_1")
+    )
+
+    assert data["split_code"] == "SPL_1"
+
+
+@responses.activate
+def test_list_splits_sends_zero_page(transaction_splits_client):
+    responses.add(
+        responses.GET,
+        f"{transaction_splits_client.base_url}/split",
+        json={"status": True, "message": "Split retrieved", "data": []},
+        status=200,
+    )
+
+    transaction_splits_client.list_splits(page=0)
+
+    assert responses.calls[0].request.params == {"page": "0"}
+
+
+@responses.activate
+def test_bulk_sync_subaccounts(transaction_splits_client):
+    base = f"{transaction_splits_client.base_url}/split/SPL_1/subaccount"
+    for action in ("add", "add", "remove"):
+        responses.add(
+            responses.POST,
+            f"{base}/{action}",
+            json={"status": True, "message": "ok", "data": {}},
+            status=200,
+        )
+
+    results = transaction_splits_client.bulk_sync_subaccounts(
+        "SPL_1",
+        desired=[
+            {"subaccount": "ACCT_a", "share": 30},
+            {"subaccount": "ACCT_b", "share": 20},
+        ],
+        remove=["ACCT_c"],
+    )
+
+    assert list(results) == ["ACCT_a", "ACCT_b", "ACCT_c"]
+    sent = sorted(
+        (
+            (call.request.url.rsplit("/", 1)[1], json.loads(call.request.body))
+            for call in responses.calls
+        ),
+        key=lambda item: (item[0], item[1]["subaccount"]),
+    )
+    assert sent == [
+        ("add", {"subaccount": "ACCT_a", "share": 30}),
+        ("add", {"subaccount": "ACCT_b", "share": 20}),
+        ("remove", {"subaccount": "ACCT_c"}),
+    ]
+
+
+def test_bulk_sync_subaccounts_rejects_conflicting_changes(transaction_splits_client):
+    with pytest.raises(ValidationError, match="ACCT_a"):
+        transaction_splits_client.bulk_sync_subaccounts(
+            "SPL_1", desired=[{"subaccount": "ACCT_a", "share": 30}], remove=["ACCT_a"]
+        )
+
+
+@pytest.mark.parametrize(
+    "desired, remove",
+    [
+        (
+            [
+                {"subaccount": "ACCT_a", "share": 30},
+                {"subaccount": "ACCT_a", "share": 20},
+            ],
+            [],
+        ),
+        ([], ["ACCT_a", "ACCT_a"]),
+    ],
+)
+def test_bulk_sync_subaccounts_rejects_repeated_subaccounts(
+    transaction_splits_client, desired, remove
+):
+    with pytest.raises(ValidationError, match="ACCT_a appears more than once"):
+        transaction_splits_client.bulk_sync_subaccounts(
+            "SPL_1", desired=desired, remove=remove
+        )
+
+
+@responses.activate
+def test_bulk_sync_subaccounts_returns_failures_with_successes(
+    transaction_splits_client,
+):
+    base = f"{transaction_splits_client.base_url}/split/SPL_1/subaccount"
+    responses.add(
+        responses.POST,
+        f"{base}/add",
+        json={"status": True, "message": "ok", "data": {"id": 1}},
+        status=200,
+    )
+    responses.add(
+        responses.POST,
+        f"{base}/remove",
+        json={"status": False, "message": "Subaccount not found"},
+        status=404,
+    )
+
+    results = transaction_splits_client.bulk_sync_subaccounts(
+        "SPL_1", desired=[{"subaccount": "ACCT_a", "share": 30}], remove=["ACCT_c"]
+    )
+
+    assert results["ACCT_a"].data == {"id": 1}
+    assert isinstance(results["ACCT_c"], PaystackError)
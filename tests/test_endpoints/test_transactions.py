@@ -1,9 +1,11 @@
+import asyncio
 import pytest
 import responses
 import json
 import requests
 from paystack import NetworkError
 from paystack.exceptions import APIError, ValidationError
+from paystack.endpoints import AsyncTransactionsAPI
 
 
 from tests.utils import assert_api_error_contains
@@ -855,3 +857,25 @@ def test_view_timeline_invalid_key(transaction_client):
     assert_api_error_contains(
         transaction_client.view_timeline, "invalid api key", id_or_reference
     )
+
+
+def test_async_verify_transactions_concurrently(async_api):
+    references = ["ref_1", "ref_2", "ref_3"]
+    for reference in references:
+        async_api.mocked.get(
+            f"{async_api.base_url}/transaction/verify/{reference}",
+            payload={
+                "status": True,
+                "message": "Verification successful",
+                "data": {"reference": reference},
+            },
+        )
+
+    results = async_api.run(
+        AsyncTransactionsAPI,
+        lambda transactions: asyncio.gather(
+            *(transactions.verify(reference) for reference in references)
+        ),
+    )
+
+    assert [data["reference"] for data, meta in results] == references
@@ -1,5 +1,9 @@
+import pytest
 import responses
 
+from paystack.endpoints import AsyncTransferRecipientsAPI
+from paystack.exceptions import ValidationError
+from paystack.utils.helpers import json_dumps
 from tests.utils import assert_api_error_contains
 
 
@@ -83,6 +87,14 @@ def test_create_transfer_recipient_invalid_key(transfer_recipients_client):
     )
 
 
+def test_create_transfer_recipient_rejects_unknown_type(transfer_recipients_client):
+    with pytest.raises(ValidationError, match="type must be one of") as excinfo:
+        transfer_recipients_client.create_transfer_recipient(
+            type="iban", name="Test Recipient", bank_code="044"
+        )
+    assert "type" in excinfo.value.field_errors
+
+
 @responses.activate
 def test_bulk_create_transfer_recipient(transfer_recipients_client):
     batch = [
@@ -115,6 +127,22 @@ def test_bulk_create_transfer_recipient(transfer_recipients_client):
 
     assert data["success"] == 2
     assert meta == {}
+    sent = responses.calls[0].request
+    assert sent.headers["Content-Type"] == "application/json"
+    assert sent.body == json_dumps({"batch": batch})
+
+
+def test_bulk_create_transfer_recipient_rejects_incomplete_recipient(
+    transfer_recipients_client,
+):
+    batch = [
+        {"type": "authorization", "name": "Card", "authorization_code": "AUTH_1"},
+        {"type": "nuban", "name": "Recipient 2", "account_number": "0456"},
+    ]
+
+    with pytest.raises(ValidationError, match=r"batch\[1\].*bank_code") as exc:
+        transfer_recipients_client.bulk_create_transfer_recipient(batch=batch)
+    assert exc.value.field_errors == {"batch[1]": "Missing bank_code"}
 
 
 @responses.activate
@@ -215,6 +243,20 @@ def test_update_transfer_recipient(transfer_recipients_client):
     assert meta == {}
 
 
+@responses.activate
+def test_update_transfer_recipient_sends_only_given_fields(transfer_recipients_client):
+    responses.add(
+        responses.PUT,
+        f"{transfer_recipients_client.base_url}/transferrecipient/RCP_test",
+        json={"status": True, "message": "Recipient updated", "data": {}},
+        status=200,
+    )
+
+    transfer_recipients_client.update_transfer_recipient("RCP_test", name="New Name")
+
+    assert responses.calls[0].request.body == json_dumps({"name": "New Name"})
+
+
 @responses.activate
 def test_delete_transfer_recipient(transfer_recipients_client):
     id_or_code = "RCP_test"
@@ -236,3 +278,25 @@ def test_delete_transfer_recipient(transfer_recipients_client):
 
     assert data["recipient_code"] == id_or_code
     assert meta == {}
+
+
+def test_async_bulk_create_transfer_recipient(async_api):
+    batch = [{"type": "nuban", "name": "Recipient 1", "bank_code": "044"}]
+    url = f"{async_api.base_url}/transferrecipient/bulk"
+    async_api.mocked.post(
+        url,
+        payload={
+            "status": True,
+            "message": "Recipients created",
+            "data": {"success": [{"name": "Recipient 1"}], "errors": []},
+        },
+    )
+
+    data, meta = async_api.run(
+        AsyncTransferRecipientsAPI,
+        lambda recipients: recipients.bulk_create_transfer_recipient(batch),
+    )
+
+    (sent,) = async_api.sent("POST", url)
+    assert data["success"] == [{"name": "Recipient 1"}]
+    assert sent.kwargs["data"] == json_dumps({"batch": batch})
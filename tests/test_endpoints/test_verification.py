@@ -1,6 +1,8 @@
+import pytest
 import responses
 
-
+from paystack.exceptions import ValidationError
+from paystack.endpoints import AsyncVerificationAPI
 from tests.utils import assert_api_error_contains
 
 
@@ -77,6 +79,25 @@ def test_validate_account(verification_client):
     assert meta == {}
 
 
+def test_validate_account_lists_missing_params(verification_client):
+    with pytest.raises(ValidationError) as excinfo:
+        verification_client.validate_account(
+            "Ann Lee", "", "personal", "632005", "ZA", document_type=None
+        )
+
+    assert excinfo.value.message == (
+        "Missing required parameters: account_number, document_type"
+    )
+
+
+def test_validate_account_rejects_unknown_account_type(verification_client):
+    with pytest.raises(ValidationError, match="account_type must be") as excinfo:
+        verification_client.validate_account(
+            "Ann Lee", "0123456789", "savings", "632005", "ZA", "identityNumber"
+        )
+    assert "account_type" in excinfo.value.field_errors
+
+
 @responses.activate
 def test_resolve_card_bin(verification_client):
     card_bin = "123456"
@@ -97,3 +118,22 @@ def test_resolve_card_bin(verification_client):
     assert data["bin"] == card_bin
     assert data["brand"] == "Visa"
     assert meta == {}
+
+
+def test_async_resolve_card_bin(async_api):
+    async_api.mocked.get(
+        f"{async_api.base_url}/decision/bin/539983",
+        payload={
+            "status": True,
+            "message": "Bin resolved",
+            "data": {"bin": "539983", "brand": "Mastercard"},
+        },
+    )
+
+    data, meta = async_api.run(
+        AsyncVerificationAPI,
+        lambda verification: verification.resolve_card_bin("539983"),
+    )
+
+    assert data["brand"] == "Mastercard"
+    assert meta == {}
@@ -182,6 +182,31 @@ class TestCreateErrorFromResponse:
         assert error.message == "Too many requests"
         assert error.retry_after is None
 
+    def test_429_rate_limit_error_from_parsed_body_and_headers(self):
+        response_data = {"status": False, "message": "Too many requests"}
+        error = create_error_from_response(
+            response_data, 429, headers={"Retry-After": "30"}
+        )
+        assert isinstance(error, RateLimitError)
+        assert error.message == "Too many requests"
+        assert error.response == response_data
+        assert error.retry_after == 30
+
+    def test_error_from_raw_response_content(self):
+        mock_response = Mock()
+        mock_response.content = b'{"status": false, "message": "Customer not found"}'
+        error = create_error_from_response(mock_response, 404)
+        assert isinstance(error, NotFoundError)
+        assert error.message == "Customer not found"
+        mock_response.json.assert_not_called()
+
+    def test_error_from_invalid_raw_response_content(self):
+        mock_response = Mock()
+        mock_response.content = b"<html>Bad gateway</html>"
+        error = create_error_from_response(mock_response, 502)
+        assert isinstance(error, ServerError)
+        assert error.message == "HTTP 502 error"
+
     def test_500_server_error(self):
         response_data = {"status": False, "message": "Internal server error"}
         error = create_error_from_response(response_data, 500)
@@ -0,0 +1,200 @@
+import asyncio
+
+import httpx
+import pytest
+
+from paystack import APIError, NetworkError, ServerError
+from paystack.async_core import AsyncBaseClient
+from paystack.core import BaseClient
+from paystack.httpx_core import AsyncHttpxSession, HttpxSession
+
+
+def make_client(secret_key, handler):
+    client = BaseClient(secret_key=secret_key, http_backend="httpx", pool_size=7)
+    client.session._client = httpx.Client(transport=httpx.MockTransport(handler))
+    client.invalidate()
+    return client
+
+
+def test_httpx_backend_builds_httpx_session(secret_key):
+    client = BaseClient(secret_key=secret_key, http_backend="httpx")
+    assert isinstance(client.session, HttpxSession)
+    assert client.session.headers["Authorization"] == f"Bearer {secret_key}"
+
+
+def test_httpx_backend_selected_from_environment(secret_key, monkeypatch):
+    monkeypatch.setenv("PAYSTACK_HTTP_BACKEND", "httpx")
+    assert isinstance(BaseClient(secret_key=secret_key).session, HttpxSession)
+
+
+def test_unknown_http_backend_is_rejected(secret_key):
+    with pytest.raises(ValueError, match="Unknown HTTP backend"):
+        BaseClient(secret_key=secret_key, http_backend="curl")
+
+
+def test_httpx_request_sends_session_and_call_headers(secret_key):
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(
+            200, json={"status": True, "message": "ok", "data": {"x": 1}}
+        )
+
+    client = make_client(secret_key, handler)
+    data, meta = client.request(
+        "POST", "test", json_data={"a": 1}, idempotency_key="idem-1"
+    )
+    client.request("GET", "test", params={"use_cursor": True, "page": None})
+    client.request("GET", "test", private=False)
+
+    assert data == {"x": 1}
+    assert meta == {}
+    assert sent[0].headers["Authorization"] == f"Bearer {secret_key}"
+    assert sent[0].headers["Idempotency-Key"] == "idem-1"
+    assert sent[0].content == b'{"a":1}'
+    assert str(sent[1].url).endswith("/test?use_cursor=true")
+    assert "Authorization" not in sent[2].headers
+
+
+def test_httpx_request_maps_api_errors(secret_key):
+    def handler(request):
+        return httpx.Response(200, json={"status": False, "message": "Nope"})
+
+    with pytest.raises(APIError, match="Nope"):
+        make_client(secret_key, handler).request("GET", "test")
+
+
+@pytest.mark.parametrize(
+    "error, message",
+    [
+        (httpx.ConnectTimeout("slow"), "Connection timed out"),
+        (httpx.ReadTimeout("slow"), "Request timed out after 10 seconds"),
+        (httpx.ConnectError("refused"), "Connection error"),
+    ],
+)
+def test_httpx_request_maps_network_errors(secret_key, error, message):
+    def handler(request):
+        raise error
+
+    with pytest.raises(NetworkError, match=message):
+        make_client(secret_key, handler).request("GET", "test")
+
+
+def test_httpx_request_retries_retryable_statuses(secret_key, monkeypatch):
+    monkeypatch.setattr("paystack.httpx_core._retry_delay", lambda *args: 0)
+    sent = []
+
+    def handler(request):
+        sent.append(request.method)
+        if len(sent) in (1, 3):
+            return httpx.Response(503 if request.method == "GET" else 429)
+        return httpx.Response(200, json={"status": True, "message": "ok", "data": {}})
+
+    client = make_client(secret_key, handler)
+    assert client.request("GET", "test").data == {}
+    assert client.request("POST", "test", json_data={"a": 1}).data == {}
+    assert sent == ["GET", "GET", "POST", "POST"]
+
+
+def test_httpx_request_does_not_retry_post_on_server_error(secret_key, monkeypatch):
+    monkeypatch.setattr("paystack.httpx_core._retry_delay", lambda *args: 0)
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(503, json={"status": False, "message": "Down"})
+
+    with pytest.raises(ServerError):
+        make_client(secret_key, handler).request("POST", "charge", json_data={})
+    assert len(sent) == 1
+
+
+def test_httpx_session_takes_status_retries_from_max_retries(secret_key):
+    client = BaseClient(secret_key=secret_key, http_backend="httpx", max_retries=1)
+    assert client.session.status_retries == 1
+
+
+def test_httpx_request_stream_yields_items(secret_key):
+    def handler(request):
+        return httpx.Response(
+            200,
+            json={"status": True, "message": "ok", "data": [{"id": 1}, {"id": 2}]},
+        )
+
+    client = make_client(secret_key, handler)
+    assert list(client.request_stream("customer")) == [{"id": 1}, {"id": 2}]
+
+
+def run_async(secret_key, handler, call):
+    async def main():
+        session = AsyncHttpxSession()
+        session._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncBaseClient(secret_key, session=session) as client:
+            return await call(client)
+
+    return asyncio.run(main())
+
+
+def test_async_httpx_backend_builds_httpx_session(secret_key):
+    async def main():
+        async with AsyncBaseClient(secret_key, http_backend="httpx") as client:
+            return client._get_session()
+
+    assert isinstance(asyncio.run(main()), AsyncHttpxSession)
+
+
+def test_async_unknown_http_backend_is_rejected(secret_key):
+    with pytest.raises(ValueError, match="Unknown HTTP backend"):
+        AsyncBaseClient(secret_key, http_backend="curl")
+
+
+def test_async_httpx_request_sends_headers_and_body(secret_key):
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(
+            200, json={"status": True, "message": "ok", "data": {"x": 1}}
+        )
+
+    async def call(client):
+        result = await client.request("POST", "test", json_data={"a": 1})
+        await client.request("GET", "test", params={"use_cursor": True})
+        return result
+
+    data, meta = run_async(secret_key, handler, call)
+
+    assert data == {"x": 1}
+    assert meta == {}
+    assert sent[0].headers["Authorization"] == f"Bearer {secret_key}"
+    assert sent[0].content == b'{"a":1}'
+    assert str(sent[1].url).endswith("/test?use_cursor=true")
+
+
+@pytest.mark.parametrize(
+    "error, message",
+    [
+        (httpx.ReadTimeout("slow"), "Request timed out after 10 seconds"),
+        (httpx.ConnectError("refused"), "Connection error"),
+    ],
+)
+def test_async_httpx_request_maps_network_errors(secret_key, error, message):
+    def handler(request):
+        raise error
+
+    with pytest.raises(NetworkError, match=message):
+        run_async(secret_key, handler, lambda client: client.request("GET", "test"))
+
+
+def test_async_httpx_request_stream_yields_items(secret_key):
+    def handler(request):
+        return httpx.Response(
+            200,
+            json={"status": True, "message": "ok", "data": [{"id": 1}, {"id": 2}]},
+        )
+
+    async def call(client):
+        return [item async for item in client.request_stream("customer")]
+
+    assert run_async(secret_key, handler, call) == [{"id": 1}, {"id": 2}]
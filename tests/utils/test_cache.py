@@ -0,0 +1,49 @@
+from paystack.utils.cache import TTLCache
+
+
+def test_ttl_cache_returns_stored_value():
+    cache = TTLCache()
+    cache.set(("customer/CUS_1", (), True), "value", ttl=60)
+    assert cache.get(("customer/CUS_1", (), True)) == "value"
+
+
+def test_ttl_cache_expires_entries(mocker):
+    clock = mocker.patch("paystack.utils.cache.time.monotonic", return_value=100.0)
+    cache = TTLCache()
+    cache.set(("plan", (), True), "value", ttl=5)
+
+    clock.return_value = 104.9
+    assert cache.get(("plan", (), True)) == "value"
+    clock.return_value = 105.0
+    assert cache.get(("plan", (), True)) is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache.set(("a", (), True), 1, ttl=60)
+    cache.set(("b", (), True), 2, ttl=60)
+    cache.get(("a", (), True))
+    cache.set(("c", (), True), 3, ttl=60)
+
+    assert cache.get(("a", (), True)) == 1
+    assert cache.get(("b", (), True)) is None
+    assert cache.get(("c", (), True)) == 3
+
+
+def test_ttl_cache_invalidates_resource_and_children():
+    cache = TTLCache()
+    cache.set(("customer", (), True), 1, ttl=60)
+    cache.set(("customer/CUS_1", (), True), 2, ttl=60)
+    cache.set(("customers-extra", (), True), 3, ttl=60)
+    cache.set(("plan/PLN_1", (), True), 4, ttl=60)
+
+    cache.invalidate("customer")
+
+    assert cache.get(("customer", (), True)) is None
+    assert cache.get(("customer/CUS_1", (), True)) is None
+    assert cache.get(("customers-extra", (), True)) == 3
+    assert cache.get(("plan/PLN_1", (), True)) == 4
+
+    cache.invalidate()
+    assert len(cache) == 0
@@ -14,6 +14,11 @@ def test_validate_email_invalid_format():
         validate_email("invalid-email")
 
 
+def test_validate_email_rejects_trailing_newline():
+    with pytest.raises(ValidationError, match="Invalid email format"):
+        validate_email("test@example.com\n")
+
+
 def test_validate_email_empty():
     with pytest.raises(ValidationError, match="Email is required"):
         validate_email("")
@@ -32,3 +37,50 @@ def test_validate_email_not_string():
 def test_validate_email_too_long():
     with pytest.raises(ValidationError, match="Email is required"):
         validate_email("a" * 255 + "@example.com")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_round_trip(monkeypatch, use_orjson):
+    from paystack.utils import helpers
+
+    if not use_orjson:
+        monkeypatch.setattr(helpers, "orjson", None)
+
+    encoded = helpers.json_dumps({"amount": 5000, "metadata": {"cart": [1, 2]}})
+
+    assert isinstance(encoded, bytes)
+    assert helpers.json_loads(encoded) == {"amount": 5000, "metadata": {"cart": [1, 2]}}
+
+
+def test_json_dumps_fallback_matches_orjson_bytes(monkeypatch):
+    from paystack.utils import helpers
+
+    payload = {"customer_ids": [1, 2, 3], "metadata": {"name": "Adéọlá"}}
+    fast = helpers.json_dumps(payload)
+    monkeypatch.setattr(helpers, "orjson", None)
+
+    assert helpers.json_dumps(payload) == fast
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_loads_invalid_raises_value_error(monkeypatch, use_orjson):
+    from paystack.utils import helpers
+
+    if not use_orjson:
+        monkeypatch.setattr(helpers, "orjson", None)
+
+    with pytest.raises(ValueError):
+        helpers.json_loads(b"<html>")
+
+
+def test_email_format_check_is_memoized():
+    from paystack.utils.helpers import is_valid_email_format
+
+    is_valid_email_format.cache_clear()
+    validate_email("repeat@example.com")
+    validate_email("repeat@example.com")
+    with pytest.raises(ValidationError):
+        validate_email("not-an-email")
+    info = is_valid_email_format.cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
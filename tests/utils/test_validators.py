@@ -33,6 +33,11 @@ def test_validate_amount_and_email_non_numeric_amount():
         match="Amount must be a valid number string without comma or decimal",
     ):
         _validate_amount_and_email(email="test@example.com", amount="10,000")
+    with pytest.raises(
+        ValidationError,
+        match="Amount must be a valid number string without comma or decimal",
+    ):
+        _validate_amount_and_email(email="test@example.com", amount="\u00b2")
 
 
 def test_validate_amount_and_email_zero_or_negative_amount():
@@ -40,6 +45,10 @@ def test_validate_amount_and_email_zero_or_negative_amount():
         _validate_amount_and_email(email="test@example.com", amount=0)
     with pytest.raises(ValidationError, match="Amount must be a positive number"):
         _validate_amount_and_email(email="test@example.com", amount=-100)
+    with pytest.raises(ValidationError, match="Amount must be a positive number"):
+        _validate_amount_and_email(email="test@example.com", amount="-100")
+    with pytest.raises(ValidationError, match="Amount must be a positive number"):
+        _validate_amount_and_email(email="test@example.com", amount="000")
 
 
 def test_validate_amount_and_email_valid():
@@ -60,3 +69,23 @@ def test_validate_charge_authorization_valid():
     _validate_charge_authorization(
         email="test@example.com", amount=10000, authorization_code="AUTH_testcode"
     )
+
+
+def test_validators_are_loaded_lazily_by_utils_package():
+    import subprocess
+    import sys
+    import textwrap
+
+    code = textwrap.dedent("""
+        import sys
+        import paystack.utils as utils
+
+        assert "paystack.utils.validators" not in sys.modules
+        from paystack.utils.validators import _validate_amount_and_email
+
+        assert utils._validate_amount_and_email is _validate_amount_and_email
+        """)
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr